@@ -0,0 +1,61 @@
+"""
+Benchmark of relocating a subcircuit with batch_transform, against transforming each element in turn and against transforming a VGroup.
+The per-element variant updates the wires after every element, as a scene running its updaters between element transforms would.
+A rotation changes which axes of the square wires follow which terminal, so those wires are rewritten whatever the variant.
+Run from the repository root with: python -m benchmarks.bench_batch_transform
+"""
+
+import time
+import numpy as np
+from manim import VGroup
+from manim.constants import PI, LEFT
+from manim_hkn.cElements import Resistor, Wire
+from manim_hkn.utils.netlist import Circuit
+from manim_hkn.utils.batchTransform import batch_transform
+
+ELEMENT_COUNTS:tuple[int, ...] = (20, 200)
+ABOUT_POINT:np.ndarray = np.array([1., 2., 0.])
+
+# A chain of resistors joined by square wires, owned by a Circuit
+def _build(count:int) -> Circuit:
+	resistors:list[Resistor] = [Resistor().shift([6 * index, 3 * (index % 2), 0]) for index in range(count)]
+	circuit = Circuit(*resistors)
+	for left, right in zip(resistors, resistors[1:]):
+		circuit.connect_with_square_wire(left, 'right', right, 'left')
+	circuit.resolve()
+	return circuit
+
+# Relocations applied to an element, a VGroup or a batch, which all chain the same transform methods
+def _scale_shift(target) -> None:
+	target.scale(0.4, about_point=ABOUT_POINT).shift(LEFT * 2)
+
+def _scale_shift_rotate(target) -> None:
+	target.scale(0.4, about_point=ABOUT_POINT).shift(LEFT * 2).rotate(PI / 2, about_point=ABOUT_POINT)
+
+def _per_element(circuit:Circuit, relocate) -> None:
+	for element in circuit.elements:
+		relocate(element)
+		circuit.update(0)
+
+def _group(circuit:Circuit, relocate) -> None:
+	relocate(VGroup(*circuit.elements, *circuit.wires))
+	circuit.update(0)
+
+def _batch(circuit:Circuit, relocate) -> None:
+	with batch_transform(circuit) as batch:
+		relocate(batch)
+
+def main() -> None:
+	print(f'{"elements":>9} {"transform":>19} {"variant":>12} {"time (ms)":>10} {"wire regenerations":>19}')
+	for count in ELEMENT_COUNTS:
+		for transform_name, relocate in (('scale+shift', _scale_shift), ('scale+shift+rotate', _scale_shift_rotate)):
+			for name, variant in (('per element', _per_element), ('VGroup', _group), ('batch', _batch)):
+				circuit:Circuit = _build(count)
+				Wire.regeneration_counter.reset()
+				start:float = time.perf_counter()
+				variant(circuit, relocate)
+				elapsed:float = time.perf_counter() - start
+				print(f'{count:>9} {transform_name:>19} {name:>12} {1000 * elapsed:>10.2f} {Wire.regeneration_counter.total:>19}')
+
+if __name__ == '__main__':
+	main()
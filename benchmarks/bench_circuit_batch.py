@@ -0,0 +1,96 @@
+"""
+Benchmark of CircuitBatch against a Circuit of individual circuit elements, on schematics of resistors and capacitors in rows joined by
+straight wires. Memory is the size of the Python heap (tracemalloc) kept alive by the schematic alone, once built; the batch is measured
+both copied from a Circuit (after the Circuit is released) and built from add_geometry without any circuit element, which leaves out the
+wires. Per frame, the camera extracts the family of every mobject to draw and reads its points and style, then rasterizes it: both are
+timed, along with a shift of the whole schematic.
+Run from the repository root with: python -m benchmarks.bench_circuit_batch
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Callable
+import numpy as np
+from manim import Camera, Mobject
+from manim.utils.family import extract_mobject_family_members
+from manim_hkn.cElements import Resistor, Capacitor
+from manim_hkn.circuitBatch import CircuitBatch
+from manim_hkn.utils.netlist import Circuit
+
+ELEMENT_COUNTS:tuple[int, ...] = (200, 2000)
+ROW_LENGTH:int = 40
+REPEATS:int = 5
+
+def _position(index:int) -> list[float]:
+	return [7 * (index % ROW_LENGTH), -4 * (index // ROW_LENGTH), 0]
+
+# Alternating resistors and capacitors, each row joined by straight wires
+def schematic(count:int) -> Circuit:
+	elements:list = [(Resistor if index % 2 == 0 else Capacitor)().shift(_position(index)) for index in range(count)]
+	circuit = Circuit(*elements)
+	for index in range(count - 1):
+		if (index + 1) % ROW_LENGTH:
+			circuit.connect_with_straight_wire(elements[index], 'right', elements[index + 1], 'left')
+	circuit.resolve()
+	return circuit
+
+# The same schematic, drawn from the element geometries without building any circuit element
+def batch_schematic(count:int) -> CircuitBatch:
+	batch = CircuitBatch()
+	for index in range(count):
+		batch.add_geometry('Resistor' if index % 2 == 0 else 'Capacitor', position=_position(index))
+	batch.get_family()
+	return batch
+
+# Bytes of Python heap kept alive by the object returned by build, and the object
+def _retained(build:Callable[[], object]) -> tuple[int, object]:
+	gc.collect()
+	tracemalloc.start()
+	result = build()
+	gc.collect()
+	size:int = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	return size, result
+
+def _time(function:Callable[[], object]) -> float:
+	start:float = time.perf_counter()
+	for _ in range(REPEATS):
+		function()
+	return (time.perf_counter() - start) / REPEATS
+
+# Family extraction and the per-mobject reads of the Cairo camera, without rasterizing
+def _traverse(mobject:Mobject) -> None:
+	for member in extract_mobject_family_members([mobject], only_those_with_points=True):
+		member.points, member.get_stroke_rgbas(), member.get_fill_rgbas(), member.get_stroke_width()
+
+def main() -> None:
+	camera = Camera()
+	print(f'{"elements":>9} {"representation":>25} {"memory (MB)":>12} {"bytes/element":>14} {"drawn mobjects":>15} {"traverse (ms)":>14} {"capture (ms)":>13} {"shift (ms)":>11}')
+	for count in ELEMENT_COUNTS:
+		circuit_size, circuit = _retained(lambda: schematic(count))
+		# The batch copied from the circuit, measured alone once the circuit is released
+		def from_circuit() -> CircuitBatch:
+			source:Circuit = schematic(count)
+			tracemalloc.stop()
+			tracemalloc.start()
+			batch = CircuitBatch(source)
+			batch.get_family()
+			del source
+			return batch
+		copied_size, copied = _retained(from_circuit)
+		geometry_size, built = _retained(lambda: batch_schematic(count))
+		assert np.allclose(built[0].get_points(), copied[0].get_points())
+
+		for name, mobject, size in (('Circuit', circuit, circuit_size), ('CircuitBatch(circuit)', copied, copied_size), ('CircuitBatch.add_geometry', built, geometry_size)):
+			drawn:int = len(extract_mobject_family_members([mobject], only_those_with_points=True))
+			traverse:float = _time(lambda: _traverse(mobject))
+			def capture() -> None:
+				camera.reset()
+				camera.capture_mobject(mobject)
+			captured:float = _time(capture)
+			shifted:float = _time(lambda: mobject.shift([0.01, 0, 0]))
+			print(f'{count:>9} {name:>25} {size / 2 ** 20:>12.2f} {size / count:>14.0f} {drawn:>15} {1000 * traverse:>14.2f} {1000 * captured:>13.1f} {1000 * shifted:>11.2f}')
+
+if __name__ == '__main__':
+	main()
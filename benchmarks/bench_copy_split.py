@@ -0,0 +1,121 @@
+"""
+Benchmark of copying circuit elements and splitting wires. Copies share the points and geometry tables of the element copy-on-write; the
+previous path, a full deep copy (Mobject.__deepcopy__), is timed next to it, alone and in a copy-heavy animation loop where every frame
+copies the element (as Transform and .animate do) and shifts the copy, which detaches it. Memory is the heap kept alive per copy.
+split_wire generates each piece once from its endpoints, on a copy sharing the wire's geometry, instead of deep-copying the wire twice and
+moving the terminals of both copies one at a time: the previous path is reproduced here and its halves checked against the new ones. Bus
+taps are timed as one N-way split against N successive 2-way splits of the remaining wire.
+Run from the repository root with: python -m benchmarks.bench_copy_split
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Callable
+import numpy as np
+from manim import VMobject
+from manim_hkn import geometry
+from manim_hkn.cElements import Resistor, OpAmp, Wire
+from manim_hkn.utils.circuitBuilder import split_wire
+from manim_hkn.utils.generators import rc_ladder
+
+REPEATS:int = 200
+ANIMATION_FRAMES:int = 60
+TAP_COUNTS:tuple[int, ...] = (4, 16, 64)
+
+def _time(function:Callable[[], object], repeats:int = REPEATS) -> float:
+	start:float = time.perf_counter()
+	for _ in range(repeats):
+		function()
+	return (time.perf_counter() - start) / repeats
+
+# The split_wire of the previous release: two deep copies, each reshaped by moving its terminals
+def deep_copy_split(wire:Wire, split_point:float = 0.5) -> tuple[Wire, Wire]:
+	lWire:Wire = VMobject.__deepcopy__(wire, {})
+	rWire:Wire = VMobject.__deepcopy__(wire, {})
+	lWire._terminal_bindings['left'] = wire._terminal_bindings['left']
+	lWire._terminal_bindings['right'] = [None, None, None]
+	rWire._terminal_bindings['left'] = [None, None, None]
+	rWire._terminal_bindings['right'] = wire._terminal_bindings['right']
+	lCoord = wire.get_terminal_coord('left')
+	rCoord = wire.get_terminal_coord('right')
+	vertices = wire._path_vertices(np.array([lCoord, rCoord]))
+	splitCoord, before, after = geometry.split_polyline(vertices, split_point)
+	if wire._waypoints is not None:
+		lWire._waypoints = vertices[1:before + 1] if before > 0 else None
+		rWire._waypoints = vertices[after:-1] if after < len(vertices) - 1 else None
+	lWire.set_terminal_coordinate('left', lCoord)
+	lWire.set_terminal_coordinate('right', splitCoord)
+	rWire.set_terminal_coordinate('left', lWire.get_terminal_coord('right'))
+	rWire.set_terminal_coordinate('right', rCoord)
+	return lWire, rWire
+
+def bus(waypoints:list[list[float]] | None) -> Wire:
+	wire = Wire(waypoints)
+	wire.set_terminal_coordinate('left', [-6, 0, 0])
+	wire.set_terminal_coordinate('right', [6, 3, 0])
+	return wire
+
+# Bytes of Python heap kept alive by each of count copies of the element
+def _copy_size(element:VMobject, copy:Callable[[VMobject], VMobject], count:int = 50) -> float:
+	gc.collect()
+	tracemalloc.start()
+	copies:list[VMobject] = [copy(element) for _ in range(count)]
+	gc.collect()
+	size:int = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del copies
+	return size / count
+
+# Every frame copies the element and moves the copy, as an animation of the element would
+def _animate(element:VMobject, copy:Callable[[VMobject], VMobject]) -> None:
+	for frame in range(ANIMATION_FRAMES):
+		copy(element).shift([frame / ANIMATION_FRAMES, 0, 0])
+
+def main() -> None:
+	elements:list[tuple[str, VMobject]] = [('Resistor', Resistor()), ('OpAmp', OpAmp()), ('rc_ladder(50)', rc_ladder(50))]
+	print(f'{"element":>14} {"points":>7} {"deep copy (us)":>15} {"copy (us)":>10} {"speedup":>8} {"deep copy (kB)":>15} {"copy (kB)":>10} {"animation deep (ms)":>20} {"animation copy (ms)":>20}')
+	for name, element in elements:
+		deep:float = _time(lambda: VMobject.__deepcopy__(element, {}))
+		shared:float = _time(element.copy)
+		deep_size:float = _copy_size(element, lambda mobject: VMobject.__deepcopy__(mobject, {}))
+		shared_size:float = _copy_size(element, lambda mobject: mobject.copy())
+		animated_deep:float = _time(lambda: _animate(element, lambda mobject: VMobject.__deepcopy__(mobject, {})), 5)
+		animated_shared:float = _time(lambda: _animate(element, lambda mobject: mobject.copy()), 5)
+		print(f'{name:>14} {len(element.points):>7} {1e6 * deep:>15.1f} {1e6 * shared:>10.1f} {deep / shared:>8.1f} {deep_size / 1024:>15.1f} {shared_size / 1024:>10.1f} {1000 * animated_deep:>20.2f} {1000 * animated_shared:>20.2f}')
+
+	print()
+	print(f'{"wire":>14} {"deep copy split (us)":>21} {"split_wire (us)":>16} {"speedup":>8}')
+	for name, waypoints in (('straight', None), ('3 waypoints', [[-6, 2, 0], [0, 2, 0], [0, 3, 0]])):
+		wire:Wire = bus(waypoints)
+		for old, new in zip(deep_copy_split(wire, 0.3), split_wire(wire, 0.3)):
+			assert np.allclose(old.points, new.points)
+		old_split:float = _time(lambda: deep_copy_split(wire, 0.3))
+		new_split:float = _time(lambda: split_wire(wire, 0.3))
+		print(f'{name:>14} {1e6 * old_split:>21.1f} {1e6 * new_split:>16.1f} {old_split / new_split:>8.1f}')
+
+	print()
+	print(f'{"taps":>5} {"2-way splits (ms)":>18} {"N-way split (ms)":>17} {"speedup":>8}')
+	for taps in TAP_COUNTS:
+		fractions:np.ndarray = np.arange(1, taps + 1) / (taps + 1)
+		wire = bus([[-6, 2, 0], [0, 2, 0], [0, 3, 0]])
+		# Each 2-way split cuts the remaining wire at the next tap, as a fraction of what remains
+		def successive() -> list[Wire]:
+			pieces:list[Wire] = []
+			remaining:Wire = wire
+			cut:float = 0.
+			for fraction in fractions:
+				piece, remaining = split_wire(remaining, (fraction - cut) / (1 - cut))
+				pieces.append(piece)
+				cut = fraction
+			return pieces + [remaining]
+		successive_pieces:list[Wire] = successive()
+		one_call:tuple[Wire, ...] = split_wire(wire, fractions)
+		for old, new in zip(successive_pieces, one_call):
+			assert all(np.allclose(old.get_terminal_coord(key), new.get_terminal_coord(key)) for key in ('left', 'right'))
+		successive_time:float = _time(successive, 10)
+		one_call_time:float = _time(lambda: split_wire(wire, fractions), 10)
+		print(f'{taps:>5} {1000 * successive_time:>18.2f} {1000 * one_call_time:>17.2f} {successive_time / one_call_time:>8.1f}')
+
+if __name__ == '__main__':
+	main()
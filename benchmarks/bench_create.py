@@ -0,0 +1,74 @@
+"""
+Benchmark of the arc-length Create animations against the former ShowPartial based Create of circuit elements.
+Times the interpolation of whole animations per element class and for a large circuit, and measures the memory allocated per frame.
+Run from the repository root with: python -m benchmarks.bench_create
+"""
+
+import time
+import tracemalloc
+from typing import Callable
+import numpy as np
+from manim import VGroup
+from manim.animation.animation import Animation
+from manim.animation.creation import ShowPartial
+from manim_hkn.cElements import Resistor, Capacitor, Inductor, BJT_NPN, OpAmp, Battery, Ground
+from manim_hkn.animations import CreateElement, CreateCircuit
+from manim_hkn.utils.generators import rc_ladder
+from manim_hkn.utils.netlist import Circuit
+from manim_hkn.utils.circuitBuilder import connect_with_straight_wire
+
+ELEMENT_CLASSES:tuple[type, ...] = (Resistor, Capacitor, Inductor, BJT_NPN, OpAmp, Battery, Ground)
+CIRCUIT_SIZES:tuple[int, ...] = (10, 100, 500)
+# Number of interpolated frames of a one second animation at 30 fps
+FRAMES:int = 30
+
+# The former Create override: a new ShowPartial subclass per call, drawing every submobject over the whole runtime
+def _show_partial_create(mobject) -> Animation:
+	return type('_Create_No_Lag', (ShowPartial,), {'_get_bounds': lambda self, alpha: (0, alpha)})(mobject, lag_ratio=0, introducer=True)
+
+# Seconds taken to begin, interpolate every frame and finish one animation, and bytes allocated by its frames
+def _run(animation:Animation) -> tuple[float, float]:
+	alphas:np.ndarray = np.linspace(0, 1, FRAMES)
+	start:float = time.perf_counter()
+	animation.begin()
+	for alpha in alphas:
+		animation.interpolate(alpha)
+	animation.finish()
+	elapsed:float = time.perf_counter() - start
+
+	animation.begin()
+	tracemalloc.start()
+	try:
+		for alpha in alphas:
+			animation.interpolate(alpha)
+		_, peak = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+	animation.finish()
+	return elapsed, peak / FRAMES
+
+def _best(build:Callable[[], Animation], repeat:int = 5) -> tuple[float, float]:
+	runs:list[tuple[float, float]] = [_run(build()) for _ in range(repeat)]
+	return min(run[0] for run in runs), min(run[1] for run in runs)
+
+# A chain of resistors joined by straight wires
+def _resistor_chain(count:int) -> Circuit:
+	resistors:list[Resistor] = [Resistor().shift([6 * index, 0, 0]) for index in range(count)]
+	wires:list = [connect_with_straight_wire(left, 'right', right, 'left') for left, right in zip(resistors, resistors[1:])]
+	return Circuit(*resistors, *wires)
+
+def main() -> None:
+	print(f'{"mobject":>22} {"variant":>12} {"animation (ms)":>15} {"frame peak (KB)":>16}')
+	for element_class in ELEMENT_CLASSES:
+		element = element_class()
+		for name, build in (('ShowPartial', lambda: _show_partial_create(element)), ('CreateElement', lambda: CreateElement(element))):
+			elapsed, allocated = _best(build)
+			print(f'{element_class.__name__:>22} {name:>12} {1000 * elapsed:>15.3f} {allocated / 1024:>16.2f}')
+	for size in CIRCUIT_SIZES:
+		for label, circuit in ((f'chain[{size}]', _resistor_chain(size)), (f'rc_ladder[{size}]', VGroup(rc_ladder(size)))):
+			for name, build in (('ShowPartial', lambda: _show_partial_create(circuit)), ('CreateCircuit', lambda: CreateCircuit(circuit))):
+				elapsed, allocated = _best(build, repeat=2)
+				print(f'{label:>22} {name:>12} {1000 * elapsed:>15.3f} {allocated / 1024:>16.2f}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,78 @@
+"""
+Benchmark of CurrentFlow on a chain of resistors joined by square wires, against the 60 fps frame budget of 16.7 ms.
+For each particle count, times the per-frame update of every particle position, and the capture of the particles by the Cairo camera at
+low quality, at the default stroke width and at twice it. The baseline moves one Dot per particle along its wire with a point_from_proportion updater, for the smaller counts only.
+Run from the repository root with: python -m benchmarks.bench_current_flow
+"""
+
+import time
+from manim import Dot, Group, config
+from manim.camera.camera import Camera
+from manim_hkn.cElements import Resistor
+from manim_hkn.currentFlow import CurrentFlow
+from manim_hkn.utils.netlist import Circuit
+
+PARTICLE_COUNTS:tuple[int, ...] = (1000, 5000, 20000)
+BASELINE_COUNTS:tuple[int, ...] = (1000,)
+ELEMENT_COUNT:int = 12
+FRAMES:int = 60
+FRAME_BUDGET:float = 1000 / 60
+STROKE_WIDTH:float = 4
+
+def _schematic() -> tuple[Circuit, list[Resistor]]:
+	resistors:list[Resistor] = [Resistor().shift([6 * index, 3 * (index % 2), 0]) for index in range(ELEMENT_COUNT)]
+	circuit = Circuit(*resistors)
+	for left, right in zip(resistors, resistors[1:]):
+		circuit.connect_with_square_wire(left, 'right', right, 'left')
+	circuit.resolve()
+	circuit.scale_to_fit_width(12).center()
+	return circuit, resistors
+
+# Milliseconds per frame of the updates of the mobject
+def _update_time(mobject, frames:int) -> float:
+	start:float = time.perf_counter()
+	for _ in range(frames):
+		mobject.update(1 / 60)
+	return 1000 * (time.perf_counter() - start) / frames
+
+def _capture_time(camera:Camera, mobjects:list, frames:int) -> float:
+	start:float = time.perf_counter()
+	for _ in range(frames):
+		camera.reset()
+		camera.capture_mobjects(mobjects)
+	return 1000 * (time.perf_counter() - start) / frames
+
+# One Dot per particle, each following its wire through its own updater
+def _dot_baseline(wires:list, count:int):
+	dots:list[Dot] = []
+	for index in range(count):
+		wire = wires[index % len(wires)]
+		dot = Dot(radius=0.02)
+		dot.phase = (index // len(wires) + 0.5) * len(wires) / count
+		def follow(dot:Dot, dt:float, wire=wire) -> None:
+			dot.phase = (dot.phase + dt) % 1
+			dot.move_to(wire.point_from_proportion(dot.phase))
+		dot.add_updater(follow)
+		dots.append(dot)
+	return Group(*dots)
+
+def main() -> None:
+	config.quality = 'low_quality'
+	config.verbosity = 'WARNING'
+	circuit, resistors = _schematic()
+	wires:list = list(circuit.wires)
+	camera = Camera()
+	print(f'{"particles":>10} {"stroke":>7} {"mobject":>12} {"update (ms)":>12} {"capture (ms)":>13} {"frame (ms)":>11} {"60 fps":>7}')
+	for count in PARTICLE_COUNTS:
+		for stroke_width in (STROKE_WIDTH, 2 * STROKE_WIDTH):
+			flow = CurrentFlow(*wires, *resistors, particle_count=count, stroke_width=stroke_width)
+			update:float = _update_time(flow, FRAMES)
+			capture:float = _capture_time(camera, [flow], FRAMES)
+			print(f'{count:>10} {stroke_width:>7} {"CurrentFlow":>12} {update:>12.2f} {capture:>13.2f} {update + capture:>11.2f} {str(update + capture <= FRAME_BUDGET):>7}')
+	for count in BASELINE_COUNTS:
+		dots = _dot_baseline(wires, count)
+		update = _update_time(dots, FRAMES // 10)
+		print(f'{count:>10} {"-":>7} {"Dots":>12} {update:>12.2f} {"-":>13} {"-":>11} {str(update <= FRAME_BUDGET):>7}')
+
+if __name__ == '__main__':
+	main()
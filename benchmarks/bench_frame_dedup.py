@@ -0,0 +1,70 @@
+"""
+Benchmark of frame deduplication on a circuit walkthrough: a chain of resistors held on screen through long waits, with a time-based
+scene updater (such as a clock or a regeneration counter) which keeps manim from freezing the waits, and a few short animations.
+The same scene is rendered as a plain Scene and as a CircuitScene, at low quality and without the partial movie cache.
+Run from the repository root with: python -m benchmarks.bench_frame_dedup
+"""
+
+import tempfile
+import time
+from manim import Scene, config
+from manim.constants import UP, DOWN
+from manim.utils.color import RED
+from manim_hkn.cElements import Resistor
+from manim_hkn.rendering import CircuitScene
+from manim_hkn.utils.netlist import Circuit
+
+ELEMENT_COUNTS:tuple[int, ...] = (20, 100)
+HOLD_TIME:float = 4.
+
+# Builds the same walkthrough for both scene classes
+def _walkthrough(scene:Scene, count:int) -> None:
+	resistors:list[Resistor] = [Resistor().shift([6 * index, 3 * (index % 2), 0]) for index in range(count)]
+	circuit = Circuit(*resistors)
+	for left, right in zip(resistors, resistors[1:]):
+		circuit.connect_with_square_wire(left, 'right', right, 'left')
+	circuit.resolve()
+	circuit.scale_to_fit_width(12).center()
+	scene.add(circuit)
+	# Stands for any time-based updater which does not change the drawing
+	scene.add_updater(lambda dt: None)
+	scene.wait(HOLD_TIME)
+	scene.play(resistors[count // 2].animate.shift(UP * 0.5), run_time=1)
+	scene.wait(HOLD_TIME)
+	scene.play(resistors[0].animate.set_color(RED), run_time=1)
+	scene.wait(HOLD_TIME)
+	scene.play(resistors[count // 2].animate.shift(DOWN * 0.5), run_time=1)
+	scene.wait(HOLD_TIME)
+
+def _scene_classes(count:int) -> tuple[type[Scene], type[CircuitScene]]:
+	class PlainWalkthrough(Scene):
+		def construct(self:"PlainWalkthrough") -> None:
+			_walkthrough(self, count)
+	class DeduplicatedWalkthrough(CircuitScene):
+		def construct(self:"DeduplicatedWalkthrough") -> None:
+			_walkthrough(self, count)
+	return PlainWalkthrough, DeduplicatedWalkthrough
+
+def main() -> None:
+	config.quality = 'low_quality'
+	config.disable_caching = True
+	config.progress_bar = 'none'
+	config.verbosity = 'WARNING'
+	print(f'{"elements":>9} {"scene":>13} {"time (s)":>9} {"rendered":>9} {"reused":>7} {"state (ms)":>11}')
+	with tempfile.TemporaryDirectory() as directory:
+		config.media_dir = directory
+		for count in ELEMENT_COUNTS:
+			plain_class, deduplicated_class = _scene_classes(count)
+			for name, scene_class in (('Scene', plain_class), ('CircuitScene', deduplicated_class)):
+				scene:Scene = scene_class()
+				start:float = time.perf_counter()
+				scene.render()
+				elapsed:float = time.perf_counter() - start
+				if isinstance(scene, CircuitScene):
+					info:dict = scene.frame_deduplicator.info()
+					print(f'{count:>9} {name:>13} {elapsed:>9.2f} {info["rendered_frames"]:>9} {info["reused_frames"]:>7} {1000 * info["state_time"]:>11.1f}')
+				else:
+					print(f'{count:>9} {name:>13} {elapsed:>9.2f} {"all":>9} {"-":>7} {"-":>11}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,49 @@
+"""
+Benchmark of the rc_ladder generator against the naive construction loop of separate elements and updater-driven wires.
+Times construction and one frame of updates, and counts the updaters left to run every frame.
+Run from the repository root with: python -m benchmarks.bench_generators
+"""
+
+import time
+from manim import VGroup
+from manim.constants import PI
+from manim_hkn.cElements import Resistor, Capacitor
+from manim_hkn.utils.circuitBuilder import connect_with_straight_wire
+from manim_hkn.utils.generators import rc_ladder
+
+STAGE_COUNTS:tuple[int, ...] = (10, 100, 1000)
+
+# Naive ladder: one Resistor, one Capacitor and two wires per stage, each wire following its terminals with its own updater
+def _naive_rc_ladder(stages:int) -> VGroup:
+	mobjects:list = []
+	previous:Resistor | None = None
+	for stage in range(stages):
+		resistor = Resistor().shift([6 * stage, 0, 0])
+		capacitor = Capacitor().rotate(PI / 2).shift([6 * stage + 3, -3, 0])
+		mobjects += [resistor, capacitor, connect_with_straight_wire(resistor, 'right', capacitor, 'right')]
+		if previous is not None:
+			mobjects.append(connect_with_straight_wire(previous, 'right', resistor, 'left'))
+		previous = resistor
+	return VGroup(*mobjects)
+
+def _count_updaters(mobject) -> int:
+	return sum(len(member.updaters) for member in mobject.get_family())
+
+def _measure(build, stages:int) -> tuple[float, float, int]:
+	start:float = time.perf_counter()
+	mobject = build(stages)
+	construction:float = time.perf_counter() - start
+	start = time.perf_counter()
+	mobject.update(0)
+	frame:float = time.perf_counter() - start
+	return construction, frame, _count_updaters(mobject)
+
+def main() -> None:
+	print(f'{"stages":>7} {"variant":>10} {"build (s)":>10} {"frame (ms)":>11} {"updaters":>9}')
+	for stages in STAGE_COUNTS:
+		for name, build in (('naive', _naive_rc_ladder), ('generator', rc_ladder)):
+			construction, frame, updaters = _measure(build, stages)
+			print(f'{stages:>7} {name:>10} {construction:>10.3f} {1000 * frame:>11.2f} {updaters:>9}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,91 @@
+"""
+Micro-benchmark of the batched _add_geom_ helpers against the previous per-segment implementation.
+Run from the repository root with: python -m benchmarks.bench_geometry
+"""
+
+import timeit
+import numpy as np
+from manim import VMobject
+from manim.constants import ORIGIN, PI, TAU, RIGHT, UP
+from manim_hkn.cElements import _CircuitElementTemplate, Inductor, FunctionGenerator, BJT_NPN, CurrentSource
+from manim_hkn.geometryCache import geometry_cache
+
+# Reference implementation of the helpers prior to vectorization: one add_cubic_bezier_curve call per arc segment, and a Python loop over the points of an elliptical arc
+def _legacy_add_geom_arc(vmob:"_Canvas", start_angle:float = 0, angle:float = PI / 2, center:list[float] = ORIGIN, radius:float = 1) -> None:
+	vmob._close_last_curve()
+	num_components:int = int(9 * abs(start_angle - angle) / TAU) + 1
+	d_theta:float = angle / (num_components - 1.0)
+	anchors = np.array(radius * np.array([
+		np.cos(a) * RIGHT + np.sin(a) * UP
+		for a in np.linspace(start_angle, start_angle + angle, num_components)
+	]))
+	tangent_vectors = np.zeros(anchors.shape)
+	tangent_vectors[:, 1] = anchors[:, 0]
+	tangent_vectors[:, 0] = -anchors[:, 1]
+	anchors = [anchor + center for anchor in anchors]
+	handles1 = anchors[:-1] + (d_theta / 3) * tangent_vectors[:-1]
+	handles2 = anchors[1:] - (d_theta / 3) * tangent_vectors[1:]
+	arrays = np.array([anchors[:-1], handles1, handles2, anchors[1:]])
+	for i in range(arrays.shape[1]):
+		vmob.add_cubic_bezier_curve(arrays[0][i], arrays[1][i], arrays[2][i], arrays[3][i])
+
+def _legacy_add_geom_elliptical_arc(vmob:"_Canvas", start_angle:float = 0, angle:float = PI / 2, center:list[float] = ORIGIN, width:float = 2, height:float = 1) -> None:
+	arc_start_index = len(vmob.points)
+	_legacy_add_geom_arc(vmob, start_angle, angle, ORIGIN, radius = 0.5)
+	for i in range(arc_start_index, len(vmob.points)):
+		vmob.points[i][0] *= width
+		vmob.points[i][1] *= height
+		vmob.points[i] += center
+
+# Bare VMobject borrowing the template geometry helpers, so that both implementations are timed without element construction overhead
+class _Canvas(VMobject):
+	_close_last_curve = _CircuitElementTemplate._close_last_curve
+	_add_geom_arc = _CircuitElementTemplate._add_geom_arc
+	_add_geom_elliptical_arc = _CircuitElementTemplate._add_geom_elliptical_arc
+
+def _batched_add_geom_arc(vmob:_Canvas, *args) -> None:
+	vmob._add_geom_arc(*args)
+
+def _batched_add_geom_elliptical_arc(vmob:_Canvas, *args) -> None:
+	vmob._add_geom_elliptical_arc(*args)
+
+# Calls used by the Inductor geometry: seven elliptical arcs
+_ELLIPTICAL_ARCS:list[tuple] = [(PI, -PI, RIGHT * (i - 0.5), 1.75, 2) for i in range(-1, 3)] + [(0, -PI, RIGHT * i, 1.2, 1.4) for i in range(-1, 2)]
+
+def _build(add_arc, add_elliptical_arc) -> _Canvas:
+	vmob = _Canvas()
+	add_arc(vmob, 0, TAU, ORIGIN, 2)
+	for args in _ELLIPTICAL_ARCS:
+		add_elliptical_arc(vmob, *args)
+	return vmob
+
+def _time(func, number:int) -> float:
+	return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+def main(number:int = 200) -> dict[str, dict[str, float]]:
+	legacy = _build(_legacy_add_geom_arc, _legacy_add_geom_elliptical_arc)
+	batched = _build(_batched_add_geom_arc, _batched_add_geom_elliptical_arc)
+	max_error:float = float(np.abs(legacy.points - batched.points).max())
+	if legacy.points.shape != batched.points.shape or max_error > 1e-12:
+		raise AssertionError(f'Batched geometry diverges from the legacy geometry, max error: {max_error}')
+
+	results:dict[str, dict[str, float]] = {}
+	legacy_time:float = _time(lambda: _build(_legacy_add_geom_arc, _legacy_add_geom_elliptical_arc), number)
+	batched_time:float = _time(lambda: _build(_batched_add_geom_arc, _batched_add_geom_elliptical_arc), number)
+	results['helpers'] = {'legacy_s': legacy_time, 'batched_s': batched_time, 'speedup': legacy_time / batched_time}
+
+	# Construction time of the arc-heavy elements, with the geometry cache disabled so that generate_points runs every time
+	cache_enabled:bool = geometry_cache.enabled
+	geometry_cache.enabled = False
+	try:
+		for cls in (Inductor, FunctionGenerator, BJT_NPN, CurrentSource):
+			results[cls.__name__] = {'construction_s': _time(cls, number // 4)}
+	finally:
+		geometry_cache.enabled = cache_enabled
+
+	for name, result in results.items():
+		print(f'{name:<20}' + '  '.join(f'{key}={value:.3e}' for key, value in result.items()))
+	return results
+
+if __name__ == '__main__':
+	main()
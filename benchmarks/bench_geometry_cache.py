@@ -0,0 +1,47 @@
+"""
+Benchmark of the first construction of each circuit element in a process: generating its geometry, loading it from the disk cache, and
+copying it from the in-memory cache of a warm process.
+Run from the repository root with: python -m benchmarks.bench_geometry_cache
+"""
+
+import tempfile
+import time
+from typing import Callable
+from manim_hkn.cElements import Resistor, Capacitor, Inductor, BJT_NPN, OpAmp, Battery, FunctionGenerator, Ground, CurrentSource
+from manim_hkn.geometryCache import geometry_cache
+
+ELEMENT_CLASSES:tuple[type, ...] = (Resistor, Capacitor, Inductor, BJT_NPN, OpAmp, Battery, FunctionGenerator, Ground, CurrentSource)
+REPEAT:int = 20
+
+# Best construction time, in milliseconds, with the cache prepared by the given function before each construction
+def _construct_ms(element_class:type, prepare:Callable[[], object]) -> float:
+	best:float = float('inf')
+	for _ in range(REPEAT):
+		prepare()
+		start:float = time.perf_counter()
+		element_class()
+		best = min(best, time.perf_counter() - start)
+	return 1000 * best
+
+def main() -> None:
+	previous_directory:str | None = geometry_cache.directory
+	with tempfile.TemporaryDirectory() as directory:
+		try:
+			geometry_cache.set_directory(directory)
+			for element_class in ELEMENT_CLASSES:
+				geometry_cache.clear()
+				element_class()
+			print(f'{"element":>18} {"generate (ms)":>14} {"disk (ms)":>10} {"memory (ms)":>12}')
+			for element_class in ELEMENT_CLASSES:
+				geometry_cache.set_directory(None)
+				generate:float = _construct_ms(element_class, geometry_cache.clear)
+				memory:float = _construct_ms(element_class, lambda: None)
+				geometry_cache.set_directory(directory)
+				disk:float = _construct_ms(element_class, geometry_cache.clear)
+				print(f'{element_class.__name__:>18} {generate:>14.3f} {disk:>10.3f} {memory:>12.3f}')
+		finally:
+			geometry_cache.set_directory(previous_directory)
+			geometry_cache.clear()
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,41 @@
+"""
+Benchmark of the import time of manim_hkn, each import being timed in a fresh interpreter.
+The lazy imports are compared against the eager import the package used to do, which imported manim and every public name up front.
+Run from the repository root with: python -m benchmarks.bench_import
+"""
+
+import subprocess
+import sys
+
+REPEAT:int = 5
+
+STATEMENTS:tuple[tuple[str, str], ...] = (
+	('import manim_hkn', 'import manim_hkn'),
+	('parse_spice', 'from manim_hkn import parse_spice'),
+	('element_points', 'from manim_hkn import element_points; element_points("Resistor")'),
+	('Resistor', 'from manim_hkn import Resistor'),
+	('eager', 'import manim_hkn; from manim import *; [getattr(manim_hkn, name) for name in manim_hkn.__all__]')
+)
+
+# Statement run in the fresh interpreter, printing the import time and whether manim ended up imported
+_TIMER:str = 'import sys, time\nstart = time.perf_counter()\n{statement}\nprint(time.perf_counter() - start, "manim" in sys.modules)'
+
+# Best time, in milliseconds, of the statement in a fresh interpreter, and whether it imported manim
+def _import_ms(statement:str) -> tuple[float, bool]:
+	best:float = float('inf')
+	manim_loaded:bool = False
+	for _ in range(REPEAT):
+		output:str = subprocess.run([sys.executable, '-c', _TIMER.format(statement=statement)], capture_output=True, text=True, check=True).stdout
+		elapsed, loaded = output.split()[-2:]
+		best = min(best, float(elapsed))
+		manim_loaded = loaded == 'True'
+	return 1000 * best, manim_loaded
+
+def main() -> None:
+	print(f'{"import":>15} {"time (ms)":>10} {"manim loaded":>13}')
+	for name, statement in STATEMENTS:
+		elapsed, manim_loaded = _import_ms(statement)
+		print(f'{name:>15} {elapsed:>10.1f} {str(manim_loaded):>13}')
+
+if __name__ == '__main__':
+	main()
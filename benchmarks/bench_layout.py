@@ -0,0 +1,47 @@
+"""
+Scaling benchmark of the layered layout engine.
+Random signal flow graphs (mostly forward edges between nearby elements, with a few feedback edges) are laid out at growing sizes. The
+graph layout and the batched application of the transforms to the elements are timed separately from element construction.
+Run from the repository root with: python -m benchmarks.bench_layout
+"""
+
+import time
+import numpy as np
+from manim_hkn.cElements import Resistor
+from manim_hkn.utils.layout import compute_layered_layout, layout_elements
+
+ELEMENT_COUNTS:tuple[int, ...] = (100, 250, 500, 1000)
+FEEDBACK_RATIO:float = 0.05
+
+def _random_connections(elements:list[Resistor], seed:int = 0) -> list[tuple[Resistor, str, Resistor, str]]:
+	rng = np.random.default_rng(seed)
+	count:int = len(elements)
+	connections:list[tuple[Resistor, str, Resistor, str]] = []
+	for index in range(count - 1):
+		for _ in range(int(rng.integers(1, 3))):
+			target:int = min(count - 1, index + int(rng.integers(1, 12)))
+			connections.append((elements[index], 'right', elements[target], 'left'))
+	for _ in range(int(FEEDBACK_RATIO * count)):
+		source, target = sorted(rng.integers(0, count, 2))[::-1]
+		connections.append((elements[source], 'right', elements[target], 'left'))
+	return connections
+
+def main() -> None:
+	print(f'{"elements":>9} {"edges":>6} {"graph (s)":>10} {"apply (s)":>10} {"total (s)":>10}')
+	for count in ELEMENT_COUNTS:
+		elements:list[Resistor] = [Resistor() for _ in range(count)]
+		connections = _random_connections(elements)
+		indices:dict[int, int] = {id(element): index for index, element in enumerate(elements)}
+		edges:np.ndarray = np.array([(indices[id(source)], indices[id(dest)]) for source, _, dest, _ in connections])
+
+		start:float = time.perf_counter()
+		compute_layered_layout(count, edges)
+		graph_time:float = time.perf_counter() - start
+
+		start = time.perf_counter()
+		layout_elements(elements, connections)
+		total_time:float = time.perf_counter() - start
+		print(f'{count:>9} {len(edges):>6} {graph_time:>10.3f} {total_time - graph_time:>10.3f} {total_time:>10.3f}')
+
+if __name__ == '__main__':
+	main()
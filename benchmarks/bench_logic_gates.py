@@ -0,0 +1,78 @@
+"""
+Benchmark of logic gate construction on ripple-carry adder schematics: each full adder is two XOR gates, two AND gates and an OR gate,
+wired with square wires in a Circuit, and the adders are chained through their carries, so that 200 bits make a 1,000-gate schematic.
+Gates are built with the geometry cache, which generates each (gate type, input count) geometry once, and without it, which regenerates
+the geometry of every gate. A sweep over input counts builds gates of every type with up to 16 inputs.
+Run from the repository root with: python -m benchmarks.bench_logic_gates
+"""
+
+import time
+from manim_hkn.cElements import AndGate, NandGate, OrGate, NorGate, XorGate, XnorGate
+from manim_hkn.geometryCache import geometry_cache
+from manim_hkn.utils.netlist import Circuit
+
+BIT_COUNTS:tuple[int, ...] = (20, 200)
+# Full adders per row of the schematic
+ROW_LENGTH:int = 20
+INPUT_COUNTS:tuple[int, ...] = (2, 3, 4, 8, 16)
+SWEEP_GATES:int = 100
+
+# Ripple-carry adder: per bit, sum = a XOR b XOR carry, carry out = (a AND b) OR ((a XOR b) AND carry)
+def ripple_carry_adder(bits:int) -> tuple[Circuit, dict[str, float]]:
+	timings:dict[str, float] = {}
+	start:float = time.perf_counter()
+	adders:list[tuple] = []
+	for bit in range(bits):
+		origin:list[float] = [14 * (bit % ROW_LENGTH), -16 * (bit // ROW_LENGTH), 0]
+		half_sum = XorGate().shift([origin[0], origin[1] + 4, 0])
+		full_sum = XorGate().shift([origin[0] + 7, origin[1] + 3.5, 0])
+		generate = AndGate().shift([origin[0], origin[1] - 2, 0])
+		propagate = AndGate().shift([origin[0] + 7, origin[1] - 1, 0])
+		carry = OrGate().shift([origin[0] + 11, origin[1] - 3, 0])
+		adders.append((half_sum, full_sum, generate, propagate, carry))
+	circuit = Circuit(*(gate for adder in adders for gate in adder))
+	timings['gates'] = time.perf_counter() - start
+
+	start = time.perf_counter()
+	previous_carry:OrGate | None = None
+	for half_sum, full_sum, generate, propagate, carry in adders:
+		circuit.connect_with_square_wire(half_sum, 'input 1', generate, 'input 1')
+		circuit.connect_with_square_wire(half_sum, 'input 2', generate, 'input 2')
+		circuit.connect_with_square_wire(half_sum, 'output', full_sum, 'input 1')
+		circuit.connect_with_square_wire(half_sum, 'output', propagate, 'input 1')
+		circuit.connect_with_square_wire(generate, 'output', carry, 'input 2')
+		circuit.connect_with_square_wire(propagate, 'output', carry, 'input 1')
+		if previous_carry is not None:
+			circuit.connect_with_square_wire(previous_carry, 'output', full_sum, 'input 2')
+			circuit.connect_with_square_wire(previous_carry, 'output', propagate, 'input 2')
+		previous_carry = carry
+	circuit.resolve()
+	timings['wires'] = time.perf_counter() - start
+	return circuit, timings
+
+def main() -> None:
+	print(f'{"bits":>5} {"gates":>6} {"wires":>6} {"cache":>6} {"gates (s)":>10} {"wires (s)":>10} {"total (s)":>10}')
+	for bits in BIT_COUNTS:
+		for enabled in (True, False):
+			geometry_cache.enabled = enabled
+			geometry_cache.clear()
+			circuit, timings = ripple_carry_adder(bits)
+			print(f'{bits:>5} {len(circuit.elements):>6} {len(circuit.wires):>6} {str(enabled):>6} {timings["gates"]:>10.2f} {timings["wires"]:>10.2f} {sum(timings.values()):>10.2f}')
+	geometry_cache.enabled = True
+
+	print()
+	print(f'{"inputs":>7} {"gate (ms), cached":>18} {"gate (ms), uncached":>20}')
+	for input_count in INPUT_COUNTS:
+		times:list[float] = []
+		for enabled in (True, False):
+			geometry_cache.enabled = enabled
+			start:float = time.perf_counter()
+			for _ in range(SWEEP_GATES // 6):
+				for gate_class in (AndGate, NandGate, OrGate, NorGate, XorGate, XnorGate):
+					gate_class(input_count)
+			times.append(1000 * (time.perf_counter() - start) / (SWEEP_GATES // 6 * 6))
+		print(f'{input_count:>7} {times[0]:>18.3f} {times[1]:>20.3f}')
+	geometry_cache.enabled = True
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,107 @@
+"""
+Benchmark of the gate-level logic simulator on networks of ripple-carry accumulators: each accumulator adds an input word to a register of
+D flip-flops every cycle, with five gates per bit, and many accumulators side by side make networks of tens of thousands of gates. The
+clocked simulation runs 64 lanes at once (64 stimulus patterns per bitwise operation), and its sums are checked against Python integers.
+The event-driven simulation is timed on the same networks with one gate delay per gate, and a per-gate Python loop is timed as a baseline
+on the smallest network.
+Run from the repository root with: python -m benchmarks.bench_logic_sim
+"""
+
+import time
+import numpy as np
+from manim_hkn.utils.logicSim import LogicNetwork, LANES
+
+# (accumulators, bits per accumulator, cycles)
+NETWORKS:tuple[tuple[int, int, int], ...] = ((100, 8, 1000), (1250, 8, 1000), (10, 256, 1000))
+EVENT_TICKS:int = 2000
+BASELINE_CYCLES:int = 20
+
+# Accumulators, each register <- register + input on the rising edges of the 'clock' net, returns the network, the input nets and the register nets of every accumulator
+def accumulators(count:int, bits:int) -> tuple[LogicNetwork, list[list[int]], list[list[int]]]:
+	network:LogicNetwork = LogicNetwork()
+	clock:int = network.add_net('clock')
+	inputs:list[list[int]] = []
+	registers:list[list[int]] = []
+	for _ in range(count):
+		addends:list[int] = [network.add_net() for _ in range(bits)]
+		sums:list[int] = [network.add_net() for _ in range(bits)]
+		register:list[int] = [network.add_flip_flop(sums[bit], clock) for bit in range(bits)]
+		carry:int = 0
+		for bit in range(bits):
+			half_sum:int = network.add_gate('XOR', [addends[bit], register[bit]])
+			network.add_gate('XOR', [half_sum, carry], sums[bit])
+			generate:int = network.add_gate('AND', [addends[bit], register[bit]])
+			propagate:int = network.add_gate('AND', [half_sum, carry])
+			carry = network.add_gate('OR', [generate, propagate])
+		inputs.append(addends)
+		registers.append(register)
+	return network, inputs, registers
+
+# Evaluates every gate one at a time, in levelized order, with Python integers
+def python_baseline(network:LogicNetwork, input_nets:list[int], stimulus:np.ndarray) -> float:
+	compiled:dict = network._compile()
+	order:list[tuple] = [(reduction, output, tuple(inputs), int(inversion)) for reduction, outputs, input_matrix, inversions in compiled['groups']
+		for output, inputs, inversion in zip(outputs.tolist(), input_matrix.tolist(), inversions.tolist())]
+	operators:dict = {np.bitwise_and: int.__and__, np.bitwise_or: int.__or__, np.bitwise_xor: int.__xor__}
+	flip_flops:list[tuple[int, int]] = [(int(d), int(q)) for d, _, q in compiled['flip_flops']]
+	values:list[int] = [0] * network.net_count
+	values[1] = (1 << LANES) - 1
+	start:float = time.perf_counter()
+	for words in stimulus.tolist():
+		for net, word in zip(input_nets, words):
+			values[net] = word
+		for reduction, output, inputs, inversion in order:
+			operator = operators[reduction]
+			word = values[inputs[0]]
+			for net in inputs[1:]:
+				word = operator(word, values[net])
+			values[output] = word ^ inversion
+		for d, q in flip_flops:
+			values[q] = values[d]
+	return time.perf_counter() - start
+
+def main() -> None:
+	rng:np.random.Generator = np.random.default_rng(0)
+	print(f'{"accumulators":>12} {"bits":>5} {"gates":>7} {"depth":>6} {"cycles":>7} {"clocked (s)":>12} {"gate evals/s":>13} {"event ticks":>12} {"events (s)":>11}')
+	for count, bits, cycles in NETWORKS:
+		network, inputs, registers = accumulators(count, bits)
+		input_nets:list[int] = [net for addends in inputs for net in addends]
+		stimulus:np.ndarray = rng.integers(0, 1 << 63, size=(cycles, len(input_nets)), dtype=np.uint64) << np.uint64(1)
+		start:float = time.perf_counter()
+		network._compile()
+		trace = network.simulate_cycles(input_nets, stimulus)
+		clocked:float = time.perf_counter() - start
+
+		# Every lane of every register is the sum of its inputs over the cycles, modulo 2 ** bits
+		words:np.ndarray = stimulus.reshape(cycles, count, bits)
+		for lane in (0, LANES - 1):
+			lane_bits:np.ndarray = ((words >> np.uint64(lane)) & np.uint64(1)).astype(object)
+			expected:np.ndarray = (lane_bits * (1 << np.arange(bits, dtype=object))).sum(axis=(0, 2)) % (1 << bits)
+			for accumulator, register in enumerate(registers):
+				got:int = sum(((int(trace.final_words[net]) >> lane) & 1) << bit for bit, net in enumerate(register))
+				assert got == expected[accumulator], f'Accumulator {accumulator}, lane {lane}: {got} != {expected[accumulator]}'
+
+		# Event-driven: the inputs change every period, long enough for the carries to ripple, and the clock rises halfway through it
+		period:int = 2 * (2 * bits + 4)
+		changes:int = EVENT_TICKS // period
+		events:list[tuple[int, str | int, int]] = [(change * period, net, word) for change in range(changes) for net, word in zip(input_nets, stimulus[change].tolist())]
+		events += [(change * period + period // 2 + edge, 'clock', level) for change in range(changes) for edge, level in ((0, (1 << LANES) - 1), (1, 0))]
+		start = time.perf_counter()
+		network.simulate_events(events, EVENT_TICKS)
+		evented:float = time.perf_counter() - start
+		print(f'{count:>12} {bits:>5} {network.gate_count:>7} {network._compile()["depth"]:>6} {cycles:>7} {clocked:>12.3f} '
+			f'{network.gate_count * cycles * LANES / clocked:>13.2e} {EVENT_TICKS:>12} {evented:>11.3f}')
+
+	count, bits, _ = NETWORKS[0]
+	network, inputs, _ = accumulators(count, bits)
+	input_nets = [net for addends in inputs for net in addends]
+	stimulus = rng.integers(0, 1 << 63, size=(BASELINE_CYCLES, len(input_nets)), dtype=np.uint64)
+	baseline:float = python_baseline(network, input_nets, stimulus)
+	start = time.perf_counter()
+	network.simulate_cycles(input_nets, stimulus)
+	vectorized:float = time.perf_counter() - start
+	print()
+	print(f'Per-gate Python loop, {network.gate_count} gates, {BASELINE_CYCLES} cycles: {baseline:.3f} s, vectorized: {vectorized:.3f} s ({baseline / vectorized:.0f}x)')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of render_parallel against a serial render of a lecture-like scene: a chain of resistors drawn and moved by a sequence of play calls.
+Both renders use low quality and no partial movie cache, and the two movies are checked to be identical.
+Run from the repository root with: python -m benchmarks.bench_parallel_render
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from manim import Scene, config
+from manim.constants import LEFT, RIGHT, UP, DOWN
+from manim_hkn.animations import CreateCircuit
+from manim_hkn.cElements import Resistor
+from manim_hkn.parallelRender import render_parallel
+from manim_hkn.utils.netlist import Circuit
+
+PROCESS_COUNTS:tuple[int, ...] = (2, 4, 8)
+ELEMENT_COUNT:int = 12
+
+class ChainScene(Scene):
+	def construct(self:"ChainScene") -> None:
+		resistors:list[Resistor] = [Resistor().shift([6 * index, 3 * (index % 2), 0]) for index in range(ELEMENT_COUNT)]
+		circuit = Circuit(*resistors)
+		for left, right in zip(resistors, resistors[1:]):
+			circuit.connect_with_square_wire(left, 'right', right, 'left')
+		circuit.resolve()
+		circuit.scale(0.15).move_to(LEFT)
+		self.play(CreateCircuit(circuit), run_time=2)
+		for shift in (RIGHT, UP, DOWN * 2, LEFT, UP):
+			self.play(resistors[ELEMENT_COUNT // 2].animate.shift(shift), run_time=1)
+			self.wait(0.5)
+		self.play(circuit.animate.scale(1.5), run_time=1)
+
+def _digest(path:Path) -> str:
+	return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def main() -> None:
+	config.quality = 'low_quality'
+	config.disable_caching = True
+	config.progress_bar = 'none'
+	config.verbosity = 'WARNING'
+	with tempfile.TemporaryDirectory() as directory:
+		config.media_dir = os.path.join(directory, 'serial')
+		start:float = time.perf_counter()
+		scene = ChainScene()
+		scene.render()
+		serial:float = time.perf_counter() - start
+		serial_digest:str = _digest(Path(scene.renderer.file_writer.movie_file_path))
+		print(f'{"processes":>10} {"segments":>9} {"time (s)":>9} {"speedup":>8} {"identical":>10}')
+		print(f'{"serial":>10} {1:>9} {serial:>9.2f} {1:>8.2f} {"-":>10}')
+		for processes in PROCESS_COUNTS:
+			config.media_dir = os.path.join(directory, f'parallel_{processes}')
+			result = render_parallel(ChainScene, processes)
+			identical:bool = _digest(result.movie_file_path) == serial_digest
+			print(f'{processes:>10} {len(result.segments):>9} {result.timings["total"]:>9.2f} {serial / result.timings["total"]:>8.2f} {str(identical):>10}')
+			for segment in result.segments:
+				print(f'{"":>10} animations {segment.first_animation}-{segment.last_animation}: {segment.run_time:.1f} s of movie rendered in {segment.render_time:.2f} s')
+
+if __name__ == '__main__':
+	main()
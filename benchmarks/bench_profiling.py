@@ -0,0 +1,87 @@
+"""
+Benchmark of the overhead of the profiler on a workload of a circuit scene without rendering: building an RC ladder circuit of circuit
+elements and wires, interpolating its Create animation, and running its updaters for a number of frames while one of its elements moves.
+The workload is timed before any profiler was enabled, with a profiler enabled (with and without keeping the trace), and after the
+profiler was disabled, which must match the first timing, as must the time per call of single instrumented operations (an updater call,
+an element construction), measured as the best of many runs. The largest costs found by the profiler are printed afterwards.
+Run from the repository root with: python -m benchmarks.bench_profiling
+"""
+
+import gc
+import time
+import timeit
+from typing import Callable
+from manim import Mobject
+import numpy as np
+from manim_hkn.animations import CreateCircuit
+from manim_hkn.cElements import Resistor, Capacitor
+from manim_hkn.profiling import Profiler
+from manim_hkn.utils.netlist import Circuit
+
+STAGES:int = 40
+FRAMES:int = 60
+REPEATS:int = 10
+
+def workload() -> None:
+	elements:list = []
+	for stage in range(STAGES):
+		elements += [Resistor().shift([3 * stage, 2, 0]), Capacitor().rotate(np.pi / 2).shift([3 * stage + 1.5, 0, 0])]
+	circuit = Circuit(*elements)
+	for stage in range(STAGES):
+		circuit.connect_with_square_wire(elements[2 * stage], 'right', elements[2 * stage + 1], 'left')
+		if stage:
+			circuit.connect_with_straight_wire(elements[2 * stage - 2], 'right', elements[2 * stage], 'left')
+	circuit.resolve()
+	animation = CreateCircuit(circuit)
+	animation.begin()
+	for alpha in np.linspace(0, 1, FRAMES):
+		animation.interpolate(alpha)
+	animation.finish()
+	for _ in range(FRAMES):
+		elements[0].shift([0, 0.01, 0])
+		circuit.update(1 / FRAMES)
+
+# Instrumented operations, each timed per call
+def _operations() -> dict[str, Callable[[], object]]:
+	mobject:Mobject = Mobject()
+	mobject.add_updater(lambda mobject: None)
+	return {'updater call (us)': mobject.update, 'Resistor() (us)': Resistor}
+
+def _per_call(operation:Callable[[], object], number:int = 200) -> float:
+	return min(timeit.repeat(operation, number=number, repeat=REPEATS)) / number
+
+def _time() -> float:
+	timings:list[float] = []
+	for _ in range(REPEATS):
+		gc.collect()
+		start:float = time.perf_counter()
+		workload()
+		timings.append(time.perf_counter() - start)
+	return min(timings)
+
+def main() -> None:
+	workload()
+	operations:dict[str, Callable[[], object]] = _operations()
+	update:Callable = Mobject.update
+	timings:dict[str, list[float]] = {}
+	timings['never enabled'] = [_time(), *(_per_call(operation) for operation in operations.values())]
+	with Profiler() as profiler:
+		timings['enabled'] = [_time(), *(_per_call(operation) for operation in operations.values())]
+	with Profiler(trace=False):
+		timings['enabled, trace=False'] = [_time(), *(_per_call(operation) for operation in operations.values())]
+	assert Mobject.update is update
+	timings['disabled'] = [_time(), *(_per_call(operation) for operation in operations.values())]
+	print(f'{"profiler":>24} {"workload (ms)":>14} {"overhead":>9}' + ''.join(f' {name:>18}' for name in operations))
+	never:list[float] = timings['never enabled']
+	for name, (elapsed, *per_call) in timings.items():
+		print(f'{name:>24} {1000 * elapsed:>14.1f} {elapsed / never[0] - 1:>+9.1%}' + ''.join(f' {1e6 * call:>18.2f}' for call in per_call))
+
+	report:dict = profiler.report()
+	print()
+	print(f'{"event":>16} {"name":>32} {"count":>8} {"total (ms)":>11} {"mean (us)":>10}')
+	rows:list[tuple[str, str, dict]] = [(event, name, summary) for name, events in report['by_name'].items() for event, summary in events.items()]
+	for event, name, summary in sorted(rows, key=lambda row: -row[2]['total_ms'])[:10]:
+		print(f'{event:>16} {name:>32} {summary["count"]:>8} {summary["total_ms"]:>11.1f} {summary["mean_us"]:>10.1f}')
+
+if __name__ == '__main__':
+	main()
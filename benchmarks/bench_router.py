@@ -0,0 +1,48 @@
+"""
+Scaling benchmark of the orthogonal wire router.
+Schematics of resistors placed on a grid are routed with a growing number of nets between nearby terminals. The time per net should stay
+roughly constant as the schematic grows, since each route only queries the obstacles of its own search window.
+Run from the repository root with: python -m benchmarks.bench_router
+"""
+
+import time
+import numpy as np
+from manim_hkn.cElements import Resistor
+from manim_hkn.utils.router import OrthogonalRouter
+
+NET_COUNTS:tuple[int, ...] = (25, 50, 100, 200, 400)
+COLUMN_SPACING:float = 8.
+ROW_SPACING:float = 4.
+
+# Places one resistor per net on a square grid, and connects each resistor's right terminal to the left terminal of a random resistor at most two cells away
+def _build_schematic(net_count:int, seed:int = 0) -> tuple[list[Resistor], list[tuple[Resistor, str, Resistor, str]]]:
+	rng = np.random.default_rng(seed)
+	columns:int = int(np.ceil(np.sqrt(net_count)))
+	elements:list[Resistor] = []
+	for index in range(net_count):
+		elements.append(Resistor().shift([(index % columns) * COLUMN_SPACING, -(index // columns) * ROW_SPACING, 0]))
+
+	connections:list[tuple[Resistor, str, Resistor, str]] = []
+	for index in range(net_count):
+		row, column = divmod(index, columns)
+		while True:
+			target_row:int = row + int(rng.integers(-2, 3))
+			target_column:int = column + int(rng.integers(-2, 3))
+			target:int = target_row * columns + target_column
+			if 0 <= target_column < columns and 0 <= target < net_count and target != index:
+				break
+		connections.append((elements[index], 'right', elements[target], 'left'))
+	return elements, connections
+
+def main() -> None:
+	print(f'{"nets":>6} {"route (s)":>10} {"per net (ms)":>13} {"expanded/net":>13}')
+	for net_count in NET_COUNTS:
+		elements, connections = _build_schematic(net_count)
+		start:float = time.perf_counter()
+		router = OrthogonalRouter(elements)
+		router.route_all(connections)
+		elapsed:float = time.perf_counter() - start
+		print(f'{net_count:>6} {elapsed:>10.3f} {1000 * elapsed / net_count:>13.2f} {router.expanded_nodes / net_count:>13.0f}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,51 @@
+"""
+Benchmark of the transient solver on RC ladders driven by a pulse source: a chain of resistors with a capacitor from every node to ground.
+Times the DC operating point and a fixed-step transient of 10,000 steps, which factorizes the system matrix once, against solving the same
+steps with a new factorization each (scipy's spsolve), timed over fewer steps and scaled to the same count.
+Run from the repository root with: python -m benchmarks.bench_solver
+"""
+
+import time
+import numpy as np
+import scipy.sparse.linalg
+from manim_hkn.utils.solver import CircuitSolver, SolverElement, GROUND, source_waveform
+
+NODE_COUNTS:tuple[int, ...] = (100, 1000, 5000)
+STEPS:int = 10000
+# Steps solved with a new factorization each, before scaling to STEPS
+REFACTORIZED_STEPS:int = 200
+TIME_STEP:float = 1e-6
+
+def rc_ladder(nodes:int) -> CircuitSolver:
+	elements:list[SolverElement] = [SolverElement('V1', 'V', (0, GROUND), 0., source_waveform('PULSE(0 1 0 1u 1u 2m 4m)'))]
+	for index in range(nodes - 1):
+		elements.append(SolverElement(f'R{index}', 'R', (index, index + 1), 10.))
+		elements.append(SolverElement(f'C{index}', 'C', (index + 1, GROUND), 1e-9))
+	return CircuitSolver(elements, nodes)
+
+# Seconds per step of the transient loop without factorization reuse
+def _refactorized_step_time(solver:CircuitSolver) -> float:
+	matrix, history_matrix = solver._build_matrices(TIME_STEP, 'trapezoidal')
+	times:np.ndarray = np.arange(REFACTORIZED_STEPS + 1) * TIME_STEP
+	source_terms:np.ndarray = (solver._source_matrix @ solver._source_table(times).T).T
+	state:np.ndarray = np.zeros(solver.unknown_count)
+	start:float = time.perf_counter()
+	for step in range(1, REFACTORIZED_STEPS + 1):
+		state = scipy.sparse.linalg.spsolve(matrix, history_matrix @ state + source_terms[step])
+	return (time.perf_counter() - start) / REFACTORIZED_STEPS
+
+def main() -> None:
+	print(f'{"nodes":>6} {"unknowns":>9} {"dc (ms)":>8} {"transient (s)":>14} {"refactorized (s)":>17} {"speedup":>8}')
+	for nodes in NODE_COUNTS:
+		solver:CircuitSolver = rc_ladder(nodes)
+		start:float = time.perf_counter()
+		solver.dc()
+		dc:float = time.perf_counter() - start
+		start = time.perf_counter()
+		solver.transient(STEPS * TIME_STEP, TIME_STEP, record_every=10)
+		transient:float = time.perf_counter() - start
+		refactorized:float = _refactorized_step_time(solver) * STEPS
+		print(f'{nodes:>6} {solver.unknown_count:>9} {1000 * dc:>8.2f} {transient:>14.2f} {refactorized:>17.2f} {refactorized / transient:>8.1f}')
+
+if __name__ == '__main__':
+	main()
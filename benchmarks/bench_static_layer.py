@@ -0,0 +1,68 @@
+"""
+Benchmark of static layers on a dense schematic: rows of resistors joined by square wires, all with thick round-capped strokes, under a few
+annotations animating over them for the whole scene.
+The scene is rendered as a plain Scene, as a CircuitScene, and as a CircuitScene drawing the schematic as a StaticLayer, at low quality and
+without the partial movie cache. Halfway through, one resistor moves, which rasterizes the static layer again for those frames.
+Run from the repository root with: python -m benchmarks.bench_static_layer
+"""
+
+import tempfile
+import time
+from manim import Scene, Dot, Arrow, config
+from manim.constants import LEFT, RIGHT, UP, DOWN
+from manim.utils.color import YELLOW
+from manim_hkn.cElements import Resistor
+from manim_hkn.rendering import CircuitScene, StaticLayer
+from manim_hkn.utils.netlist import Circuit
+
+ELEMENT_COUNTS:tuple[int, ...] = (50, 200)
+ROW_LENGTH:int = 10
+
+# A schematic of the given number of resistors, in rows joined by square wires
+def _schematic(count:int) -> tuple[Circuit, list[Resistor]]:
+	resistors:list[Resistor] = [Resistor().shift([6 * (index % ROW_LENGTH), -4 * (index // ROW_LENGTH) + (index % 2), 0]) for index in range(count)]
+	circuit = Circuit(*resistors)
+	for left, right in zip(resistors, resistors[1:]):
+		circuit.connect_with_square_wire(left, 'right', right, 'left')
+	circuit.resolve()
+	circuit.scale_to_fit_height(7).center()
+	return circuit, resistors
+
+def _walkthrough(scene:Scene, count:int, layered:bool) -> None:
+	circuit, resistors = _schematic(count)
+	scene.add(StaticLayer(circuit) if layered else circuit)
+	dots:list[Dot] = [Dot(LEFT * 5 + UP * offset, color=YELLOW) for offset in (-2, 0, 2)]
+	arrow = Arrow(LEFT * 4 + DOWN * 3, LEFT * 2 + DOWN, color=YELLOW)
+	scene.add(*dots, arrow)
+	scene.play(*(dot.animate.shift(RIGHT * 10) for dot in dots), arrow.animate.shift(RIGHT * 6), run_time=2)
+	scene.play(*(dot.animate.shift(LEFT * 10) for dot in dots), resistors[count // 2].animate.shift(UP * 0.2), run_time=1)
+	scene.play(*(dot.animate.shift(RIGHT * 10) for dot in dots), arrow.animate.shift(LEFT * 6), run_time=2)
+
+def _scene_class(base:type[Scene], count:int, layered:bool) -> type[Scene]:
+	class Walkthrough(base):
+		def construct(self:"Walkthrough") -> None:
+			_walkthrough(self, count, layered)
+	return Walkthrough
+
+def main() -> None:
+	config.quality = 'low_quality'
+	config.disable_caching = True
+	config.progress_bar = 'none'
+	config.verbosity = 'WARNING'
+	print(f'{"elements":>9} {"scene":>25} {"time (s)":>9} {"layer renders":>14} {"layer reuses":>13}')
+	with tempfile.TemporaryDirectory() as directory:
+		config.media_dir = directory
+		for count in ELEMENT_COUNTS:
+			for name, base, layered in (('Scene', Scene, False), ('CircuitScene', CircuitScene, False), ('CircuitScene, StaticLayer', CircuitScene, True)):
+				scene:Scene = _scene_class(base, count, layered)()
+				start:float = time.perf_counter()
+				scene.render()
+				elapsed:float = time.perf_counter() - start
+				if isinstance(scene, CircuitScene):
+					info:dict = scene.frame_deduplicator.info()
+					print(f'{count:>9} {name:>25} {elapsed:>9.2f} {info["layer_renders"]:>14} {info["layer_reuses"]:>13}')
+				else:
+					print(f'{count:>9} {name:>25} {elapsed:>9.2f} {"-":>14} {"-":>13}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,193 @@
+"""
+Construction and render benchmark suite for every circuit element, and for scaled circuit scenarios.
+For each element class, measures construction time, points count, memory per instance, copy() cost, per-frame updater cost and Create
+interpolation cost. Scaled scenarios build N elements, N square-wire connections and split_wire chains.
+Results are written as a flat JSON dictionary of metrics, and can be compared against a stored baseline to catch regressions.
+
+Run from the repository root with:
+	python -m benchmarks.suite                                  # print the results
+	python -m benchmarks.suite --output results.json            # save the results
+	python -m benchmarks.suite --save-baseline                  # store the results as benchmarks/baseline.json
+	python -m benchmarks.suite --compare benchmarks/baseline.json --tolerance 0.25
+The comparison exits with status 1 if any metric grew by more than the tolerance. Quick runs are too short for stable timings, compare full runs.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable
+import numpy as np
+from manim import VGroup
+from manim.animation.creation import Create
+import manim_hkn.cElements as cElements
+from manim_hkn.cElements import Resistor, Capacitor, Inductor, BJT_NPN, OpAmp, Battery, FunctionGenerator, Ground, CurrentSource, Wire
+from manim_hkn.utils.circuitBuilder import connect_with_square_wire, split_wire
+
+ELEMENT_CLASSES:tuple[type, ...] = (Resistor, Capacitor, Inductor, BJT_NPN, OpAmp, Battery, FunctionGenerator, Ground, CurrentSource, Wire)
+DEFAULT_BASELINE:str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# Number of interpolated frames of a one second Create animation at 30 fps
+CREATE_FRAMES:int = 30
+
+# Best of repeat runs of the mean time of number calls, in milliseconds. The best run is the least disturbed by the rest of the system.
+def _time_ms(function:Callable[[], object], number:int, repeat:int) -> float:
+	best:float = float('inf')
+	for _ in range(repeat):
+		start:float = time.perf_counter()
+		for _ in range(number):
+			function()
+		best = min(best, (time.perf_counter() - start) / number)
+	return 1000 * best
+
+# Bytes allocated per instance while constructing count instances, with all of them kept alive
+def _memory_per_instance(element_class:type, count:int) -> float:
+	gc.collect()
+	tracemalloc.start()
+	try:
+		start, _ = tracemalloc.get_traced_memory()
+		instances:list = [element_class() for _ in range(count)]
+		end, _ = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+	del instances
+	return (end - start) / count
+
+# A Wire is only meaningful bound to terminals, so its updater is measured between two resistors, one of which moves every frame
+def _updater_workload(element_class:type) -> Callable[[], object]:
+	if element_class is not Wire:
+		element = element_class()
+		return lambda: element.update(0)
+	left, right = Resistor().shift([-4, 0, 0]), Resistor().shift([4, 0, 0])
+	wire = Wire()
+	wire.bind_terminal('left', left, 'right', [1, 1, 1])
+	wire.bind_terminal('right', right, 'left', [1, 1, 1])
+	offsets:list[float] = [0.01]
+	def moving_frame() -> None:
+		offsets[0] = -offsets[0]
+		right.shift([0, offsets[0], 0])
+		wire.update(0)
+	return moving_frame
+
+# Interpolates a whole Create animation, frame by frame
+def _create_workload(element_class:type) -> Callable[[], object]:
+	element = element_class()
+	alphas:np.ndarray = np.linspace(0, 1, CREATE_FRAMES)
+	def create() -> None:
+		animation = Create(element)
+		animation.begin()
+		for alpha in alphas:
+			animation.interpolate(alpha)
+		animation.finish()
+	return create
+
+def bench_elements(number:int, repeat:int, memory_count:int) -> dict[str, float]:
+	results:dict[str, float] = {}
+	for element_class in ELEMENT_CLASSES:
+		name:str = element_class.__name__
+		element = element_class()
+		results[f'{name}.points'] = float(len(element.points))
+		results[f'{name}.family_points'] = float(sum(len(member.points) for member in element.get_family()))
+		results[f'{name}.construct_ms'] = _time_ms(element_class, number, repeat)
+		results[f'{name}.memory_bytes'] = _memory_per_instance(element_class, memory_count)
+		results[f'{name}.copy_ms'] = _time_ms(element.copy, number, repeat)
+		results[f'{name}.updater_frame_ms'] = _time_ms(_updater_workload(element_class), number, repeat)
+		results[f'{name}.create_ms'] = _time_ms(_create_workload(element_class), max(1, number // 10), repeat)
+	return results
+
+# N resistors in a row
+def _build_elements(count:int) -> VGroup:
+	return VGroup(*(Resistor().shift([6 * index, 0, 0]) for index in range(count)))
+
+# N pairs of resistors, each pair joined by a square wire
+def _build_square_connections(count:int) -> VGroup:
+	mobjects:list = []
+	for index in range(count):
+		left = Resistor().shift([12 * index, 0, 0])
+		right = Resistor().shift([12 * index + 6, 3, 0])
+		mobjects += [left, right, *connect_with_square_wire(left, 'right', right, 'left')]
+	return VGroup(*mobjects)
+
+# One wire between two resistors, split in half count times, always splitting the last half
+def _build_split_chain(count:int) -> VGroup:
+	left, right = Resistor(), Resistor().shift([8 * count, 0, 0])
+	wire = Wire()
+	wire.bind_terminal('left', left, 'right', [1, 1, 1])
+	wire.bind_terminal('right', right, 'left', [1, 1, 1])
+	wires:list[Wire] = []
+	for _ in range(count):
+		first, wire = split_wire(wire)
+		wires.append(first)
+	return VGroup(left, right, *wires, wire)
+
+def bench_scenarios(sizes:tuple[int, ...], repeat:int) -> dict[str, float]:
+	results:dict[str, float] = {}
+	for size in sizes:
+		for scenario, build in (('elements', _build_elements), ('square_wires', _build_square_connections), ('split_chain', _build_split_chain)):
+			start:float = time.perf_counter()
+			group:VGroup = build(size)
+			results[f'scenario.{scenario}[{size}].build_ms'] = 1000 * (time.perf_counter() - start)
+			results[f'scenario.{scenario}[{size}].frame_ms'] = _time_ms(lambda: group.update(0), 1, repeat)
+	return results
+
+def run(quick:bool = False) -> dict:
+	number, repeat, memory_count = (5, 2, 5) if quick else (50, 5, 50)
+	sizes:tuple[int, ...] = (10, 50) if quick else (10, 100, 500)
+	results:dict[str, float] = {}
+	results.update(bench_elements(number, repeat, memory_count))
+	results.update(bench_scenarios(sizes, repeat))
+	return {
+		'metadata': {
+			'python': platform.python_version(),
+			'numpy': np.__version__,
+			'platform': platform.platform(),
+			'quick': quick,
+			'geometry_cache': cElements.geometry_cache.enabled
+		},
+		'results': results
+	}
+
+# Returns the metrics which grew beyond the tolerance relative to the baseline, as (name, baseline, current) tuples. Every metric is lower-is-better.
+def compare(current:dict[str, float], baseline:dict[str, float], tolerance:float) -> list[tuple[str, float, float]]:
+	regressions:list[tuple[str, float, float]] = []
+	for name, baseline_value in baseline.items():
+		if name not in current:
+			continue
+		# Timings below 10 microseconds are noise, and growth from zero (ex: an element gaining its first updater) is always reported
+		floor:float = 1e-2 if name.endswith('_ms') else 0.
+		if current[name] > max(baseline_value, floor) * (1 + tolerance):
+			regressions.append((name, baseline_value, current[name]))
+	return regressions
+
+def main(argv:list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument('--quick', action='store_true', help='fewer repetitions and smaller scenarios')
+	parser.add_argument('--output', help='write the results as JSON to this path')
+	parser.add_argument('--save-baseline', action='store_true', help=f'write the results to {DEFAULT_BASELINE}')
+	parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE, help='compare against a baseline JSON file (default: benchmarks/baseline.json)')
+	parser.add_argument('--tolerance', type=float, default=0.25, help='relative growth of a metric reported as a regression (default: 0.25)')
+	arguments = parser.parse_args(argv)
+
+	report:dict = run(arguments.quick)
+	for path in filter(None, (arguments.output, DEFAULT_BASELINE if arguments.save_baseline else None)):
+		with open(path, 'w') as output_file:
+			json.dump(report, output_file, indent='\t', sort_keys=True)
+	if not arguments.output:
+		json.dump(report, sys.stdout, indent='\t', sort_keys=True)
+		print()
+
+	if arguments.compare:
+		with open(arguments.compare) as baseline_file:
+			baseline:dict[str, float] = json.load(baseline_file)['results']
+		regressions = compare(report['results'], baseline, arguments.tolerance)
+		for name, baseline_value, current_value in regressions:
+			print(f'REGRESSION {name}: {baseline_value:.4g} -> {current_value:.4g} ({current_value / max(baseline_value, 1e-12) - 1:+.0%})', file=sys.stderr)
+		print(f'{len(regressions)} regression(s) against {arguments.compare}', file=sys.stderr)
+		return 1 if regressions else 0
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -1,20 +1,85 @@
-from manim import *
+"""
+Circuit elements and circuit building utilities for manim.
+Every public name is imported lazily on first access (PEP 562), so that importing the package, or a manim-free module of it such as
+manim_hkn.elementGeometry or manim_hkn.utils.spiceParser, does not import manim. Any other attribute is looked up on manim, as the
+package used to re-export manim entirely.
+"""
 
-from manim_hkn.cElements import Resistor, Capacitor, Inductor, BJT_NPN, Wire, Battery, FunctionGenerator, FunctionGenerator, OpAmp, Ground, CurrentSource
-from manim_hkn.utils.circuitBuilder import connect_with_straight_wire, connect_with_square_wire, split_wire
+import importlib
+import importlib.util
 
-__all__ = [
-	'CurrentSource'
-	'OpAmp',
-	'BJT_NPN',
-	'Resistor',
-	'Capacitor',
-	'Inductor',
-	'Battery',
-	'FunctionGenerator',
-	'Ground',
-	'Wire',
-	'connect_with_straight_wire',
-	'connect_with_square_wire',
-	'split_wire'
-]
+# Module defining each public name
+_LAZY_ATTRIBUTES:dict[str, str] = {
+	'CurrentSource'					: 'manim_hkn.cElements',
+	'OpAmp'							: 'manim_hkn.cElements',
+	'BJT_NPN'						: 'manim_hkn.cElements',
+	'Resistor'						: 'manim_hkn.cElements',
+	'Capacitor'						: 'manim_hkn.cElements',
+	'Inductor'						: 'manim_hkn.cElements',
+	'Battery'						: 'manim_hkn.cElements',
+	'FunctionGenerator'				: 'manim_hkn.cElements',
+	'Ground'						: 'manim_hkn.cElements',
+	'Wire'							: 'manim_hkn.cElements',
+	'AndGate'						: 'manim_hkn.cElements',
+	'NandGate'						: 'manim_hkn.cElements',
+	'OrGate'						: 'manim_hkn.cElements',
+	'NorGate'						: 'manim_hkn.cElements',
+	'XorGate'						: 'manim_hkn.cElements',
+	'XnorGate'						: 'manim_hkn.cElements',
+	'NotGate'						: 'manim_hkn.cElements',
+	'Buffer'						: 'manim_hkn.cElements',
+	'DFlipFlop'						: 'manim_hkn.cElements',
+	'connect_with_straight_wire'	: 'manim_hkn.utils.circuitBuilder',
+	'connect_with_square_wire'		: 'manim_hkn.utils.circuitBuilder',
+	'split_wire'					: 'manim_hkn.utils.circuitBuilder',
+	'Circuit'						: 'manim_hkn.utils.netlist',
+	'import_spice'					: 'manim_hkn.utils.spiceImporter',
+	'parse_spice'					: 'manim_hkn.utils.spiceParser',
+	'SpiceCircuit'					: 'manim_hkn.utils.spiceImporter',
+	'OrthogonalRouter'				: 'manim_hkn.utils.router',
+	'layout_elements'				: 'manim_hkn.utils.layout',
+	'layout_circuit'				: 'manim_hkn.utils.layout',
+	'CircuitArray'					: 'manim_hkn.utils.generators',
+	'ladder'						: 'manim_hkn.utils.generators',
+	'rc_ladder'						: 'manim_hkn.utils.generators',
+	'lc_ladder'						: 'manim_hkn.utils.generators',
+	'r2r_dac'						: 'manim_hkn.utils.generators',
+	'resistor_grid'					: 'manim_hkn.utils.generators',
+	'batch_transform'				: 'manim_hkn.utils.batchTransform',
+	'BatchTransform'				: 'manim_hkn.utils.batchTransform',
+	'CreateElement'					: 'manim_hkn.animations',
+	'UncreateElement'				: 'manim_hkn.animations',
+	'CreateCircuit'					: 'manim_hkn.animations',
+	'UncreateCircuit'				: 'manim_hkn.animations',
+	'render_parallel'				: 'manim_hkn.parallelRender',
+	'CircuitScene'					: 'manim_hkn.rendering',
+	'FrameDeduplicator'				: 'manim_hkn.rendering',
+	'StaticLayer'					: 'manim_hkn.rendering',
+	'CurrentFlow'					: 'manim_hkn.currentFlow',
+	'CircuitBatch'					: 'manim_hkn.circuitBatch',
+	'element_points'				: 'manim_hkn.elementGeometry',
+	'geometry_cache'				: 'manim_hkn.geometryCache',
+	'Profiler'						: 'manim_hkn.profiling'
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name:str):
+	if name.startswith('__'):
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+	if name in _LAZY_ATTRIBUTES:
+		value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+	elif importlib.util.find_spec(f'{__name__}.{name}') is not None:
+		# Submodules, ex: from manim_hkn import geometry
+		value = importlib.import_module(f'{__name__}.{name}')
+	else:
+		try:
+			value = getattr(importlib.import_module('manim'), name)
+		except AttributeError:
+			raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+	# Cached on the module, so later accesses skip __getattr__
+	globals()[name] = value
+	return value
+
+def __dir__() -> list[str]:
+	return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,181 @@
+"""
+Create and Uncreate animations for circuit elements and whole circuits, paced by arc length.
+When an animation begins, the curves of every drawn mobject are sampled once into a cumulative arc-length table, and the mobject is given
+a points buffer of constant size. Each frame then only takes a binary search in the table and writes, in place, the fully drawn curves,
+the one partially drawn curve, and the collapsed remainder into the buffer. No classes or temporary point arrays are created per frame.
+CreateCircuit draws every element and wire of a circuit one after the other in a single continuous stroke, at a constant drawing speed.
+"""
+
+from collections import deque
+from typing import Callable, Iterable
+import numpy as np
+from manim import Mobject, VMobject
+from manim.animation.animation import Animation
+from manim.utils.rate_functions import smooth
+from manim_hkn import geometry
+from manim_hkn.terminal import _TerminalAnchors
+
+N_POINTS_PER_CUBIC_CURVE:int = 4
+# Samples per cubic curve in the arc-length tables
+ARC_LENGTH_SAMPLES:int = 8
+
+# Drawing state of one mobject: its full points, its arc-length table, and the buffer its partial points are written to
+class _StrokeTrack:
+	__slots__ = ('mobject', 'full_points', 'buffer', 'sample_lengths', 'length', 'fraction', 'split_matrix')
+
+	def __init__(self:"_StrokeTrack", mobject:VMobject) -> None:
+		self.mobject:VMobject = mobject
+		self.full_points:np.ndarray = np.array(mobject.points, dtype=float)
+		# Cumulative length at every sample, with a leading 0. Curves without length (ex: closing curves) are still drawn one after the other.
+		self.sample_lengths:np.ndarray = geometry.arc_length_table(self.full_points, ARC_LENGTH_SAMPLES)[1]
+		self.length:float = float(self.sample_lengths[-1])
+		if self.length == 0:
+			self.sample_lengths = np.arange(len(self.sample_lengths), dtype=float)
+		self.fraction:float | None = None
+		self.split_matrix:np.ndarray = np.zeros((N_POINTS_PER_CUBIC_CURVE, N_POINTS_PER_CUBIC_CURVE))
+		mobject.points = self.full_points.copy()
+		# Read back, as mobjects whose points are views (ex: the layers of a CircuitBatch) copy assigned points into their own storage
+		self.buffer:np.ndarray = mobject.points
+
+	# Draws the given fraction of the track's arc length into its buffer
+	def draw(self:"_StrokeTrack", fraction:float) -> None:
+		fraction = min(max(fraction, 0.), 1.)
+		if fraction == self.fraction:
+			return
+		self.fraction = fraction
+		buffer:np.ndarray = self.buffer
+		if len(buffer) < N_POINTS_PER_CUBIC_CURVE:
+			return
+		if fraction == 1:
+			np.copyto(buffer, self.full_points)
+		else:
+			target_length:float = fraction * self.sample_lengths[-1]
+			sample:int = min(int(np.searchsorted(self.sample_lengths, target_length, side='right')) - 1, len(self.sample_lengths) - 2)
+			sample_span:float = self.sample_lengths[sample + 1] - self.sample_lengths[sample]
+			sample_fraction:float = 0. if sample_span == 0 else (target_length - self.sample_lengths[sample]) / sample_span
+			curve, curve_sample = divmod(sample, ARC_LENGTH_SAMPLES)
+			t:float = (curve_sample + sample_fraction) / ARC_LENGTH_SAMPLES
+
+			start:int = curve * N_POINTS_PER_CUBIC_CURVE
+			stop:int = start + N_POINTS_PER_CUBIC_CURVE
+			buffer[:start] = self.full_points[:start]
+			# First half of the split of the partial curve at t (de Casteljau), as a matrix applied to its control points
+			s:float = 1 - t
+			matrix:np.ndarray = self.split_matrix
+			matrix[0, 0] = 1
+			matrix[1, 0], matrix[1, 1] = s, t
+			matrix[2, 0], matrix[2, 1], matrix[2, 2] = s * s, 2 * s * t, t * t
+			matrix[3, 0], matrix[3, 1], matrix[3, 2], matrix[3, 3] = s * s * s, 3 * s * s * t, 3 * s * t * t, t * t * t
+			np.dot(matrix, self.full_points[start:stop], out=buffer[start:stop])
+			buffer[stop:] = buffer[stop - 1]
+
+		mobject:VMobject = self.mobject
+		# The points are written in place, so circuit elements are told their points changed
+		if hasattr(mobject, '_points_version'):
+			mobject._points_version += 1
+
+# Drawable members of a mobject's family, in family order. Terminal anchors are never drawn partially.
+def _drawable_family(mobject:Mobject) -> list[VMobject]:
+	return [member for member in mobject.get_family()
+		if isinstance(member, VMobject) and not isinstance(member, _TerminalAnchors) and len(member.points) > 0]
+
+# Orders the members of a Circuit as one continuous stroke: breadth first from its first element, each element (or wire) is followed by the wires bound to it, and each wire by the members at its ends
+def _circuit_stroke_order(circuit:Mobject) -> list[Mobject]:
+	from manim_hkn.utils.netlist import Circuit
+	if not isinstance(circuit, Circuit):
+		return list(circuit.submobjects)
+	if circuit._topology_dirty:
+		circuit._build_topology()
+	# Members are indexed as in the circuit topology: elements first, then wires
+	members:list[Mobject] = [*circuit._elements, *circuit._wires]
+	wire_offset:int = len(circuit._elements)
+	indptr:np.ndarray = circuit._element_wire_indptr
+	neighbours:list[list[int]] = [[wire_offset + int(wire_index) for wire_index in circuit._element_wire_indices[indptr[owner]:indptr[owner + 1]]] for owner in range(len(members))]
+	for owner in range(len(members)):
+		for neighbour in neighbours[owner]:
+			if owner not in neighbours[neighbour]:
+				neighbours[neighbour].append(owner)
+
+	order:list[Mobject] = []
+	visited:list[bool] = [False] * len(members)
+	for root in range(len(members)):
+		if visited[root]:
+			continue
+		visited[root] = True
+		queue:deque[int] = deque((root,))
+		while queue:
+			member:int = queue.popleft()
+			order.append(members[member])
+			for neighbour in neighbours[member]:
+				if not visited[neighbour]:
+					visited[neighbour] = True
+					queue.append(neighbour)
+	ordered:set[int] = {id(member) for member in order}
+	order.extend(member for member in circuit.submobjects if id(member) not in ordered)
+	return order
+
+# Draws a mobject, or each mobject of a stroke order one after the other, with the pen moving at a constant speed along their curves
+class _ArcLengthCreate(Animation):
+	def __init__(self:"_ArcLengthCreate",
+			  mobject:Mobject,
+			  stroke_order:Iterable[Mobject] | None = None,
+			  reverse:bool = False,
+			  rate_func:Callable[[float], float] = smooth,
+			  **kwargs) -> None:
+		self._stroke_order:list[Mobject] | None = None if stroke_order is None else list(stroke_order)
+		self._reverse:bool = reverse
+		self._tracks:list[_StrokeTrack] = []
+		self._track_starts:np.ndarray = np.zeros(0)
+		self._track_lengths:np.ndarray = np.zeros(0)
+		super().__init__(mobject, rate_func=rate_func, **kwargs)
+
+	def begin(self:"_ArcLengthCreate") -> None:
+		members:list[Mobject] = self._stroke_order if self._stroke_order is not None else [self.mobject]
+		self._tracks = [_StrokeTrack(drawable) for member in members for drawable in _drawable_family(member)]
+		lengths:np.ndarray = np.array([track.length for track in self._tracks])
+		# Mobjects without any length still take their turn, in a negligible share of the stroke
+		if len(lengths) and lengths.sum() == 0:
+			lengths = np.ones(len(lengths))
+		self._track_lengths = lengths
+		self._track_starts = np.concatenate(([0.], np.cumsum(lengths)))[:-1] if len(lengths) else np.zeros(0)
+		super().begin()
+
+	# Every track keeps its own buffer, so no starting copy of the mobject is needed
+	def create_starting_mobject(self:"_ArcLengthCreate") -> Mobject:
+		return self.mobject
+
+	def interpolate_mobject(self:"_ArcLengthCreate", alpha:float) -> None:
+		if not self._tracks:
+			return
+		drawn:float = self.rate_func(alpha)
+		if self._reverse:
+			drawn = 1 - drawn
+		total:float = self._track_starts[-1] + self._track_lengths[-1]
+		pen:float = drawn * total
+		# Tracks before the pen are complete, tracks after it are empty, and only their states changing cause writes
+		current:int = int(np.searchsorted(self._track_starts, pen, side='right')) - 1
+		for index, track in enumerate(self._tracks):
+			if index < current:
+				track.draw(1.)
+			elif index > current:
+				track.draw(0.)
+			else:
+				track.draw((pen - self._track_starts[index]) / self._track_lengths[index] if self._track_lengths[index] > 0 else float(drawn >= 1))
+
+# Create animation of a single circuit element, paced by arc length across all of its curves
+class CreateElement(_ArcLengthCreate):
+	def __init__(self:"CreateElement", mobject:Mobject, lag_ratio:float = 0, introducer:bool = True, **kwargs) -> None:
+		super().__init__(mobject, lag_ratio=lag_ratio, introducer=introducer, **kwargs)
+
+class UncreateElement(_ArcLengthCreate):
+	def __init__(self:"UncreateElement", mobject:Mobject, lag_ratio:float = 0, remover:bool = True, **kwargs) -> None:
+		super().__init__(mobject, reverse=True, lag_ratio=lag_ratio, remover=remover, **kwargs)
+
+# Draws a whole circuit (or any group) in one continuous stroke: the elements and wires of a Circuit follow its connectivity, other groups their submobject order
+class CreateCircuit(_ArcLengthCreate):
+	def __init__(self:"CreateCircuit", mobject:Mobject, introducer:bool = True, **kwargs) -> None:
+		super().__init__(mobject, stroke_order=_circuit_stroke_order(mobject), introducer=introducer, **kwargs)
+
+class UncreateCircuit(_ArcLengthCreate):
+	def __init__(self:"UncreateCircuit", mobject:Mobject, remover:bool = True, **kwargs) -> None:
+		super().__init__(mobject, stroke_order=_circuit_stroke_order(mobject), reverse=True, remover=remover, **kwargs)
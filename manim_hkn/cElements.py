@@ -1,22 +1,120 @@
 """
 Specialized VMobjects for Circuit Elements, abbreviated as cElems.
 Custom VMobjects are all built entirely natively using VMobject Cubic Bezier Rendering
+The shape of each element is defined, without manim, in manim_hkn.elementGeometry, and drawn onto the element by generate_points.
 """
 
 from manim import VMobject
 from manim.animation.animation import override_animation
-from manim.animation.creation import Create, ShowPartial
-from manim.constants import LineJointType, CapStyleType, ORIGIN, PI, TAU, RIGHT, UP, LEFT, DOWN
+from manim.animation.creation import Create, Uncreate
+from manim.constants import LineJointType, CapStyleType
 from manim.utils.color.manim_colors import WHITE
 from manim.typing import Vector3D
-from manim_hkn.terminal import Terminal
+from manim_hkn.terminal import Terminal, _TerminalAnchors
+from manim_hkn.animations import CreateElement, UncreateElement
+from manim_hkn.geometryCache import geometry_cache
+from manim_hkn import geometry, elementGeometry
+import copy
+import enum
+import functools
+import weakref
 import numpy as np
 
+# Wraps a subclass generate_points definition such that the geometry is generated once per geometry key, and every later instance receives a copy of the cached points
+def _cached_generate_points(generate_points):
+	@functools.wraps(generate_points)
+	def wrapper(self:"_CircuitElementTemplate") -> None:
+		# Nested calls (a subclass calling super().generate_points()), regeneration of already populated elements, and uncacheable elements bypass the cache
+		if (self._generating_geometry
+			or len(self.points) != 0
+			or not self._cache_geometry
+			or not geometry_cache.enabled):
+			return generate_points(self)
+
+		key = self._get_geometry_key()
+		entry = geometry_cache.get(key)
+		if entry is not None:
+			# np.array always returns a plain in-memory array, also from memory-mapped entries loaded from the disk cache
+			self.points = np.array(entry.points)
+			return
+
+		self._generating_geometry = True
+		try:
+			generate_points(self)
+		finally:
+			self._generating_geometry = False
+		geometry_cache.put(key, self.points)
+	return wrapper
+
+# Attribute values which copies of a circuit element share without copying
+_IMMUTABLE_TYPES:tuple[type, ...] = (bool, int, float, str, type(None), enum.Enum)
+
+# Points shared copy-on-write between copies of a circuit element. Each mobject sharing them holds its own read-only view, which knows its
+# owner: in-place arithmetic (ex: the points += vector of Mobject.shift) returns a new array for the owner to store, and item assignment
+# first gives the owner a private copy of the points to write into. Any other write, ex: through a slice, fails on the read-only view.
+class _SharedPoints(np.ndarray):
+	_owner:weakref.ref | None = None
+
+	@staticmethod
+	def share(owner:VMobject, points:np.ndarray) -> "_SharedPoints":
+		view:_SharedPoints = np.asarray(points).view(_SharedPoints)
+		view.flags.writeable = False
+		view._owner = weakref.ref(owner)
+		return view
+
+	# Slices and other views of the shared points have no owner
+	def __array_finalize__(self:"_SharedPoints", obj) -> None:
+		self._owner = None
+
+	# Results of ufuncs and reductions are plain arrays
+	def __array_wrap__(self:"_SharedPoints", array:np.ndarray, context=None, return_scalar:bool = False):
+		array = array.view(np.ndarray)
+		return array[()] if return_scalar else array
+
+	def __reduce__(self:"_SharedPoints"):
+		return np.array(self).__reduce__()
+
+	def copy(self:"_SharedPoints", order:str = 'C') -> np.ndarray:
+		return np.array(self, order=order)
+
+	def __setitem__(self:"_SharedPoints", key, value) -> None:
+		owner:VMobject | None = None if self._owner is None else self._owner()
+		if self.flags.writeable or owner is None or owner.points is not self:
+			return super().__setitem__(key, value)
+		points:np.ndarray = np.array(self)
+		points[key] = value
+		owner.points = points
+
+	def _inplace(self:"_SharedPoints", ufunc:np.ufunc, other) -> np.ndarray:
+		return ufunc(self.view(np.ndarray), other)
+
+	def __iadd__(self:"_SharedPoints", other) -> np.ndarray:
+		return self._inplace(np.add, other)
+	def __isub__(self:"_SharedPoints", other) -> np.ndarray:
+		return self._inplace(np.subtract, other)
+	def __imul__(self:"_SharedPoints", other) -> np.ndarray:
+		return self._inplace(np.multiply, other)
+	def __itruediv__(self:"_SharedPoints", other) -> np.ndarray:
+		return self._inplace(np.true_divide, other)
+
 # Template class for all Cubic-Bezier Vectorized Circuit Elements
-class _CircuitElementTemplate(VMobject):
+class _CircuitElementTemplate(geometry.GeometryHelpers, VMobject):
+	# Names of the instance attributes, set before _CircuitElementTemplate.__init__ is called, which change the geometry generated by generate_points.
+	# Together with the class and reverse_points, these form the key under which the geometry is cached. None disables caching for the class entirely.
+	_GEOMETRY_KEY_ATTRS:tuple[str, ...] | None = ()
+	# Names of the instance attributes which are never modified in place, shared by reference between an element and its copies
+	_SHARED_ATTRS:tuple[str, ...] = ('_geometry', '_terminal_coords')
+	_generating_geometry:bool = False
+
+	def __init_subclass__(cls, **kwargs) -> None:
+		super().__init_subclass__(**kwargs)
+		if 'generate_points' in cls.__dict__:
+			cls.generate_points = _cached_generate_points(cls.__dict__['generate_points'])
+
 	def __init__(self: "_CircuitElementTemplate",
 			  terminalCoords: dict[str, list[float]],
 			  reverse_points: bool = False,
+			  cache_geometry: bool = True,
 			  **kwargs) -> None:
 		kwargs['stroke_width'] 	= kwargs.get('stroke_width', 	15)
 		kwargs['color'] 		= kwargs.get('color', 			WHITE)
@@ -24,129 +122,108 @@ class _CircuitElementTemplate(VMobject):
 		kwargs['cap_style'] 	= kwargs.get('cap_style', 		CapStyleType.ROUND)	
 		
 		self._terminal_scale_factor:float = 0.5
+		# Every terminal is a view onto the rows of a single hidden anchors submobject, which follows all transforms of the element
+		self._terminal_anchors:_TerminalAnchors = _TerminalAnchors(
+			[terminalCoords[terminal_name] for terminal_name in terminalCoords],
+			radius = kwargs['stroke_width'] * self._terminal_scale_factor / 30.)
 		self._terminals:dict[str, Terminal] = {
-			terminal_name:Terminal(radius = kwargs['stroke_width'] * self._terminal_scale_factor, point = terminalCoords[terminal_name])
+			terminal_name:Terminal(self._terminal_anchors, index)
 			
-			for terminal_name in terminalCoords
+			for index, terminal_name in enumerate(terminalCoords)
 		}
 
 		self._reverse_points = reverse_points
+		self._terminal_coords:dict[str, list[float]] = terminalCoords
+		self._cache_geometry:bool = cache_geometry and self._GEOMETRY_KEY_ATTRS is not None
 
 		VMobject.__init__(self,	**kwargs)
 		
-		self.add(*self._terminals.values())
+		self.add(self._terminal_anchors)
+
+		# From here on, the stroke width follows the size of the terminals (see _sync_stroke_width)
+		self._synced_terminal_width = self._get_terminal_width()
+		self._stroke_synced_version = self._points_version
+
+	# Every reassignment of the points (transforms applied to this element or to any group containing it, animations, geometry generation) increments _points_version.
+	# State derived from the geometry, such as the scale-following stroke width, is only recomputed when this version has changed, so static elements cost nothing per frame.
+	_points_version:int = 0
+	_stroke_synced_version:int | None = None
+
+	@property
+	def points(self:"_CircuitElementTemplate") -> np.ndarray:
+		return self._points
+	@points.setter
+	def points(self:"_CircuitElementTemplate", points:np.ndarray) -> None:
+		# Shared points of another mobject, ex: a slice of the points of a copy, get a view of their own
+		if isinstance(points, _SharedPoints) and (points._owner is None or points._owner() is not self):
+			points = _SharedPoints.share(self, points)
+		self._points = points
+		self._points_version += 1
+
+	# Copies share the points of the element and of its terminal anchors copy-on-write (see _SharedPoints), and the attributes named in
+	# _SHARED_ATTRS by reference. The rest, including styles, terminals and updaters, is deep-copied as by Mobject.copy.
+	def __deepcopy__(self:"_CircuitElementTemplate", memo:dict) -> "_CircuitElementTemplate":
+		anchors:_TerminalAnchors = self._terminal_anchors
+		# The points of the element are made read-only in place, which is not a change of its geometry, so its points version is kept
+		self._points = self._own_shared_points(self, self._points)
+		anchors.points = self._own_shared_points(anchors, anchors.points)
+		for value in (self._points, anchors.points, anchors.__dict__.get('_initial_coords'), *(self.__dict__.get(name) for name in self._SHARED_ATTRS)):
+			if value is not None:
+				memo[id(value)] = value
+		# As Mobject.__deepcopy__, without going through copy.deepcopy for the many immutable attributes of a mobject
+		result:_CircuitElementTemplate = self.__class__.__new__(self.__class__)
+		memo[id(self)] = result
+		for name, value in self.__dict__.items():
+			setattr(result, name, value if isinstance(value, _IMMUTABLE_TYPES) else copy.deepcopy(value, memo))
+		result.original_id = str(id(self))
+		result._points = _SharedPoints.share(result, self._points)
+		result._terminal_anchors.points = _SharedPoints.share(result._terminal_anchors, anchors.points)
+		return result
+
+	@staticmethod
+	def _own_shared_points(owner:VMobject, points:np.ndarray) -> "_SharedPoints":
+		if isinstance(points, _SharedPoints) and points._owner is not None and points._owner() is owner:
+			return points
+		return _SharedPoints.share(owner, points)
+
+	# The stroke width is read lazily, either through get_stroke_width by the renderer or directly by animations interpolating styles, and is synced to the current scale on read
+	@property
+	def stroke_width(self:"_CircuitElementTemplate") -> float:
+		if self._stroke_synced_version is not None and self._stroke_synced_version != self._points_version:
+			self._sync_stroke_width()
+		return self._stroke_width
+	@stroke_width.setter
+	def stroke_width(self:"_CircuitElementTemplate", width:float) -> None:
+		self._stroke_width = width
+
+	def _get_terminal_width(self:"_CircuitElementTemplate") -> float:
+		return next(iter(self._terminals.values())).width
+
+	# Rescales the stroke width with the element, only if a transformation since the last sync has actually changed the size of the terminals
+	def _sync_stroke_width(self:"_CircuitElementTemplate") -> None:
+		self._stroke_synced_version = self._points_version
+		terminal_width:float = self._get_terminal_width()
+		if terminal_width != self._synced_terminal_width:
+			self._synced_terminal_width = terminal_width
+			self._stroke_width = 100. * terminal_width / self._terminal_scale_factor
 
-		def _update_width(self:"_CircuitElementTemplate"):
-			VMobject.set_stroke(self, width=100.*list(self._terminals.values())[0].width / self._terminal_scale_factor)
-		self.add_updater(_update_width)
 	def generate_points(self:"_CircuitElementTemplate") -> None:
 		if self._reverse_points:
 			self.points = self.points[::-1]
 
-	# Set stroke override. With this, and the updater added to circuit elements in __init__, we enable scaling of an element to also scale the width accordingly, while also enabling scaling width in isolation.
+	# Returns the key identifying this element's geometry in the geometry cache
+	def _get_geometry_key(self:"_CircuitElementTemplate") -> tuple:
+		return (type(self), self._reverse_points) + tuple(getattr(self, attr) for attr in self._GEOMETRY_KEY_ATTRS)
+
+	# Set stroke override. With this, and the lazy stroke width sync above, we enable scaling of an element to also scale the width accordingly, while also enabling scaling width in isolation.
 	def set_stroke(self:"_CircuitElementTemplate", *args, width:float = None, **kwargs) -> "_CircuitElementTemplate":
 		if width is not None and width != 0.:
-			self._terminal_scale_factor = list(self._terminals.values())[0].width / (width/100.)
+			terminal_width:float = self._get_terminal_width()
+			self._terminal_scale_factor = terminal_width / (width/100.)
+			self._synced_terminal_width = terminal_width
+			self._stroke_width = width
 		return VMobject.set_stroke(self, *args, **kwargs)
 
-	# Helper methods which generate and add the necessary bezier curves to define some common geometries. These become extremely useful when generating complex geometries.
-	def _add_geom_arc(	self:"_CircuitElementTemplate",
-				   		start_angle:float	= 0,
-				   		angle:float 		= PI / 2,
-						center:list[float]	= ORIGIN,
-						radius:float = 1) -> None:
-		self._close_last_curve()
-		
-		num_components:int = int(9 * abs(start_angle - angle) / TAU) + 1
-		d_theta:float = angle / (num_components - 1.0)
-
-		anchors:list[list[float]] = np.array(
-        	radius * np.array([
-                np.cos(a) * RIGHT + np.sin(a) * UP
-                for a in np.linspace(
-                    start_angle,
-                    start_angle + angle,
-                    num_components,
-                )
-            ])
-        )
-		tangent_vectors:list[list[float]] = np.zeros(anchors.shape)
-		tangent_vectors[:, 1] = anchors[:, 0]
-		tangent_vectors[:, 0] = -anchors[:, 1]
-
-		anchors:list[list[float]] = [anchor + center for anchor in anchors]
-		handles1:list[list[float]] = anchors[:-1] + (d_theta / 3) * tangent_vectors[:-1]
-		handles2:list[list[float]] = anchors[1:] - (d_theta / 3) * tangent_vectors[1:]
-
-		arrays:list[list[list[float]]] = np.array([anchors[:-1], handles1, handles2, anchors[1:]])
-
-		for i in range(arrays.shape[1]):
-			self.add_cubic_bezier_curve(
-				arrays[0][i],
-				arrays[1][i],
-				arrays[2][i],
-				arrays[3][i]
-			)
-	def _add_geom_circle(	self:"_CircuitElementTemplate",
-							start_angle:float	= 0,
-							center:list[float]	= ORIGIN,
-							radius:float = 1) -> None:
-		self._add_geom_arc(start_angle, TAU, center, radius)
-	def _add_geom_elliptical_arc(	self:"_CircuitElementTemplate",
-									start_angle:float	= 0,
-									angle:float 		= PI / 2,
-									center:list[float]	= ORIGIN,
-									width:float = 2,
-									height:float = 1) -> None:
-		arc_start_index = len(self.points)
-		self._add_geom_arc(start_angle, angle, ORIGIN, radius = 0.5)
-		for i in range(arc_start_index, len(self.points)):
-			self.points[i][0] *= width
-			self.points[i][1] *= height
-			self.points[i] += center
-	def _add_geom_ellipse(	self:"_CircuitElementTemplate",
-							start_angle:float	= 0,
-							center:list[float]	= ORIGIN,
-							width:float = 2,
-							height:float = 1) -> None:
-		self._add_geom_elliptical_arc(start_angle, TAU, center, width, height)
-	def _add_geom_linear_path(	self:"_CircuitElementTemplate",
-						   		vertices:list[list[float]]) -> None:
-		self.start_new_path(np.array(vertices[0]))
-		self.add_points_as_corners([np.array(vertex) for vertex in vertices[1:]])
-	def _add_geom_polygram(	self:"_CircuitElementTemplate",
-							*vertex_groups:list[list[float]]) -> None:
-		for vertex_group in vertex_groups:
-			self._add_geom_linear_path(vertex_group)
-	def _add_geom_pointer(
-			self:"_CircuitElementTemplate",
-			tip_coord:list[float]=ORIGIN,
-			target_coord:list[float]=ORIGIN,
-			width:float=0.5,
-			length:float=0.7,
-			pointer_notch_depth_ratio:float=0.3) -> None:
-		triangle_direction_vector:list[float] = (np.array(target_coord)-np.array(tip_coord)) / np.linalg.norm(np.array(target_coord)-np.array(tip_coord))
-		triangle_orthogonal_vector:list[float] = np.array([triangle_direction_vector[1], -triangle_direction_vector[0], 0])
-		self._add_geom_linear_path([
-			tip_coord,
-			tip_coord
-				- triangle_direction_vector  * length
-				+ triangle_orthogonal_vector * width / 2,
-			tip_coord
-				- triangle_direction_vector  * length * (1 - pointer_notch_depth_ratio),
-			tip_coord
-				- triangle_direction_vector  * length
-				- triangle_orthogonal_vector * width / 2,
-			tip_coord
-		])
-
-	# When adding bezier curves and defining the geometry of a circuit element, this is a useful method to close any unclosed bezier curves in the internal points list.
-	def _close_last_curve(self:"_CircuitElementTemplate") -> None:
-		if len(self.points) % 4 != 0:
-			last_anchor = self.get_start_anchors()[-1]
-			for _ in range(4 - (len(self.points) % 4)):
-				self.append_points([last_anchor])
-
 	# Returns the coordinate of the specified terminal
 	def get_terminal_coord(self:"_CircuitElementTemplate", terminal_name: str) -> list[float]:
 		return self._terminals[terminal_name].get_center()
@@ -164,341 +241,266 @@ class _CircuitElementTemplate(VMobject):
 			) -> "_CircuitElementTemplate":
 		return self.shift(dest.get_terminal_coord(dest_terminal_name) - self.get_terminal_coord(source_terminal_name))
 
-	# Override the Create animation such that Terminals do not consume runtime. Not including this override causes a significant portion of the create animation runtime to be spent waiting, with no change on the screen due to invisible terminals
+	# Override the Create animation such that Terminals do not consume runtime, and the element is drawn at a constant speed along its curves. The arc-length tables are built once when the animation begins, so frames do not allocate.
 	@override_animation(Create)
-	def create(self, lag_ratio:float = 0, *args, **kwargs) -> ShowPartial:
-		return type('_Create_No_Lag', (ShowPartial,),{
-			'_get_bounds': lambda self, alpha: (0, alpha)
-		})(
-			self,
-			lag_ratio=lag_ratio,
-			introducer=True,
-			*args, **kwargs
-		)
+	def create(self, lag_ratio:float = 0, *args, **kwargs) -> CreateElement:
+		return CreateElement(self, lag_ratio=lag_ratio, *args, **kwargs)
+
+	@override_animation(Uncreate)
+	def uncreate(self, lag_ratio:float = 0, *args, **kwargs) -> UncreateElement:
+		return UncreateElement(self, lag_ratio=lag_ratio, *args, **kwargs)
 
 class CurrentSource(_CircuitElementTemplate):
+	_GEOMETRY_KEY_ATTRS:tuple[str, ...] = ('_terminal_wire_length',)
+
 	def __init__(self:"CurrentSource", **kwargs) -> None:
 		
 		kwargs['stroke_width'] = kwargs.get('stroke_width', 3) 
 		
-		self._circle_radius: float = 0.5
-		self._arrow_length: float = 0.35
-		self._arrow_head_length: float = 0.25
-		self._arrow_head_width: float = 0.15
-		
 		terminal_wire_length = kwargs.pop('terminal_wire_length', 0.25)
 		self._terminal_wire_length: float = terminal_wire_length
-		
-		terminal_coords = {
-			'top': [0, self._circle_radius + self._terminal_wire_length, 0],
-			'bottom': [0, -self._circle_radius - self._terminal_wire_length, 0]
-		}
+		self._geometry:elementGeometry.CurrentSourceGeometry = elementGeometry.CurrentSourceGeometry(terminal_wire_length)
 	
 		super().__init__(
-			terminalCoords=terminal_coords,
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 	
 	def generate_points(self:"CurrentSource") -> None:
-		# Draw the circle
-		self._add_geom_circle(
-			radius=self._circle_radius,
-			center=ORIGIN
-		)
-		
-		# Arrow shaft
-		self._add_geom_linear_path([
-			[0, -self._arrow_length, 0],
-			[0, self._arrow_length - self._arrow_head_length, 0]  # Stop before the arrow head
-		])
-		
-		# Arrow head
-		self._add_geom_pointer(
-			tip_coord=[0, self._arrow_length, 0],
-			target_coord=[0, self._arrow_length + self._arrow_head_length, 0],
-			width=self._arrow_head_width,
-			length=self._arrow_head_length,
-			pointer_notch_depth_ratio=0
-		)
-		
-		# Terminal wires
-		self._add_geom_linear_path([
-			[0, self._circle_radius, 0],
-			[0, self._circle_radius + self._terminal_wire_length, 0]
-		])
-		self._add_geom_linear_path([
-			[0, -self._circle_radius, 0],
-			[0, -self._circle_radius - self._terminal_wire_length, 0]
-		])
-		
+		self._geometry.draw(self)
 		super().generate_points()
 
 
 class OpAmp(_CircuitElementTemplate):
+	_GEOMETRY_KEY_ATTRS:tuple[str, ...] = ('_non_inverting_terminal_on_top', '_include_bias_terminals')
+
 	def __init__(self:"OpAmp", non_inverting_terminal_on_top:bool = True, include_bias_terminals:bool = False, **kwargs) -> None:
-		triangle_width:float = 3.5 / np.sqrt(3)
-		self._polygram:list[list[list[float]]] = [
-			# input terminals
-			[[-1.75, 1,0],[-2.75, 1, 0]],
-			[[-1.75,-1,0],[-2.75,-1, 0]],
-			# output terminal
-			[[ 1.75, 0,0],[ 2.75, 0, 0]],
-			# symbols
-			[[-1.25, -1.25 + 2.00 * non_inverting_terminal_on_top, 0], [-1.25, -0.75 + 2.00 * non_inverting_terminal_on_top, 0]],
-			[[-1.50, -1.00 + 2.00 * non_inverting_terminal_on_top, 0], [-1.00, -1.00 + 2.00 * non_inverting_terminal_on_top, 0]],
-			[[-1.50,  1.00 - 2.00 * non_inverting_terminal_on_top, 0], [-1.00,  1.00 - 2.00 * non_inverting_terminal_on_top, 0]],
-		]
-		# bias terminals
-		if include_bias_terminals:
-			self._polygram[3:3] = [
-				[[0, triangle_width/2, 0],[0, triangle_width/2 + 1, 0]],
-				[[0,-triangle_width/2, 0],[0, -triangle_width/2 - 1, 0]]
-			]
+		self._non_inverting_terminal_on_top:bool = non_inverting_terminal_on_top
+		self._include_bias_terminals:bool = include_bias_terminals
+		self._geometry:elementGeometry.OpAmpGeometry = elementGeometry.OpAmpGeometry(non_inverting_terminal_on_top, include_bias_terminals)
 
 		super().__init__(
-			terminalCoords={
-				'non-inverting input'	: self._polygram[0][1],
-				'inverting input'		: self._polygram[1][1],
-				'output'				: self._polygram[2][1]
-			} | ({
-				'V+'					: self._polygram[3][1],
-				'V-'					: self._polygram[4][1]
-			} if include_bias_terminals else {}),
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 
 	def generate_points(self:"OpAmp") -> None:
-		self._add_geom_pointer(
-			tip_coord	 = self._polygram[2][0],
-			target_coord = self._polygram[2][1],
-			width  = (self._polygram[2][0][0] - self._polygram[0][0][0]) * 2 / np.sqrt(3),
-			length =  self._polygram[2][0][0] - self._polygram[0][0][0],
-			pointer_notch_depth_ratio = 0
-		)
-		self._add_geom_polygram(*self._polygram)
+		self._geometry.draw(self)
 		super().generate_points()
 
 class BJT_NPN(_CircuitElementTemplate):
-	# Defines how far down the emmitter trace on the diagram the arrow tip is located
-	_ARROW_DIST_RATIO:float = 0.7
-	# Defines the width of the arrow (not including its stroke thickness) relative to the stroke width of the BJT
-	_ARROW_WIDTH_RATIO:float = 2.6
-	# Defines the length of the arrow (not including its stroke thickness) relative to the stroke width of the BJT
-	# Defined in terms of _ARROW_WIDTH_RATIO to make scaling easier
-	_ARROW_LENGTH_RATIO:float = 1.1 * _ARROW_WIDTH_RATIO
+	_ARROW_DIST_RATIO:float = elementGeometry.BJT_NPNGeometry.ARROW_DIST_RATIO
+	_ARROW_WIDTH_RATIO:float = elementGeometry.BJT_NPNGeometry.ARROW_WIDTH_RATIO
+	_ARROW_LENGTH_RATIO:float = elementGeometry.BJT_NPNGeometry.ARROW_LENGTH_RATIO
+	# The arrow dimensions are derived from the stroke width, so it is part of the geometry key
+	_GEOMETRY_KEY_ATTRS:tuple[str, ...] = ('stroke_width',)
 
 	def __init__(self:"BJT_NPN", **kwargs) -> None:
 		kwargs['joint_type'] 	= kwargs.get('joint_type', LineJointType.MITER)
-
-		# we split up each line segment into seperate disconnected segments, in order to round edges (using round cap styles) while maintaining the MITER joint type which is necessary for the sharp triangle.
-		self._polygram:list[list[list[float]]] = [
-			[[	-1.2,	0.8,	0], [	1.2,	0.8,	0]],
-			[[	0,		0.8,	0], [	0,		2.3,	0]],
-			[[	-0.8,	0.8,	0], [	-1.3,	-1,		0]],
-			[[	0.8,	0.8,	0], [	1.3,	-1,		0]],
-			[[	-1.3,	-1,		0], [	-2.5,	-1,		0]],
-			[[	1.3,	-1,		0], [	2.5,	-1,		0]]
-		]
+		self._geometry:elementGeometry.BJT_NPNGeometry = elementGeometry.BJT_NPNGeometry()
 
 		super().__init__(
-			terminalCoords={
-				'collector'	: self._polygram[-1][1],
-				'emitter'	: self._polygram[-2][1],
-				'gate'		: self._polygram[1][1]
-			},
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 	
 	def generate_points(self:"BJT_NPN") -> None:
-		# Main BJT Circle
-		self._add_geom_circle(radius=2)
-		# Main BJT Gate, Collector, Emitter geometry
-		self._add_geom_polygram(*self._polygram)
-		# Arrow indicating NPN BJT
-		self._add_geom_pointer(
-			tip_coord = (np.array(self._polygram[2][1])-np.array(self._polygram[2][0])) * BJT_NPN._ARROW_DIST_RATIO + self._polygram[2][0],
-			target_coord = self._polygram[2][1],
-			width = BJT_NPN._ARROW_WIDTH_RATIO * self.stroke_width / 100,
-			length = BJT_NPN._ARROW_LENGTH_RATIO * self.stroke_width / 100,
-			pointer_notch_depth_ratio = 0
-		)
+		self._geometry.draw(self, self.stroke_width)
 		super().generate_points()
 
 class Capacitor(_CircuitElementTemplate):
-	# This ratio is used for the following geometric equality: <Capacitor Height> = 2/3 * HEIGHT_RATIO * <Capacitor Width>
-	HEIGHT_RATIO:float = 1.5
+	HEIGHT_RATIO:float = elementGeometry.CapacitorGeometry.HEIGHT_RATIO
 
 	def __init__(self:"Capacitor", **kwargs) -> None:
-		# Define polygram for Capacitor shape
-		self._polygram:list[list[list[float]]]  = [
-			[
-				[-1.5, 0, 0],
-				[-0.5, 0, 0],
-				[-0.5, Capacitor.HEIGHT_RATIO, 0],
-				[-0.5, -Capacitor.HEIGHT_RATIO, 0]
-			],
-			[
-				[ 1.5, 0, 0],
-				[ 0.5, 0, 0],
-				[ 0.5, Capacitor.HEIGHT_RATIO, 0],
-				[ 0.5, -Capacitor.HEIGHT_RATIO, 0]
-			]
-		]
+		self._geometry:elementGeometry.CapacitorGeometry = elementGeometry.CapacitorGeometry()
 		
 		super().__init__(
-			terminalCoords={
-				'left'	: self._polygram[0][0],
-				'right'	: self._polygram[1][0]
-			},
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 		
 	def generate_points(self:"Capacitor") -> None:
-		self._add_geom_polygram(*self._polygram)
+		self._geometry.draw(self)
 		super().generate_points()
 
 class Inductor(_CircuitElementTemplate):
-	# This ratio is used for the following geometric equality: <Inductor Width> = 2 * SPREAD_RATIO * <Inductor Height>
-	# In other words, this is defined by SPREAD_RATIO = 0.5 * <Inductor Width> / <Inductor Height
-	SPREAD_RATIO:float = 1.6
-	# Width of the ellipses forming the upper half of the inductor
-	UPPER_ELLIPSE_SPREAD:float = 1.75
+	SPREAD_RATIO:float = elementGeometry.InductorGeometry.SPREAD_RATIO
+	UPPER_ELLIPSE_SPREAD:float = elementGeometry.InductorGeometry.UPPER_ELLIPSE_SPREAD
+
 	def __init__(self:"Inductor", **kwargs) -> None:
-		# Generating vertices for Resistor
-		self._polygram:list[list[list[float]]] = [
-			[[ -2 * Inductor.SPREAD_RATIO,  0, 0],[-1.5 * Inductor.SPREAD_RATIO,  0, 0]],
-			[[1.5 * Inductor.SPREAD_RATIO,  0, 0],[   2 * Inductor.SPREAD_RATIO,  0, 0]]
-		]
+		self._geometry:elementGeometry.InductorGeometry = elementGeometry.InductorGeometry()
 		super().__init__(
-			terminalCoords={
-				'left'	: self._polygram[0][0],
-				'right'	: self._polygram[1][1]
-			},
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 	
 	def generate_points(self:"Inductor") -> None:
-		self._add_geom_linear_path(self._polygram[0])
-
-		loop_width:float = (self._polygram[1][0][0] - self._polygram[0][1][0] - Inductor.UPPER_ELLIPSE_SPREAD) / 3
-
-		for i in range(-1,1+1,1):
-			self._add_geom_elliptical_arc(start_angle=PI, angle=-PI, center=RIGHT * (i - 0.5) * loop_width, width=Inductor.UPPER_ELLIPSE_SPREAD, height=2)
-			self._add_geom_elliptical_arc(start_angle=0, angle=-PI, center=RIGHT * (i - 0.0) * loop_width, width=Inductor.UPPER_ELLIPSE_SPREAD - loop_width, height=1.4)
-
-		self._add_geom_elliptical_arc(start_angle=PI, angle=-PI, center=RIGHT * 1.5 * loop_width, width=Inductor.UPPER_ELLIPSE_SPREAD, height=2)
-		self._add_geom_linear_path(self._polygram[1])
+		self._geometry.draw(self)
 		super().generate_points()
 
 class FunctionGenerator(_CircuitElementTemplate):
 	def __init__(self:"FunctionGenerator", **kwargs) -> None:
-		self._polygram = [
-			[[-2,0,0], [-1.5,0,0]],
-			[[ 1.5,0,0], [ 2,0,0]]
-		]
+		self._geometry:elementGeometry.FunctionGeneratorGeometry = elementGeometry.FunctionGeneratorGeometry()
 		super().__init__(
-			terminalCoords={
-				'left'	: self._polygram[0][0],
-				'right'	: self._polygram[1][1]
-			},
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 
 	def generate_points(self:"FunctionGenerator"):
-		self._add_geom_linear_path(self._polygram[0])
-		self._add_geom_circle(radius=1.5, start_angle=-PI)
-		self._add_geom_elliptical_arc(start_angle=3*PI/4, angle=-PI/2, center=[-0.75/np.sqrt(2),-2.5/np.sqrt(2),0], width = 1.5, height = 5)
-		self._add_geom_elliptical_arc(start_angle=-3*PI/4, angle=PI/2, center=[0.75/np.sqrt(2),2.5/np.sqrt(2),0], width = 1.5, height = 5)
-		self._add_geom_linear_path(self._polygram[1])
+		self._geometry.draw(self)
 
 class Battery(_CircuitElementTemplate):
 	def __init__(self:"Battery", **kwargs) -> None:
-		self._polygram:list[list[list[float]]] = [
-			[
-				[-2,0,0],
-				[-0.5,0,0],
-				[-0.5,1,0],
-				[-0.5,-1,0]
-			],[
-				[2,0,0],
-				[0.5,0,0],
-				[0.5,2,0],
-				[0.5,-2,0]
-			]
-		]
+		self._geometry:elementGeometry.BatteryGeometry = elementGeometry.BatteryGeometry()
 		super().__init__(
-			terminalCoords={
-				'positive'	: self._polygram[1][0],
-				'negative'	: self._polygram[0][0]
-			},
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 		
 	def generate_points(self) -> None:
-		self._add_geom_polygram(*self._polygram)
+		self._geometry.draw(self)
 		super().generate_points()
 
 
 class Ground(_CircuitElementTemplate):
 	def __init__(self:"Battery", **kwargs) -> None:
-		self._polygram:list[list[list[float]]] = [
-			[
-				[0,0,0],
-				[ 0,-0.5,0],
-				[-1,-0.5,0],
-				[+1,-0.5,0],
-			],[
-				[-0.66,-0.9,0],
-				[+0.66,-0.9,0],
-			],[
-				[-0.33,-1.3,0],
-				[+0.33,-1.3,0],
-			]
-		]
+		self._geometry:elementGeometry.GroundGeometry = elementGeometry.GroundGeometry()
 		super().__init__(
-			terminalCoords={
-				'ground'	: self._polygram[1][0]
-			},
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 		
 	def generate_points(self) -> None:
-		self._add_geom_polygram(*self._polygram)
+		self._geometry.draw(self)
 		super().generate_points()
 
 class Resistor(_CircuitElementTemplate):
-	# This ratio is used for the following geometric equality: <Resistor Width> = 2 * SPREAD_RATIO * <Resistor Height>
-	# In other words, this is defined by SPREAD_RATIO = 0.5 * <Resistor Width> / <Resistor Height
-	SPREAD_RATIO:float = 1.25
+	SPREAD_RATIO:float = elementGeometry.ResistorGeometry.SPREAD_RATIO
 
 	def __init__(self:"Resistor", **kwargs) -> None:
-		# Generating vertices for Resistor
-		self._vertices:list[list[float]] = [[Resistor.SPREAD_RATIO*(-2),  0, 0]]
-		for i in range(-1, 1+1, 1):
-			self._vertices.extend([ [Resistor.SPREAD_RATIO*(i-0.5),  0, 0],
-									[Resistor.SPREAD_RATIO*(i-0.25),  1, 0],
-									[Resistor.SPREAD_RATIO*(i+0.25), -1, 0],
-									[Resistor.SPREAD_RATIO*(i+0.5),  0, 0]])
-		self._vertices.append(		[Resistor.SPREAD_RATIO*(2),  0, 0])
+		self._geometry:elementGeometry.ResistorGeometry = elementGeometry.ResistorGeometry()
 
 		super().__init__(
-			terminalCoords={
-				'left'	: self._vertices[0],
-				'right'	: self._vertices[-1]
-			},
+			terminalCoords=self._geometry.terminal_coords,
 			**kwargs
 		)
 	
 	def generate_points(self:"Resistor") -> None:
-		self._add_geom_linear_path(self._vertices)
+		self._geometry.draw(self)
 		super().generate_points()
 
+# Template class for logic gates with any number of inputs, named 'input 1' to 'input n' from top to bottom, and an 'output' terminal.
+# Every gate of a type and input count shares one geometry definition with its terminal table, and its points come from the geometry cache.
+class _LogicGate(_CircuitElementTemplate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.LogicGateGeometry
+	_GEOMETRY_KEY_ATTRS:tuple[str, ...] = ('_input_count',)
+
+	def __init__(self:"_LogicGate", input_count:int = 2, **kwargs) -> None:
+		self._input_count:int = input_count
+		self._geometry:elementGeometry.LogicGateGeometry = elementGeometry.logic_gate_geometry(self._GEOMETRY_CLASS, input_count)
+		super().__init__(
+			terminalCoords=self._geometry.terminal_coords,
+			**kwargs
+		)
+
+	def generate_points(self:"_LogicGate") -> None:
+		self._geometry.draw(self)
+		super().generate_points()
+
+	@property
+	def input_count(self:"_LogicGate") -> int:
+		return self._input_count
+
+	def get_input_terminal_names(self:"_LogicGate") -> list[str]:
+		return [f'input {index + 1}' for index in range(self._input_count)]
+
+class AndGate(_LogicGate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.AndGateGeometry
+
+class NandGate(_LogicGate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.NandGateGeometry
+
+class OrGate(_LogicGate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.OrGateGeometry
+
+class NorGate(_LogicGate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.NorGateGeometry
+
+class XorGate(_LogicGate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.XorGateGeometry
+
+class XnorGate(_LogicGate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.XnorGateGeometry
+
+class NotGate(_LogicGate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.NotGateGeometry
+
+	def __init__(self:"NotGate", **kwargs) -> None:
+		super().__init__(1, **kwargs)
+
+class Buffer(_LogicGate):
+	_GEOMETRY_CLASS:type[elementGeometry.LogicGateGeometry] = elementGeometry.BufferGeometry
+
+	def __init__(self:"Buffer", **kwargs) -> None:
+		super().__init__(1, **kwargs)
+
+# Edge triggered D flip-flop, with the terminals 'D', 'clock', 'Q' and 'not Q'
+class DFlipFlop(_CircuitElementTemplate):
+	def __init__(self:"DFlipFlop", **kwargs) -> None:
+		self._geometry:elementGeometry.DFlipFlopGeometry = elementGeometry.DFlipFlopGeometry()
+		super().__init__(
+			terminalCoords=self._geometry.terminal_coords,
+			**kwargs
+		)
+
+	def generate_points(self:"DFlipFlop") -> None:
+		self._geometry.draw(self)
+		super().generate_points()
+
+# Counts Wire geometry regenerations. Once attached to a scene, the count is also recorded for every rendered frame.
+class WireRegenerationCounter:
+	def __init__(self:"WireRegenerationCounter") -> None:
+		self.total:int = 0
+		self.current_frame:int = 0
+		self.per_frame:list[int] = []
+
+	def increment(self:"WireRegenerationCounter") -> None:
+		self.total += 1
+		self.current_frame += 1
+
+	def end_frame(self:"WireRegenerationCounter") -> None:
+		self.per_frame.append(self.current_frame)
+		self.current_frame = 0
+
+	# Scene updaters run once per frame, after every mobject updater, which closes the count of the frame being rendered
+	def attach(self:"WireRegenerationCounter", scene) -> "WireRegenerationCounter":
+		scene.add_updater(lambda dt: self.end_frame())
+		return self
+
+	def reset(self:"WireRegenerationCounter") -> None:
+		self.total = 0
+		self.current_frame = 0
+		self.per_frame = []
+
 class Wire(_CircuitElementTemplate):
-	def __init__(self:"Wire", **kwargs) -> None:
+	# Wire geometry follows its bound terminals, so it is never cached
+	_GEOMETRY_KEY_ATTRS:tuple[str, ...] | None = None
+	# Shared by every wire, ex: Wire.regeneration_counter.attach(scene), then inspect Wire.regeneration_counter.per_frame
+	regeneration_counter:WireRegenerationCounter = WireRegenerationCounter()
+
+	# Only ever replaced, never modified in place
+	_SHARED_ATTRS:tuple[str, ...] = ('_waypoints', '_generated_coordinates')
+
+	def __init__(self:"Wire", waypoints:list[list[float]] | None = None, **kwargs) -> None:
 		self._target_coordinates:dict[str, list[float]] = {
 				'left'  : [-1, 0, 0],
 				'right' : [ 1, 0, 0]
 			}
+		# Fixed corners the wire passes through between its two terminals, ex: the bends of a routed wire. None for a straight wire.
+		self._waypoints:np.ndarray | None = None if waypoints is None or len(waypoints) == 0 else np.array(waypoints, dtype=float).reshape(-1, 3)
+		# Terminal coordinates the current geometry was generated from, and the points version right after generating it
+		self._generated_coordinates:np.ndarray | None = None
+		self._generated_version:int | None = None
 		
 		super().__init__(
 			terminalCoords=self._target_coordinates,
@@ -511,21 +513,77 @@ class Wire(_CircuitElementTemplate):
 
 		self.add_updater(Wire._update_shape, call_updater=True)
 
+	# Bound terminals belong to other elements, and are not copied with the wire: a copy stays bound to the same terminals, or to their
+	# copies if their elements were copied first within the same copy (ex: a group holding the elements, then the wire)
+	def __deepcopy__(self:"Wire", memo:dict) -> "Wire":
+		bindings:dict[str, list[Terminal]] = self._terminal_bindings
+		memo[id(bindings)] = bindings
+		result:Wire = super().__deepcopy__(memo)
+		result._terminal_bindings = {
+			key : [None if terminal is None else memo.get(id(terminal), terminal) for terminal in terminals] for key, terminals in bindings.items()
+		}
+		return result
+
+	# Resolves, axis by axis, the coordinate each wire terminal should sit at: the bound terminal's coordinate on bound axes, and the wire's own terminal elsewhere
+	def _resolve_coordinates(self:"Wire") -> tuple[np.ndarray, np.ndarray]:
+		own_coordinates:np.ndarray = np.array([terminal.get_center() for terminal in self._terminals.values()])
+		target_coordinates:np.ndarray = own_coordinates.copy()
+		for index, key in enumerate(self._terminals.keys()):
+			for axis, bound_terminal in enumerate(self._terminal_bindings[key]):
+				if bound_terminal is not None:
+					target_coordinates[index, axis] = bound_terminal.get_center()[axis]
+		return own_coordinates, target_coordinates
+
+	# The geometry is stale if a bound terminal moved, if one of the wire's terminals was moved off its target, or if the wire's points were changed since they were generated (ex: the wire was scaled, or transformed within a group)
+	def _is_shape_stale(self:"Wire", own_coordinates:np.ndarray, target_coordinates:np.ndarray) -> bool:
+		return (self._generated_version != self._points_version
+			or not np.array_equal(target_coordinates, self._generated_coordinates)
+			or not np.array_equal(own_coordinates, target_coordinates))
+
 	def _update_shape(self:"Wire") -> None:
+		own_coordinates, target_coordinates = self._resolve_coordinates()
+		if self._is_shape_stale(own_coordinates, target_coordinates):
+			self._apply_coordinates(target_coordinates)
+
+	# Moves the wire's terminals to the given coordinates and regenerates the path between them, in place whenever the number of curves is unchanged
+	def _apply_coordinates(self:"Wire", target_coordinates:np.ndarray, path_points:np.ndarray | None = None) -> None:
 		self._target_coordinates = {
-				key : np.array([(self._terminal_bindings[key][i] or self._terminals[key]).get_center()[i]
-				for i in range(3)])
-				for key in self._terminals.keys()}
-		for key in self._terminals.keys():
-			self._terminals[key].move_to(self._target_coordinates[key]) 
-		self.generate_points()
+				key : target_coordinates[index]
+				for index, key in enumerate(self._terminals.keys())}
+		for index, terminal in enumerate(self._terminals.values()):
+			offset:np.ndarray = target_coordinates[index] - terminal.get_center()
+			if offset.any():
+				terminal.shift(offset)
+
+		if path_points is None:
+			vertices:np.ndarray = self._path_vertices(target_coordinates)
+			path_points = geometry.linear_path_points(vertices)
+			if self._waypoints is not None:
+				self._waypoints = vertices[1:-1]
+		# Stored before generating, so that generate_points draws the path from them
+		self._generated_coordinates = target_coordinates
+		if self._reverse_points:
+			path_points = path_points[::-1]
+		if self.points.shape == path_points.shape:
+			# Same number of curves as before, so the existing point array is updated in place, unless it is shared with a copy
+			if self.points.flags.writeable:
+				self.points[:] = path_points
+				self._points_version += 1
+			else:
+				self.points = path_points
+		else:
+			self.generate_points()
+
+		self._generated_version = self._points_version
+		Wire.regeneration_counter.increment()
 
 	def bind_terminal(
 			self:"Wire", 
 			source_terminal:str, 
 			dest:_CircuitElementTemplate,
 			dest_terminal:str,
-			bind_axes=Vector3D) -> None:
+			bind_axes=Vector3D,
+			update_shape:bool = True) -> None:
 		if source_terminal not in self._terminal_bindings:
 			raise ValueError(f'Invalid Source Terminal: {source_terminal}.')
 		
@@ -535,11 +593,55 @@ class Wire(_CircuitElementTemplate):
 					raise ValueError(f'Invalid Axis: {bind_axes}, each element of the axis must be either 0 or 1.')
 				self._terminal_bindings[source_terminal][i] = dest._terminals[dest_terminal]
 
-		self._update_shape()
+		# Bulk builders (ex: a Circuit) bind every wire first, and resolve all wire geometries at once afterwards
+		if update_shape:
+			self._update_shape()
+
+	# Waypoints and terminal coordinates of the wire's current geometry. When the points were changed since they were generated as a whole
+	# (ex: the wire was shifted, scaled, rotated or animated, alone or within a group), they are read back from the corners of the points.
+	# Not while the wire is being animated, as its points may then be partial (ex: during Create).
+	def _generated_path(self:"Wire") -> tuple[np.ndarray | None, np.ndarray | None]:
+		if self._generated_version == self._points_version or self._generated_coordinates is None or self.updating_suspended:
+			return self._waypoints, self._generated_coordinates
+		curve_count:int = 1 if self._waypoints is None else len(self._waypoints) + 1
+		if len(self.points) != geometry.N_POINTS_PER_CUBIC_CURVE * curve_count:
+			return self._waypoints, self._generated_coordinates
+		points:np.ndarray = self.points[::-1] if self._reverse_points else self.points
+		vertices:np.ndarray = np.concatenate((points[::geometry.N_POINTS_PER_CUBIC_CURVE], points[-1:]))
+		return None if self._waypoints is None else vertices[1:-1], vertices[[0, -1]]
+
+	# Takes the current points as the generated geometry, ex: after an affine map was applied to them, which keeps their shape valid
+	def _sync_generated_path(self:"Wire") -> None:
+		if self._generated_coordinates is None:
+			return
+		self._waypoints, self._generated_coordinates = self._generated_path()
+		self._target_coordinates = {key : self._generated_coordinates[index] for index, key in enumerate(self._terminals.keys())}
+		self._generated_version = self._points_version
+
+	# Vertices of the wire's path for the given terminal coordinates: the two terminals, with the waypoints in between.
+	# When a terminal has moved since the path was last generated, the waypoint next to it follows it on the axes they shared, which keeps orthogonal end segments orthogonal.
+	def _path_vertices(self:"Wire", terminal_coordinates:np.ndarray) -> np.ndarray:
+		waypoints, previous_coordinates = self._generated_path()
+		if waypoints is None:
+			return terminal_coordinates
+		vertices:np.ndarray = np.concatenate((terminal_coordinates[:1], waypoints, terminal_coordinates[-1:]))
+		if previous_coordinates is not None and not np.array_equal(previous_coordinates, terminal_coordinates):
+			for end, neighbour in ((0, 1), (-1, -2)):
+				shared_axes:np.ndarray = np.isclose(vertices[neighbour], previous_coordinates[end])
+				vertices[neighbour][shared_axes] = terminal_coordinates[end][shared_axes]
+		return vertices
+
+	def set_waypoints(self:"Wire", waypoints:list[list[float]] | None) -> "Wire":
+		self._waypoints = None if waypoints is None or len(waypoints) == 0 else np.array(waypoints, dtype=float).reshape(-1, 3)
+		# The new waypoints are drawn as given, instead of following the terminals from the previous path
+		self._generated_coordinates = None
+		self.clear_points()
+		self.generate_points()
+		return self
 
 	def generate_points(self:"Wire") -> None:
 		self.clear_points()
-		self._add_geom_linear_path([self._target_coordinates[key] for key in self._terminals.keys()])
+		self._add_geom_linear_path(self._path_vertices(np.array([self._target_coordinates[key] for key in self._terminals.keys()], dtype=float)))
 		super().generate_points()
 
 	def set_terminal_coordinate(self:"Wire", key:str, coord:list[float]) -> "Wire":
@@ -547,4 +649,4 @@ class Wire(_CircuitElementTemplate):
 		self._terminals[key].shift(
 			self._target_coordinates[key] - 
 			self._terminals[key].get_center())
-		self._update_shape()
\ No newline at end of file
+		self._update_shape()
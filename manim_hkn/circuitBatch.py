@@ -0,0 +1,395 @@
+"""
+Compact representation of large circuits: one mobject holding the geometry of many circuit elements and wires.
+Every circuit element and Wire is a VMobject of its own, with its own points, style arrays, updaters and terminal anchors, so a schematic of
+thousands of elements is tens of thousands of Python objects and small arrays, all visited by the camera on every frame. A CircuitBatch
+stores the points of all of its members in one contiguous buffer, indexed by the offset of each member, and their stroke widths and colors
+as one array each. Members sharing a stroke are laid out next to each other, and each of these runs of the buffer is drawn by one layer
+submobject whose points are a view onto it, so the camera only visits one mobject per distinct stroke. The terminal anchors of all members
+are rows of the same buffer, after the curves, so terminals follow every transform and animation of the batch like element terminals do,
+and stroke widths follow its scale.
+Members are addressed by their index, in the order they were added, through lightweight BatchMember views, and are only rows of the
+buffer otherwise. Members copied from existing mobjects are a snapshot: wires of a batch no longer follow the terminals they were bound
+to, so batches suit static schematics, or schematics moved as a whole. Geometries can also be added with add_geometry, from the manim-free
+geometry of elementGeometry, without building any circuit element. Added members are staged, and laid out in the buffer at once the next
+time the batch is read.
+
+	batch = CircuitBatch(circuit)
+	resistor = batch.add_geometry('Resistor', position=[2, 0, 0])
+	resistor.set_stroke(color=RED)
+	self.play(batch.animate.scale(0.5))
+"""
+
+import functools
+from typing import Iterable, Sequence
+import numpy as np
+from manim import Mobject, VMobject
+from manim.animation.animation import override_animation
+from manim.animation.creation import Create, Uncreate
+from manim.constants import ORIGIN, LineJointType, CapStyleType
+from manim.typing import Point3D, Vector3D
+from manim.utils.color import ManimColor, ParsableManimColor, WHITE, color_to_rgba, rgba_to_color
+from manim_hkn import elementGeometry
+from manim_hkn.animations import CreateElement, UncreateElement
+from manim_hkn.cElements import _CircuitElementTemplate
+from manim_hkn.terminal import _TerminalAnchors, _ROWS_PER_TERMINAL, _CIRCLE_OFFSETS
+from manim_hkn.utils.netlist import Circuit
+
+# Terminal radius per unit of stroke width, as on circuit elements
+_TERMINAL_RADIUS_PER_WIDTH:float = 0.5 / 30.
+
+# Points of a view are the rows [_start, _stop) of its batch's buffer. Assigning points of the same length writes the buffer in place, and
+# points of another length (ex: partial animations) resize the run of the view within the buffer.
+class _BufferView:
+	_batch:"CircuitBatch | None" = None
+	_start:int = 0
+	_stop:int = 0
+
+	@property
+	def points(self) -> np.ndarray:
+		if self._batch is None:
+			return np.zeros((0, 3))
+		return self._batch._buffer[self._start:self._stop]
+	@points.setter
+	def points(self, points:np.ndarray) -> None:
+		# Ignored until the view is bound, ex: the points reset of VMobject.__init__
+		if self._batch is None:
+			return
+		if len(points) == self._stop - self._start:
+			self._batch._buffer[self._start:self._stop] = points
+		else:
+			self._batch._resize_view(self, np.asarray(points, dtype=float).reshape(-1, 3))
+
+# One run of members with the same stroke. Its stroke width is stored relative to the scale of the batch, and follows it.
+class _BatchLayer(_BufferView, VMobject):
+	def __init__(self:"_BatchLayer", batch:"CircuitBatch", start:int, stop:int, stroke_width:float, stroke_rgba:np.ndarray) -> None:
+		self._base_stroke_width:float = stroke_width
+		VMobject.__init__(self, fill_opacity=0, joint_type=LineJointType.ROUND, cap_style=CapStyleType.ROUND)
+		self._batch, self._start, self._stop = batch, start, stop
+		self._base_stroke_width = stroke_width
+		self.stroke_rgbas = np.array([stroke_rgba], dtype=float)
+
+	@property
+	def stroke_width(self:"_BatchLayer") -> float:
+		return self._base_stroke_width * (1. if self._batch is None else self._batch._stroke_scale())
+	@stroke_width.setter
+	def stroke_width(self:"_BatchLayer", width:float) -> None:
+		self._base_stroke_width = width / (1. if self._batch is None else self._batch._stroke_scale())
+
+# Terminal anchors of every member, in the order the members were added. Never drawn, whatever style is set on the batch.
+class _BatchTerminals(_BufferView, _TerminalAnchors):
+	def __init__(self:"_BatchTerminals", batch:"CircuitBatch", start:int, stop:int) -> None:
+		VMobject.__init__(self, stroke_width=0, fill_opacity=0, stroke_opacity=0)
+		self._batch, self._start, self._stop = batch, start, stop
+
+	def generate_points(self:"_BatchTerminals") -> None:
+		pass
+
+	# Only the invisible style set by the constructor, before the view is bound, is applied
+	def set_stroke(self:"_BatchTerminals", *args, **kwargs) -> "_BatchTerminals":
+		return self if self._batch is not None else VMobject.set_stroke(self, *args, **kwargs)
+
+	def set_fill(self:"_BatchTerminals", *args, **kwargs) -> "_BatchTerminals":
+		return self if self._batch is not None else VMobject.set_fill(self, *args, **kwargs)
+
+# Canonical points and terminal anchor rows of an element geometry, shared by every member added with the same parameters
+@functools.lru_cache(maxsize=None)
+def _geometry_rows(element_name:str, stroke_width:float, reverse_points:bool, parameters:tuple) -> tuple[np.ndarray, np.ndarray, tuple[str, ...]]:
+	points, terminal_coords = elementGeometry.element_points(element_name, stroke_width, reverse_points, **dict(parameters))
+	coords:np.ndarray = np.array(list(terminal_coords.values()), dtype=float).reshape(-1, 3)
+	rows:np.ndarray = (coords[:, None, :] + stroke_width * _TERMINAL_RADIUS_PER_WIDTH * _CIRCLE_OFFSETS[None, :, :]).reshape(-1, 3)
+	return np.asarray(points, dtype=float).reshape(-1, 3), rows, tuple(terminal_coords)
+
+# View onto one member of a batch. Members are compared by their batch and index.
+class BatchMember:
+	__slots__ = ('_batch', '_index')
+
+	def __init__(self:"BatchMember", batch:"CircuitBatch", index:int) -> None:
+		self._batch:CircuitBatch = batch
+		self._index:int = index
+
+	def __eq__(self:"BatchMember", other:object) -> bool:
+		return isinstance(other, BatchMember) and other._batch is self._batch and other._index == self._index
+
+	def __hash__(self:"BatchMember") -> int:
+		return hash((id(self._batch), self._index))
+
+	@property
+	def index(self:"BatchMember") -> int:
+		return self._index
+
+	@property
+	def terminal_names(self:"BatchMember") -> tuple[str, ...]:
+		return self._batch._terminal_names[self._index]
+
+	# Points of the member, a view onto the buffer of the batch: writing them moves the member
+	def get_points(self:"BatchMember") -> np.ndarray:
+		return self._batch._member_points(self._index)
+
+	def get_center(self:"BatchMember") -> Point3D:
+		points:np.ndarray = self.get_points()
+		return (points.min(axis=0) + points.max(axis=0)) / 2 if len(points) else np.zeros(3)
+
+	def get_terminal_coord(self:"BatchMember", terminal_name:str) -> Point3D:
+		return self._batch.get_terminal_coord(self._index, terminal_name)
+
+	def get_stroke_width(self:"BatchMember") -> float:
+		return self._batch._get_member_stroke(self._index)[0]
+
+	def get_stroke_color(self:"BatchMember") -> ManimColor:
+		return rgba_to_color(self._batch._get_member_stroke(self._index)[1])
+
+	def set_stroke(self:"BatchMember", color:ParsableManimColor | None = None, width:float | None = None, opacity:float | None = None) -> "BatchMember":
+		self._batch.set_member_stroke([self._index], color, width, opacity)
+		return self
+
+	def set_color(self:"BatchMember", color:ParsableManimColor) -> "BatchMember":
+		return self.set_stroke(color=color)
+
+	# Moves the member and its terminals alone
+	def shift(self:"BatchMember", *vectors:Vector3D) -> "BatchMember":
+		self._batch.shift_members([self._index], np.sum(np.asarray(vectors, dtype=float).reshape(-1, 3), axis=0))
+		return self
+
+class CircuitBatch(VMobject):
+	def __init__(self:"CircuitBatch", *mobjects:Mobject, **kwargs) -> None:
+		# Curves of every member, grouped by stroke, then the terminal anchors of every member
+		self._buffer:np.ndarray = np.zeros((0, 3))
+		self._layers:list[_BatchLayer] = []
+		self._terminals:_BatchTerminals | None = None
+		# Struct of arrays over the members: layer, start within the layer, point count, stroke, and terminal anchors
+		self._member_layers:np.ndarray = np.zeros(0, dtype=np.intp)
+		self._member_starts:np.ndarray = np.zeros(0, dtype=np.intp)
+		self._member_sizes:np.ndarray = np.zeros(0, dtype=np.intp)
+		# Stroke widths at the scale of the batch when it was first laid out
+		self._stroke_widths:np.ndarray = np.zeros(0)
+		self._stroke_rgbas:np.ndarray = np.zeros((0, 4))
+		# First terminal of every member, with a final entry past the last terminal
+		self._terminal_offsets:np.ndarray = np.zeros(1, dtype=np.intp)
+		# Terminal names of each member, shared between members with the same names
+		self._terminal_names:list[tuple[str, ...]] = []
+		self._name_tuples:dict[tuple[str, ...], tuple[str, ...]] = {}
+		self._reference_terminal_width:float | None = None
+		# Members added since the last layout, as (points, terminal rows, stroke width, stroke rgba)
+		self._staged:list[tuple[np.ndarray, np.ndarray, float, np.ndarray]] = []
+		super().__init__(**kwargs)
+		self.add_mobjects(*mobjects)
+
+	# Reading the submobjects, as the camera, transforms and animations do, lays out the staged members first
+	@property
+	def submobjects(self:"CircuitBatch") -> list[Mobject]:
+		if self.__dict__.get('_staged'):
+			self._layout()
+		return self._submobjects
+	@submobjects.setter
+	def submobjects(self:"CircuitBatch", submobjects:list[Mobject]) -> None:
+		self._submobjects = submobjects
+
+	def __len__(self:"CircuitBatch") -> int:
+		return len(self._terminal_names)
+
+	def __getitem__(self:"CircuitBatch", index:int) -> BatchMember:
+		if not -len(self) <= index < len(self):
+			raise IndexError(f'Invalid Member: {index}, the batch has {len(self)} members.')
+		return BatchMember(self, index % len(self))
+
+	@property
+	def members(self:"CircuitBatch") -> list[BatchMember]:
+		return [BatchMember(self, index) for index in range(len(self))]
+
+	def _stage(self:"CircuitBatch", points:np.ndarray, terminal_rows:np.ndarray, terminal_names:Iterable[str], stroke_width:float, stroke_rgba:np.ndarray) -> BatchMember:
+		names:tuple[str, ...] = tuple(terminal_names)
+		self._terminal_names.append(self._name_tuples.setdefault(names, names))
+		# Widths are stored relative to the current scale of the batch, as the layers read them
+		self._staged.append((points, terminal_rows, stroke_width / self._stroke_scale(), stroke_rgba))
+		return BatchMember(self, len(self._terminal_names) - 1)
+
+	# Adds a copy of the geometry, terminals and stroke of mobjects: circuit elements and wires, the elements then the wires of a Circuit,
+	# and any other VMobject with points. Groups are added member by member.
+	def add_mobjects(self:"CircuitBatch", *mobjects:Mobject) -> list[BatchMember]:
+		members:list[BatchMember] = []
+		for mobject in mobjects:
+			if isinstance(mobject, Circuit):
+				mobject.resolve()
+				members += self.add_mobjects(*mobject.elements, *mobject.wires)
+			elif isinstance(mobject, _CircuitElementTemplate):
+				members.append(self._stage(np.array(mobject.points, dtype=float), np.array(mobject._terminal_anchors.points, dtype=float),
+					mobject._terminals, mobject.get_stroke_width(), mobject.get_stroke_rgbas()[0]))
+			elif isinstance(mobject, CircuitBatch):
+				raise ValueError('Invalid Mobject: a CircuitBatch, batches are not nested.')
+			else:
+				if isinstance(mobject, VMobject) and len(mobject.points) > 0:
+					members.append(self._stage(np.array(mobject.points, dtype=float), np.zeros((0, 3)), (),
+						mobject.get_stroke_width(), mobject.get_stroke_rgbas()[0]))
+				members += self.add_mobjects(*mobject.submobjects)
+		return members
+
+	# Adds an element geometry of elementGeometry.ELEMENT_GEOMETRIES (ex: 'Resistor', or 'AndGate' with input_count=3) at the given
+	# position, without building a circuit element. The geometry is the one of the element with the same parameters.
+	def add_geometry(self:"CircuitBatch",
+				  element_name:str,
+				  position:Point3D = ORIGIN,
+				  stroke_width:float = elementGeometry.DEFAULT_STROKE_WIDTH,
+				  color:ParsableManimColor = WHITE,
+				  reverse_points:bool = False,
+				  **parameters) -> BatchMember:
+		points, terminal_rows, terminal_names = _geometry_rows(element_name, stroke_width, reverse_points, tuple(sorted(parameters.items())))
+		offset:np.ndarray = np.asarray(position, dtype=float)
+		return self._stage(points + offset, terminal_rows + offset, terminal_names, stroke_width, color_to_rgba(color))
+
+	# Scale of the batch since its first layout, measured on the anchors of its first terminal, like the stroke width of circuit elements
+	def _stroke_scale(self:"CircuitBatch") -> float:
+		if self._reference_terminal_width is None or self._terminals is None or self._terminals._stop - self._terminals._start < _ROWS_PER_TERMINAL:
+			return 1.
+		return self._terminals.get_terminal_width(0) / self._reference_terminal_width
+
+	# Appends the staged members, then lays out the buffer again, grouped by stroke
+	def _layout(self:"CircuitBatch") -> None:
+		staged, self._staged = self._staged, []
+		self._sync_strokes()
+		curves, terminal_rows = self._split_buffer()
+		curves += [points for points, _, _, _ in staged]
+		terminal_rows += [rows for _, rows, _, _ in staged]
+		sizes:np.ndarray = np.concatenate((self._member_sizes, [len(points) for points, _, _, _ in staged])).astype(np.intp)
+		self._stroke_widths = np.concatenate((self._stroke_widths, [width for _, _, width, _ in staged]))
+		self._stroke_rgbas = np.concatenate((self._stroke_rgbas, np.array([rgba for _, _, _, rgba in staged]).reshape(-1, 4)))
+		terminal_counts:np.ndarray = np.array([len(rows) // _ROWS_PER_TERMINAL for rows in terminal_rows], dtype=np.intp)
+		self._terminal_offsets = np.concatenate(([0], np.cumsum(terminal_counts)))
+		self._arrange(np.concatenate(curves) if curves else np.zeros((0, 3)), sizes, np.concatenate(terminal_rows) if terminal_rows else np.zeros((0, 3)))
+
+	# Points of every member and terminal rows of every member, in member order, from the current buffer
+	def _split_buffer(self:"CircuitBatch") -> tuple[list[np.ndarray], list[np.ndarray]]:
+		if len(self._member_sizes) == 0:
+			return [], []
+		curves:list[np.ndarray] = np.split(self._buffer[self._member_rows(np.arange(len(self._member_sizes)))], np.cumsum(self._member_sizes)[:-1])
+		rows:np.ndarray = self._terminals.points
+		terminal_rows:list[np.ndarray] = [rows[start * _ROWS_PER_TERMINAL:stop * _ROWS_PER_TERMINAL] for start, stop in zip(self._terminal_offsets[:-1], self._terminal_offsets[1:])]
+		return curves, terminal_rows
+
+	# Lays out the curves of the members (concatenated in member order) grouped by stroke, followed by the terminal rows, and builds one layer per stroke
+	def _arrange(self:"CircuitBatch", curves:np.ndarray, sizes:np.ndarray, terminal_rows:np.ndarray) -> None:
+		strokes:np.ndarray = np.column_stack((self._stroke_widths, self._stroke_rgbas))
+		unique_strokes, groups = np.unique(strokes, axis=0, return_inverse=True) if len(strokes) else (np.zeros((0, 5)), np.zeros(0, dtype=np.intp))
+		groups = groups.reshape(-1)
+		order:np.ndarray = np.argsort(groups, kind='stable')
+		# Rows of every member within curves, gathered in layer order
+		starts:np.ndarray = np.cumsum(sizes) - sizes
+		ordered_sizes:np.ndarray = sizes[order]
+		rows:np.ndarray = np.repeat(starts[order] - (np.cumsum(ordered_sizes) - ordered_sizes), ordered_sizes) + np.arange(ordered_sizes.sum())
+		self._buffer = np.concatenate((curves[rows], terminal_rows))
+
+		layer_sizes:np.ndarray = np.bincount(groups, weights=sizes, minlength=len(unique_strokes)).astype(np.intp)
+		layer_starts:np.ndarray = np.cumsum(layer_sizes) - layer_sizes
+		self._member_layers = groups.astype(np.intp)
+		self._member_sizes = sizes
+		# Start of every member within its layer: its start in the laid out curves, less the start of its layer
+		laid_out_starts:np.ndarray = np.empty(len(sizes), dtype=np.intp)
+		laid_out_starts[order] = np.cumsum(ordered_sizes) - ordered_sizes
+		self._member_starts = laid_out_starts - layer_starts[groups] if len(sizes) else laid_out_starts
+		self._layers = [_BatchLayer(self, int(start), int(start + size), float(stroke[0]), stroke[1:])
+			for start, size, stroke in zip(layer_starts, layer_sizes, unique_strokes)]
+		curve_rows:int = int(layer_sizes.sum())
+		self._terminals = _BatchTerminals(self, curve_rows, curve_rows + len(terminal_rows))
+		if self._reference_terminal_width is None and len(terminal_rows):
+			self._reference_terminal_width = self._terminals.get_terminal_width(0)
+		others:list[Mobject] = [mobject for mobject in self._submobjects if not isinstance(mobject, (_BatchLayer, _BatchTerminals))]
+		self._submobjects = [*self._layers, self._terminals, *others]
+
+	# Replaces the run of one view within the buffer by points of another length, moving the runs after it
+	def _resize_view(self:"CircuitBatch", view:_BufferView, points:np.ndarray) -> None:
+		difference:int = len(points) - (view._stop - view._start)
+		self._buffer = np.concatenate((self._buffer[:view._start], points, self._buffer[view._stop:]))
+		for other in [*self._layers, self._terminals]:
+			if other is not None and other is not view and other._batch is self and other._start >= view._stop:
+				other._start += difference
+				other._stop += difference
+		view._stop += difference
+
+	# Rows of the given members within the buffer, concatenated in the given order
+	def _member_rows(self:"CircuitBatch", indices:np.ndarray) -> np.ndarray:
+		layer_sizes:np.ndarray = np.bincount(self._member_layers, weights=self._member_sizes, minlength=len(self._layers)).astype(np.intp)
+		layer_starts:np.ndarray = np.array([layer._start for layer in self._layers], dtype=np.intp)
+		layer_stops:np.ndarray = np.array([layer._stop for layer in self._layers], dtype=np.intp)
+		layers:np.ndarray = np.unique(self._member_layers[indices])
+		if np.any(layer_stops[layers] - layer_starts[layers] != layer_sizes[layers]):
+			raise ValueError('Invalid Members: their layer does not hold their whole geometry, ex: while it is partially drawn.')
+		starts:np.ndarray = layer_starts[self._member_layers[indices]] + self._member_starts[indices]
+		sizes:np.ndarray = self._member_sizes[indices]
+		return np.repeat(starts - (np.cumsum(sizes) - sizes), sizes) + np.arange(sizes.sum())
+
+	def _member_points(self:"CircuitBatch", index:int) -> np.ndarray:
+		if self._staged:
+			self._layout()
+		rows:np.ndarray = self._member_rows(np.array([index]))
+		return self._buffer[rows[0]:rows[0] + len(rows)] if len(rows) else np.zeros((0, 3))
+
+	# Terminal rows of the given members, as indices into the buffer
+	def _terminal_rows(self:"CircuitBatch", indices:np.ndarray) -> np.ndarray:
+		starts:np.ndarray = self._terminal_offsets[indices] * _ROWS_PER_TERMINAL
+		counts:np.ndarray = self._terminal_offsets[indices + 1] * _ROWS_PER_TERMINAL - starts
+		return self._terminals._start + np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+
+	def get_terminal_coord(self:"CircuitBatch", index:int, terminal_name:str) -> Point3D:
+		if self._staged:
+			self._layout()
+		names:tuple[str, ...] = self._terminal_names[index]
+		if terminal_name not in names:
+			raise ValueError(f'Invalid Terminal: {terminal_name}, it must be one of {", ".join(names)}.')
+		return self._terminals.get_terminal_center(int(self._terminal_offsets[index]) + names.index(terminal_name))
+
+	# Coordinates of every terminal of every member, in member order, shape (terminals, 3)
+	def get_terminal_coords(self:"CircuitBatch") -> np.ndarray:
+		if self._staged:
+			self._layout()
+		rows:np.ndarray = self._terminals.points.reshape(-1, _ROWS_PER_TERMINAL, 3)
+		return (rows[:, 0] + rows[:, 3]) / 2
+
+	# Moves the given members and their terminals alone, in one gather over the buffer
+	def shift_members(self:"CircuitBatch", indices:Sequence[int], vector:Vector3D) -> "CircuitBatch":
+		if self._staged:
+			self._layout()
+		indices = np.unique(np.asarray(indices, dtype=np.intp))
+		self._buffer[np.concatenate((self._member_rows(indices), self._terminal_rows(indices)))] += np.asarray(vector, dtype=float)
+		return self
+
+	# Strokes set on the layers (ex: batch.set_color(RED), or animations of the batch) are copied back to the stroke arrays of their members
+	def _sync_strokes(self:"CircuitBatch") -> None:
+		for layer_index, layer in enumerate(self._layers):
+			members:np.ndarray = self._member_layers == layer_index
+			self._stroke_widths[members] = layer._base_stroke_width
+			self._stroke_rgbas[members] = layer.get_stroke_rgbas()[0]
+
+	def _get_member_stroke(self:"CircuitBatch", index:int) -> tuple[float, np.ndarray]:
+		if self._staged:
+			self._layout()
+		layer:_BatchLayer = self._layers[int(self._member_layers[index])]
+		return layer.stroke_width, np.array(layer.get_stroke_rgbas()[0])
+
+	# Sets the stroke of the given members, which moves them to the layer of their new stroke
+	def set_member_stroke(self:"CircuitBatch",
+					   indices:Sequence[int],
+					   color:ParsableManimColor | None = None,
+					   width:float | None = None,
+					   opacity:float | None = None) -> "CircuitBatch":
+		if self._staged:
+			self._layout()
+		indices = np.asarray(indices, dtype=np.intp)
+		self._sync_strokes()
+		if width is not None:
+			self._stroke_widths[indices] = width / self._stroke_scale()
+		if color is not None:
+			self._stroke_rgbas[indices, :3] = color_to_rgba(color)[:3]
+		if opacity is not None:
+			self._stroke_rgbas[indices, 3] = opacity
+		curves, terminal_rows = self._split_buffer()
+		self._arrange(np.concatenate(curves) if curves else np.zeros((0, 3)), self._member_sizes,
+			np.concatenate(terminal_rows) if terminal_rows else np.zeros((0, 3)))
+		return self
+
+	# Drawn at a constant speed along the curves of every layer, like circuit elements
+	@override_animation(Create)
+	def create(self:"CircuitBatch", lag_ratio:float = 0, *args, **kwargs) -> CreateElement:
+		return CreateElement(self, lag_ratio=lag_ratio, *args, **kwargs)
+
+	@override_animation(Uncreate)
+	def uncreate(self:"CircuitBatch", lag_ratio:float = 0, *args, **kwargs) -> UncreateElement:
+		return UncreateElement(self, lag_ratio=lag_ratio, *args, **kwargs)
@@ -0,0 +1,151 @@
+"""
+Animated current flow: charge particles moving along wires and circuit element paths.
+A CurrentFlow is a single point cloud mobject holding every particle. Each path (a Wire, or an element such as a Resistor, whose own curves
+are followed) is sampled once into an arc-length table of its cubic Bezier curves, and the tables of all paths are concatenated. Each
+particle only stores its path and its phase along it, as a fraction of the path length. A frame advances every phase by the speed of its
+path and evaluates every particle position at once: one binary search in the concatenated table, then one Bernstein evaluation of the
+curves found. The tables of a path are only rebuilt when its points change, so particles keep following wires as elements move.
+The speed along each path is its current multiplied by speed_per_unit_current, in scene units per second, and a negative current reverses
+the flow, relative to the direction of the path's points. The Cairo camera draws each particle as a square of stroke_width pixels a side,
+so its cost grows with the square of the stroke width, while the update of the positions does not depend on it.
+
+	flow = CurrentFlow(*circuit.wires, resistor, currents=1.5, particle_count=5000)
+	self.add(flow)
+	self.wait(4)
+	flow.set_current(resistor, -0.5)
+"""
+
+import zlib
+from typing import Sequence
+import numpy as np
+from manim import PMobject, VMobject
+from manim.utils.color import ParsableManimColor, YELLOW, color_to_rgba
+from manim_hkn import geometry
+
+# Chords per cubic curve in the arc-length tables
+ARC_LENGTH_SAMPLES:int = 8
+
+class CurrentFlow(PMobject):
+	def __init__(self:"CurrentFlow",
+			  *paths:VMobject,
+			  currents:float | Sequence[float] = 1.,
+			  particle_count:int = 1000,
+			  speed_per_unit_current:float = 1.,
+			  color:ParsableManimColor = YELLOW,
+			  stroke_width:float = 4,
+			  **kwargs) -> None:
+		if len(paths) == 0:
+			raise ValueError('Invalid Paths: (), a current flow needs at least one path.')
+		if particle_count < 0:
+			raise ValueError(f'Invalid Particle Count: {particle_count}.')
+		self._paths:list[VMobject] = list(paths)
+		self._path_indices:dict[int, int] = {id(path): index for index, path in enumerate(self._paths)}
+		self._currents:np.ndarray = np.broadcast_to(np.asarray(currents, dtype=float), (len(paths),)).copy()
+		self.speed_per_unit_current:float = speed_per_unit_current
+		# Arc-length table of every path, and the state of the points it was built from
+		self._path_states:list[tuple | None] = [None] * len(paths)
+		self._path_curves:list[np.ndarray] = [np.zeros((0, geometry.N_POINTS_PER_CUBIC_CURVE, 3))] * len(paths)
+		self._path_sample_lengths:list[np.ndarray] = [np.zeros(1)] * len(paths)
+		self._particle_paths:np.ndarray = np.zeros(0, dtype=np.intp)
+		self._phases:np.ndarray = np.zeros(0)
+		super().__init__(stroke_width=stroke_width, color=color, **kwargs)
+
+		self._refresh_tables()
+		self._distribute_particles(particle_count)
+		self.rgbas = np.repeat([color_to_rgba(color)], particle_count, axis=0)
+		self._update_positions()
+		self.add_updater(CurrentFlow._advance)
+
+	# Spreads the particles over the paths in proportion to their lengths, evenly spaced along each path
+	def _distribute_particles(self:"CurrentFlow", particle_count:int) -> None:
+		lengths:np.ndarray = self._path_lengths
+		weights:np.ndarray = lengths / lengths.sum() if lengths.sum() > 0 else np.full(len(lengths), 1 / len(lengths))
+		quotas:np.ndarray = weights * particle_count
+		counts:np.ndarray = np.floor(quotas).astype(np.intp)
+		# Largest remainders get the particles left over by rounding down
+		counts[np.argsort(counts - quotas)[:particle_count - counts.sum()]] += 1
+		self._particle_paths = np.repeat(np.arange(len(counts)), counts)
+		starts:np.ndarray = np.cumsum(counts) - counts
+		ranks:np.ndarray = np.arange(particle_count) - starts[self._particle_paths]
+		self._phases = (ranks + 0.5) / np.maximum(counts[self._particle_paths], 1)
+
+	# Rebuilds the arc-length tables of the paths whose points changed, and the concatenated lookup arrays of all paths
+	def _refresh_tables(self:"CurrentFlow") -> bool:
+		changed:bool = False
+		for index, path in enumerate(self._paths):
+			points:np.ndarray = np.ascontiguousarray(path.points)
+			state:tuple = (points.shape, zlib.crc32(points))
+			if state != self._path_states[index]:
+				self._path_states[index] = state
+				self._path_curves[index], self._path_sample_lengths[index] = geometry.arc_length_table(points, ARC_LENGTH_SAMPLES)
+				changed = True
+		if not changed:
+			return False
+
+		self._path_lengths:np.ndarray = np.array([sample_lengths[-1] for sample_lengths in self._path_sample_lengths])
+		# Every path's samples are laid end to end: sample k of path p spans [_sample_starts[k], _sample_ends[k]] past the path offset
+		offsets:np.ndarray = np.cumsum(self._path_lengths) - self._path_lengths
+		sample_counts:np.ndarray = np.array([len(sample_lengths) - 1 for sample_lengths in self._path_sample_lengths])
+		self._path_offsets:np.ndarray = offsets
+		self._first_samples:np.ndarray = np.cumsum(sample_counts) - sample_counts
+		self._last_samples:np.ndarray = self._first_samples + np.maximum(sample_counts, 1) - 1
+		# The placeholder sample past the last one keeps the ends sorted for the binary search
+		placeholder:np.ndarray = np.full(1, self._path_lengths.sum())
+		self._sample_starts:np.ndarray = np.concatenate([offset + sample_lengths[:-1] for offset, sample_lengths in zip(offsets, self._path_sample_lengths)] + [placeholder])
+		self._sample_ends:np.ndarray = np.concatenate([offset + sample_lengths[1:] for offset, sample_lengths in zip(offsets, self._path_sample_lengths)] + [placeholder])
+		self._curves:np.ndarray = np.concatenate(self._path_curves + [np.zeros((1, geometry.N_POINTS_PER_CUBIC_CURVE, 3))])
+		curve_counts:np.ndarray = np.array([len(curves) for curves in self._path_curves])
+		curve_offsets:np.ndarray = np.cumsum(curve_counts) - curve_counts
+		local_samples:np.ndarray = np.concatenate([np.arange(count) for count in sample_counts] + [np.zeros(1, dtype=np.intp)])
+		self._sample_curves:np.ndarray = np.concatenate([curve_offset + np.arange(count) // ARC_LENGTH_SAMPLES for curve_offset, count in zip(curve_offsets, sample_counts)] + [np.full(1, len(self._curves) - 1)]).astype(np.intp)
+		self._sample_t:np.ndarray = (local_samples % ARC_LENGTH_SAMPLES) / ARC_LENGTH_SAMPLES
+		# Paths without any curve keep their particles on the placeholder curve past the last sample
+		self._empty_paths:np.ndarray = sample_counts == 0
+		return True
+
+	# Moves every particle to its phase along its path, in one evaluation
+	def _update_positions(self:"CurrentFlow") -> None:
+		paths:np.ndarray = self._particle_paths
+		if len(paths) == 0:
+			self.points = np.zeros((0, 3))
+			return
+		positions:np.ndarray = self._path_offsets[paths] + self._phases * self._path_lengths[paths]
+		samples:np.ndarray = np.searchsorted(self._sample_ends, positions, side='left')
+		samples = np.clip(samples, self._first_samples[paths], self._last_samples[paths])
+		samples[self._empty_paths[paths]] = len(self._sample_ends) - 1
+		spans:np.ndarray = self._sample_ends[samples] - self._sample_starts[samples]
+		fractions:np.ndarray = np.divide(positions - self._sample_starts[samples], spans, out=np.zeros(len(paths)), where=spans > 0)
+		t:np.ndarray = self._sample_t[samples] + np.clip(fractions, 0, 1) / ARC_LENGTH_SAMPLES
+		self.points = np.einsum('nk,nkd->nd', geometry.cubic_bernstein_basis(t), self._curves[self._sample_curves[samples]])
+
+	# Time-based updater: advances every phase by the speed of its path, following the paths as they move
+	def _advance(self:"CurrentFlow", dt:float) -> None:
+		self._refresh_tables()
+		lengths:np.ndarray = self._path_lengths[self._particle_paths]
+		speeds:np.ndarray = self.speed_per_unit_current * self._currents[self._particle_paths]
+		self._phases = np.mod(self._phases + np.divide(speeds * dt, lengths, out=np.zeros(len(lengths)), where=lengths > 0), 1.)
+		self._update_positions()
+
+	def _get_path_index(self:"CurrentFlow", path:VMobject | int) -> int:
+		if isinstance(path, (int, np.integer)):
+			if not 0 <= path < len(self._paths):
+				raise ValueError(f'Invalid Path: {path}.')
+			return int(path)
+		if id(path) not in self._path_indices:
+			raise ValueError(f'Invalid Path: {path}, it is not a path of this current flow.')
+		return self._path_indices[id(path)]
+
+	def get_current(self:"CurrentFlow", path:VMobject | int) -> float:
+		return float(self._currents[self._get_path_index(path)])
+
+	# Sets the current through a path, given as the path mobject or its index
+	def set_current(self:"CurrentFlow", path:VMobject | int, current:float) -> "CurrentFlow":
+		self._currents[self._get_path_index(path)] = current
+		return self
+
+	def set_currents(self:"CurrentFlow", currents:float | Sequence[float]) -> "CurrentFlow":
+		self._currents = np.broadcast_to(np.asarray(currents, dtype=float), (len(self._paths),)).copy()
+		return self
+
+	def get_paths(self:"CurrentFlow") -> list[VMobject]:
+		return list(self._paths)
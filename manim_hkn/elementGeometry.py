@@ -0,0 +1,475 @@
+"""
+Geometry definitions of the circuit elements, in pure NumPy.
+Each definition holds the shape parameters of one element, its terminal coordinates, and a draw method adding its curves with the
+_add_geom_ helpers of manim_hkn.geometry. Circuit elements draw their definition onto themselves, while element_points draws it onto a
+PointsCanvas, which computes the canonical points and terminal coordinates of an element without importing manim.
+"""
+
+import abc
+import functools
+import numpy as np
+from manim_hkn.geometry import GeometryHelpers, PointsCanvas
+
+_RIGHT:np.ndarray = np.array([1., 0., 0.])
+# Stroke width of circuit elements when none is given, which sizes the arrow of BJT_NPN
+DEFAULT_STROKE_WIDTH:float = 15
+
+# Geometry classes without a draw method fail on instantiation
+class ElementGeometry(abc.ABC):
+	terminal_coords:dict[str, list[float]]
+
+	# Adds the curves of the element to the canvas, a circuit element or a PointsCanvas
+	@abc.abstractmethod
+	def draw(self:"ElementGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		...
+
+	# Canonical points of the element, as generated by the circuit element with the same parameters
+	def points(self:"ElementGeometry", stroke_width:float = DEFAULT_STROKE_WIDTH, reverse_points:bool = False) -> np.ndarray:
+		canvas = PointsCanvas()
+		self.draw(canvas, stroke_width)
+		return canvas.points[::-1] if reverse_points else canvas.points
+
+class CurrentSourceGeometry(ElementGeometry):
+	def __init__(self:"CurrentSourceGeometry", terminal_wire_length:float = 0.25) -> None:
+		self._circle_radius: float = 0.5
+		self._arrow_length: float = 0.35
+		self._arrow_head_length: float = 0.25
+		self._arrow_head_width: float = 0.15
+		self._terminal_wire_length: float = terminal_wire_length
+
+		self.terminal_coords = {
+			'top': [0, self._circle_radius + self._terminal_wire_length, 0],
+			'bottom': [0, -self._circle_radius - self._terminal_wire_length, 0]
+		}
+
+	def draw(self:"CurrentSourceGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		# Draw the circle
+		canvas._add_geom_circle(
+			radius=self._circle_radius,
+			center=np.zeros(3)
+		)
+
+		# Arrow shaft
+		canvas._add_geom_linear_path([
+			[0, -self._arrow_length, 0],
+			[0, self._arrow_length - self._arrow_head_length, 0]  # Stop before the arrow head
+		])
+
+		# Arrow head
+		canvas._add_geom_pointer(
+			tip_coord=[0, self._arrow_length, 0],
+			target_coord=[0, self._arrow_length + self._arrow_head_length, 0],
+			width=self._arrow_head_width,
+			length=self._arrow_head_length,
+			pointer_notch_depth_ratio=0
+		)
+
+		# Terminal wires
+		canvas._add_geom_linear_path([
+			[0, self._circle_radius, 0],
+			[0, self._circle_radius + self._terminal_wire_length, 0]
+		])
+		canvas._add_geom_linear_path([
+			[0, -self._circle_radius, 0],
+			[0, -self._circle_radius - self._terminal_wire_length, 0]
+		])
+
+class OpAmpGeometry(ElementGeometry):
+	def __init__(self:"OpAmpGeometry", non_inverting_terminal_on_top:bool = True, include_bias_terminals:bool = False) -> None:
+		triangle_width:float = 3.5 / np.sqrt(3)
+		self._polygram:list[list[list[float]]] = [
+			# input terminals
+			[[-1.75, 1,0],[-2.75, 1, 0]],
+			[[-1.75,-1,0],[-2.75,-1, 0]],
+			# output terminal
+			[[ 1.75, 0,0],[ 2.75, 0, 0]],
+			# symbols
+			[[-1.25, -1.25 + 2.00 * non_inverting_terminal_on_top, 0], [-1.25, -0.75 + 2.00 * non_inverting_terminal_on_top, 0]],
+			[[-1.50, -1.00 + 2.00 * non_inverting_terminal_on_top, 0], [-1.00, -1.00 + 2.00 * non_inverting_terminal_on_top, 0]],
+			[[-1.50,  1.00 - 2.00 * non_inverting_terminal_on_top, 0], [-1.00,  1.00 - 2.00 * non_inverting_terminal_on_top, 0]],
+		]
+		# bias terminals
+		if include_bias_terminals:
+			self._polygram[3:3] = [
+				[[0, triangle_width/2, 0],[0, triangle_width/2 + 1, 0]],
+				[[0,-triangle_width/2, 0],[0, -triangle_width/2 - 1, 0]]
+			]
+
+		self.terminal_coords = {
+			'non-inverting input'	: self._polygram[0][1],
+			'inverting input'		: self._polygram[1][1],
+			'output'				: self._polygram[2][1]
+		} | ({
+			'V+'					: self._polygram[3][1],
+			'V-'					: self._polygram[4][1]
+		} if include_bias_terminals else {})
+
+	def draw(self:"OpAmpGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		canvas._add_geom_pointer(
+			tip_coord	 = self._polygram[2][0],
+			target_coord = self._polygram[2][1],
+			width  = (self._polygram[2][0][0] - self._polygram[0][0][0]) * 2 / np.sqrt(3),
+			length =  self._polygram[2][0][0] - self._polygram[0][0][0],
+			pointer_notch_depth_ratio = 0
+		)
+		canvas._add_geom_polygram(*self._polygram)
+
+class BJT_NPNGeometry(ElementGeometry):
+	# Defines how far down the emmitter trace on the diagram the arrow tip is located
+	ARROW_DIST_RATIO:float = 0.7
+	# Defines the width of the arrow (not including its stroke thickness) relative to the stroke width of the BJT
+	ARROW_WIDTH_RATIO:float = 2.6
+	# Defines the length of the arrow (not including its stroke thickness) relative to the stroke width of the BJT
+	# Defined in terms of ARROW_WIDTH_RATIO to make scaling easier
+	ARROW_LENGTH_RATIO:float = 1.1 * ARROW_WIDTH_RATIO
+
+	def __init__(self:"BJT_NPNGeometry") -> None:
+		# we split up each line segment into seperate disconnected segments, in order to round edges (using round cap styles) while maintaining the MITER joint type which is necessary for the sharp triangle.
+		self._polygram:list[list[list[float]]] = [
+			[[	-1.2,	0.8,	0], [	1.2,	0.8,	0]],
+			[[	0,		0.8,	0], [	0,		2.3,	0]],
+			[[	-0.8,	0.8,	0], [	-1.3,	-1,		0]],
+			[[	0.8,	0.8,	0], [	1.3,	-1,		0]],
+			[[	-1.3,	-1,		0], [	-2.5,	-1,		0]],
+			[[	1.3,	-1,		0], [	2.5,	-1,		0]]
+		]
+
+		self.terminal_coords = {
+			'collector'	: self._polygram[-1][1],
+			'emitter'	: self._polygram[-2][1],
+			'gate'		: self._polygram[1][1]
+		}
+
+	def draw(self:"BJT_NPNGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		# Main BJT Circle
+		canvas._add_geom_circle(radius=2)
+		# Main BJT Gate, Collector, Emitter geometry
+		canvas._add_geom_polygram(*self._polygram)
+		# Arrow indicating NPN BJT
+		canvas._add_geom_pointer(
+			tip_coord = (np.array(self._polygram[2][1])-np.array(self._polygram[2][0])) * self.ARROW_DIST_RATIO + self._polygram[2][0],
+			target_coord = self._polygram[2][1],
+			width = self.ARROW_WIDTH_RATIO * stroke_width / 100,
+			length = self.ARROW_LENGTH_RATIO * stroke_width / 100,
+			pointer_notch_depth_ratio = 0
+		)
+
+class CapacitorGeometry(ElementGeometry):
+	# This ratio is used for the following geometric equality: <Capacitor Height> = 2/3 * HEIGHT_RATIO * <Capacitor Width>
+	HEIGHT_RATIO:float = 1.5
+
+	def __init__(self:"CapacitorGeometry") -> None:
+		# Define polygram for Capacitor shape
+		self._polygram:list[list[list[float]]]  = [
+			[
+				[-1.5, 0, 0],
+				[-0.5, 0, 0],
+				[-0.5, self.HEIGHT_RATIO, 0],
+				[-0.5, -self.HEIGHT_RATIO, 0]
+			],
+			[
+				[ 1.5, 0, 0],
+				[ 0.5, 0, 0],
+				[ 0.5, self.HEIGHT_RATIO, 0],
+				[ 0.5, -self.HEIGHT_RATIO, 0]
+			]
+		]
+
+		self.terminal_coords = {
+			'left'	: self._polygram[0][0],
+			'right'	: self._polygram[1][0]
+		}
+
+	def draw(self:"CapacitorGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		canvas._add_geom_polygram(*self._polygram)
+
+class InductorGeometry(ElementGeometry):
+	# This ratio is used for the following geometric equality: <Inductor Width> = 2 * SPREAD_RATIO * <Inductor Height>
+	# In other words, this is defined by SPREAD_RATIO = 0.5 * <Inductor Width> / <Inductor Height
+	SPREAD_RATIO:float = 1.6
+	# Width of the ellipses forming the upper half of the inductor
+	UPPER_ELLIPSE_SPREAD:float = 1.75
+
+	def __init__(self:"InductorGeometry") -> None:
+		self._polygram:list[list[list[float]]] = [
+			[[ -2 * self.SPREAD_RATIO,  0, 0],[-1.5 * self.SPREAD_RATIO,  0, 0]],
+			[[1.5 * self.SPREAD_RATIO,  0, 0],[   2 * self.SPREAD_RATIO,  0, 0]]
+		]
+		self.terminal_coords = {
+			'left'	: self._polygram[0][0],
+			'right'	: self._polygram[1][1]
+		}
+
+	def draw(self:"InductorGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		canvas._add_geom_linear_path(self._polygram[0])
+
+		loop_width:float = (self._polygram[1][0][0] - self._polygram[0][1][0] - self.UPPER_ELLIPSE_SPREAD) / 3
+
+		for i in range(-1,1+1,1):
+			canvas._add_geom_elliptical_arc(start_angle=np.pi, angle=-np.pi, center=_RIGHT * (i - 0.5) * loop_width, width=self.UPPER_ELLIPSE_SPREAD, height=2)
+			canvas._add_geom_elliptical_arc(start_angle=0, angle=-np.pi, center=_RIGHT * (i - 0.0) * loop_width, width=self.UPPER_ELLIPSE_SPREAD - loop_width, height=1.4)
+
+		canvas._add_geom_elliptical_arc(start_angle=np.pi, angle=-np.pi, center=_RIGHT * 1.5 * loop_width, width=self.UPPER_ELLIPSE_SPREAD, height=2)
+		canvas._add_geom_linear_path(self._polygram[1])
+
+class FunctionGeneratorGeometry(ElementGeometry):
+	def __init__(self:"FunctionGeneratorGeometry") -> None:
+		self._polygram = [
+			[[-2,0,0], [-1.5,0,0]],
+			[[ 1.5,0,0], [ 2,0,0]]
+		]
+		self.terminal_coords = {
+			'left'	: self._polygram[0][0],
+			'right'	: self._polygram[1][1]
+		}
+
+	def draw(self:"FunctionGeneratorGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		canvas._add_geom_linear_path(self._polygram[0])
+		canvas._add_geom_circle(radius=1.5, start_angle=-np.pi)
+		canvas._add_geom_elliptical_arc(start_angle=3*np.pi/4, angle=-np.pi/2, center=[-0.75/np.sqrt(2),-2.5/np.sqrt(2),0], width = 1.5, height = 5)
+		canvas._add_geom_elliptical_arc(start_angle=-3*np.pi/4, angle=np.pi/2, center=[0.75/np.sqrt(2),2.5/np.sqrt(2),0], width = 1.5, height = 5)
+		canvas._add_geom_linear_path(self._polygram[1])
+
+class BatteryGeometry(ElementGeometry):
+	def __init__(self:"BatteryGeometry") -> None:
+		self._polygram:list[list[list[float]]] = [
+			[
+				[-2,0,0],
+				[-0.5,0,0],
+				[-0.5,1,0],
+				[-0.5,-1,0]
+			],[
+				[2,0,0],
+				[0.5,0,0],
+				[0.5,2,0],
+				[0.5,-2,0]
+			]
+		]
+		self.terminal_coords = {
+			'positive'	: self._polygram[1][0],
+			'negative'	: self._polygram[0][0]
+		}
+
+	def draw(self:"BatteryGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		canvas._add_geom_polygram(*self._polygram)
+
+class GroundGeometry(ElementGeometry):
+	def __init__(self:"GroundGeometry") -> None:
+		self._polygram:list[list[list[float]]] = [
+			[
+				[0,0,0],
+				[ 0,-0.5,0],
+				[-1,-0.5,0],
+				[+1,-0.5,0],
+			],[
+				[-0.66,-0.9,0],
+				[+0.66,-0.9,0],
+			],[
+				[-0.33,-1.3,0],
+				[+0.33,-1.3,0],
+			]
+		]
+		self.terminal_coords = {
+			'ground'	: self._polygram[1][0]
+		}
+
+	def draw(self:"GroundGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		canvas._add_geom_polygram(*self._polygram)
+
+class ResistorGeometry(ElementGeometry):
+	# This ratio is used for the following geometric equality: <Resistor Width> = 2 * SPREAD_RATIO * <Resistor Height>
+	# In other words, this is defined by SPREAD_RATIO = 0.5 * <Resistor Width> / <Resistor Height
+	SPREAD_RATIO:float = 1.25
+
+	def __init__(self:"ResistorGeometry") -> None:
+		# Generating vertices for Resistor
+		self._vertices:list[list[float]] = [[self.SPREAD_RATIO*(-2),  0, 0]]
+		for i in range(-1, 1+1, 1):
+			self._vertices.extend([ [self.SPREAD_RATIO*(i-0.5),  0, 0],
+									[self.SPREAD_RATIO*(i-0.25),  1, 0],
+									[self.SPREAD_RATIO*(i+0.25), -1, 0],
+									[self.SPREAD_RATIO*(i+0.5),  0, 0]])
+		self._vertices.append(		[self.SPREAD_RATIO*(2),  0, 0])
+
+		self.terminal_coords = {
+			'left'	: self._vertices[0],
+			'right'	: self._vertices[-1]
+		}
+
+	def draw(self:"ResistorGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		canvas._add_geom_linear_path(self._vertices)
+
+# Distinctive shape logic gates with any number of inputs, from top to bottom. Inputs are spaced INPUT_PITCH apart, and when they span more
+# than the body, its input side is extended by straight lines. Gates are built through logic_gate_geometry, which shares one definition,
+# with its terminal table, between every gate of the same type and input count.
+class LogicGateGeometry(ElementGeometry):
+	# AND, OR, XOR, or NOT for the single input triangle
+	BODY:str = 'AND'
+	# Whether the output is negated by a bubble
+	INVERTED:bool = False
+	MIN_INPUTS:int = 2
+	MAX_INPUTS:int | None = None
+	HALF_HEIGHT:float = 1.25
+	HALF_WIDTH:float = 1.25
+	# x of the tip of OR and XOR bodies, longer than the round AND body
+	OR_TIP:float = 1.5
+	# Depth of the concave input side of OR and XOR bodies, and gap between it and the extra XOR curve
+	OR_BACK_DEPTH:float = 0.5
+	XOR_GAP:float = 0.4
+	TRIANGLE_HALF_SIZE:float = 1.
+	BUBBLE_RADIUS:float = 0.2
+	INPUT_PITCH:float = 1.
+	# x of the input and output terminals
+	LEAD_END:float = 2.5
+
+	def __init__(self:"LogicGateGeometry", input_count:int = 2) -> None:
+		if input_count < self.MIN_INPUTS or (self.MAX_INPUTS is not None and input_count > self.MAX_INPUTS):
+			raise ValueError(f'Invalid Input Count: {input_count}, {type(self).__name__[:-len("Geometry")]} takes {self.MIN_INPUTS}'
+				+ ('' if self.MAX_INPUTS == self.MIN_INPUTS else f' to {self.MAX_INPUTS or "any number of"}') + ' inputs.')
+		self._input_count:int = input_count
+		input_y:np.ndarray = self.INPUT_PITCH * ((input_count - 1) / 2 - np.arange(input_count))
+		# Terminal table: one row per input, then the output
+		self.terminal_table:np.ndarray = np.zeros((input_count + 1, 3))
+		self.terminal_table[:-1, 0] = -self.LEAD_END
+		self.terminal_table[:-1, 1] = input_y
+		self.terminal_table[-1, 0] = self.LEAD_END
+		self.terminal_table.flags.writeable = False
+		self.terminal_coords = {f'input {index + 1}': self.terminal_table[index] for index in range(input_count)} | {'output': self.terminal_table[-1]}
+
+		# Input leads end on the input side of the body, output leads start past the tip and its bubble
+		back_x:np.ndarray = np.full(input_count, -self.TRIANGLE_HALF_SIZE if self.BODY == 'NOT' else -self.HALF_WIDTH)
+		if self.BODY in ('OR', 'XOR'):
+			inside:np.ndarray = np.abs(input_y) < self.HALF_HEIGHT
+			back_x[inside] += self.OR_BACK_DEPTH * np.sqrt(1 - (input_y[inside] / self.HALF_HEIGHT) ** 2)
+		self._tip_x:float = {'AND': self.HALF_WIDTH, 'OR': self.OR_TIP, 'XOR': self.OR_TIP, 'NOT': self.TRIANGLE_HALF_SIZE}[self.BODY]
+		output_start:float = self._tip_x + 2 * self.BUBBLE_RADIUS * self.INVERTED
+		self._leads:list[list[list[float]]] = [[[-self.LEAD_END, y, 0], [x, y, 0]] for x, y in zip(back_x, input_y)] + [[[output_start, 0, 0], [self.LEAD_END, 0, 0]]]
+		extension:float = input_y[0] if self.BODY != 'NOT' else 0.
+		if extension > self.HALF_HEIGHT:
+			self._leads += [[[-self.HALF_WIDTH, sign * self.HALF_HEIGHT, 0], [-self.HALF_WIDTH, sign * extension, 0]] for sign in (1, -1)]
+
+	def draw(self:"LogicGateGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		half_height:float = self.HALF_HEIGHT
+		half_width:float = self.HALF_WIDTH
+		if self.BODY == 'AND':
+			canvas._add_geom_linear_path([[0, -half_height, 0], [-half_width, -half_height, 0], [-half_width, half_height, 0], [0, half_height, 0]])
+			canvas._add_geom_arc(start_angle=np.pi / 2, angle=-np.pi, radius=half_height)
+		elif self.BODY == 'NOT':
+			size:float = self.TRIANGLE_HALF_SIZE
+			canvas._add_geom_linear_path([[-size, size, 0], [size, 0, 0], [-size, -size, 0], [-size, size, 0]])
+		else:
+			# Each side of the pointed front is an arc from a corner of the input side, where it is horizontal, to the tip.
+			# Both are drawn from the corner, as the number of curves of _add_geom_arc follows the difference of its start angle and angle.
+			radius:float = ((self.OR_TIP + half_width) ** 2 + half_height ** 2) / (2 * half_height)
+			tip_angle:float = np.arctan2(radius - half_height, self.OR_TIP + half_width)
+			canvas._add_geom_arc(start_angle=np.pi / 2, angle=tip_angle - np.pi / 2, center=[-half_width, half_height - radius, 0], radius=radius)
+			canvas._add_geom_arc(start_angle=-np.pi / 2, angle=np.pi / 2 - tip_angle, center=[-half_width, radius - half_height, 0], radius=radius)
+			canvas._add_geom_elliptical_arc(start_angle=-np.pi / 2, angle=np.pi, center=[-half_width, 0, 0], width=2 * self.OR_BACK_DEPTH, height=2 * half_height)
+			if self.BODY == 'XOR':
+				canvas._add_geom_elliptical_arc(start_angle=-np.pi / 2, angle=np.pi, center=[-half_width - self.XOR_GAP, 0, 0], width=2 * self.OR_BACK_DEPTH, height=2 * half_height)
+		if self.INVERTED:
+			canvas._add_geom_circle(start_angle=np.pi, center=[self._tip_x + self.BUBBLE_RADIUS, 0, 0], radius=self.BUBBLE_RADIUS)
+		canvas._add_geom_polygram(*self._leads)
+
+class AndGateGeometry(LogicGateGeometry):
+	BODY:str = 'AND'
+
+class NandGateGeometry(LogicGateGeometry):
+	BODY:str = 'AND'
+	INVERTED:bool = True
+
+class OrGateGeometry(LogicGateGeometry):
+	BODY:str = 'OR'
+
+class NorGateGeometry(LogicGateGeometry):
+	BODY:str = 'OR'
+	INVERTED:bool = True
+
+class XorGateGeometry(LogicGateGeometry):
+	BODY:str = 'XOR'
+
+class XnorGateGeometry(LogicGateGeometry):
+	BODY:str = 'XOR'
+	INVERTED:bool = True
+
+class NotGateGeometry(LogicGateGeometry):
+	BODY:str = 'NOT'
+	INVERTED:bool = True
+	MIN_INPUTS:int = 1
+	MAX_INPUTS:int | None = 1
+
+	def __init__(self:"NotGateGeometry", input_count:int = 1) -> None:
+		super().__init__(input_count)
+
+class BufferGeometry(NotGateGeometry):
+	INVERTED:bool = False
+
+# Geometry definitions are never modified once built, so every gate of a type and input count shares one
+@functools.lru_cache(maxsize=None)
+def logic_gate_geometry(geometry_class:type[LogicGateGeometry], input_count:int) -> LogicGateGeometry:
+	return geometry_class(input_count)
+
+# Edge triggered D flip-flop: a box with the D and clock inputs on the left, the clock marked by a wedge, and Q and its complement, negated by a bubble, on the right
+class DFlipFlopGeometry(ElementGeometry):
+	HALF_WIDTH:float = 1.25
+	HALF_HEIGHT:float = 1.75
+	CLOCK_WEDGE_SIZE:float = 0.35
+	BUBBLE_RADIUS:float = LogicGateGeometry.BUBBLE_RADIUS
+	LEAD_END:float = LogicGateGeometry.LEAD_END
+
+	def __init__(self:"DFlipFlopGeometry") -> None:
+		self.terminal_coords = {
+			'D'			: [-self.LEAD_END,  1, 0],
+			'clock'		: [-self.LEAD_END, -1, 0],
+			'Q'			: [ self.LEAD_END,  1, 0],
+			'not Q'		: [ self.LEAD_END, -1, 0]
+		}
+
+	def draw(self:"DFlipFlopGeometry", canvas:GeometryHelpers, stroke_width:float = DEFAULT_STROKE_WIDTH) -> None:
+		half_width:float = self.HALF_WIDTH
+		half_height:float = self.HALF_HEIGHT
+		wedge:float = self.CLOCK_WEDGE_SIZE
+		canvas._add_geom_linear_path([[-half_width, half_height, 0], [half_width, half_height, 0], [half_width, -half_height, 0], [-half_width, -half_height, 0], [-half_width, half_height, 0]])
+		canvas._add_geom_linear_path([[-half_width, -1 + wedge, 0], [-half_width + wedge, -1, 0], [-half_width, -1 - wedge, 0]])
+		canvas._add_geom_circle(start_angle=np.pi, center=[half_width + self.BUBBLE_RADIUS, -1, 0], radius=self.BUBBLE_RADIUS)
+		canvas._add_geom_polygram(
+			[[-self.LEAD_END,  1, 0], [-half_width,  1, 0]],
+			[[-self.LEAD_END, -1, 0], [-half_width, -1, 0]],
+			[[ half_width,  1, 0], [self.LEAD_END,  1, 0]],
+			[[ half_width + 2 * self.BUBBLE_RADIUS, -1, 0], [self.LEAD_END, -1, 0]])
+
+# Geometry definition of every circuit element, by element class name
+ELEMENT_GEOMETRIES:dict[str, type[ElementGeometry]] = {
+	'CurrentSource'		: CurrentSourceGeometry,
+	'OpAmp'				: OpAmpGeometry,
+	'BJT_NPN'			: BJT_NPNGeometry,
+	'Capacitor'			: CapacitorGeometry,
+	'Inductor'			: InductorGeometry,
+	'FunctionGenerator'	: FunctionGeneratorGeometry,
+	'Battery'			: BatteryGeometry,
+	'Ground'			: GroundGeometry,
+	'Resistor'			: ResistorGeometry,
+	'AndGate'			: AndGateGeometry,
+	'NandGate'			: NandGateGeometry,
+	'OrGate'			: OrGateGeometry,
+	'NorGate'			: NorGateGeometry,
+	'XorGate'			: XorGateGeometry,
+	'XnorGate'			: XnorGateGeometry,
+	'NotGate'			: NotGateGeometry,
+	'Buffer'			: BufferGeometry,
+	'DFlipFlop'			: DFlipFlopGeometry
+}
+
+# Returns the canonical points and terminal coordinates of the named circuit element, ex: element_points('OpAmp', include_bias_terminals=True)
+def element_points(
+		element_name:str,
+		stroke_width:float = DEFAULT_STROKE_WIDTH,
+		reverse_points:bool = False,
+		**parameters) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+	if element_name not in ELEMENT_GEOMETRIES:
+		raise ValueError(f'Invalid Element: {element_name}, it must be one of {", ".join(ELEMENT_GEOMETRIES)}.')
+	element_geometry:ElementGeometry = ELEMENT_GEOMETRIES[element_name](**parameters)
+	# FunctionGenerator has never applied reverse_points to its geometry
+	reverse_points = reverse_points and element_name != 'FunctionGenerator'
+	return element_geometry.points(stroke_width, reverse_points), {
+		terminal_name: np.array(coord, dtype=float) for terminal_name, coord in element_geometry.terminal_coords.items()}
@@ -0,0 +1,206 @@
+"""
+Batched NumPy kernels generating the cubic Bezier point blocks of common circuit element geometries.
+Every kernel returns a (4n, 3) array holding n cubic Bezier curves (anchor, handle, handle, anchor), ready to be appended to a VMobject
+in a single append_points call. The _add_geom_ helpers drawing element geometries from these kernels are defined here as well, on
+GeometryHelpers, which both circuit elements and the plain PointsCanvas inherit. Nothing in this module depends on manim.
+"""
+
+import numpy as np
+
+N_POINTS_PER_CUBIC_CURVE:int = 4
+_ORIGIN:np.ndarray = np.zeros(3)
+
+# Interleaves the four control point arrays of n curves into a single (4n, 3) block
+def _interleave_curves(
+		anchors1:np.ndarray,
+		handles1:np.ndarray,
+		handles2:np.ndarray,
+		anchors2:np.ndarray) -> np.ndarray:
+	block:np.ndarray = np.empty((N_POINTS_PER_CUBIC_CURVE * len(anchors1), 3))
+	block[0::N_POINTS_PER_CUBIC_CURVE] = anchors1
+	block[1::N_POINTS_PER_CUBIC_CURVE] = handles1
+	block[2::N_POINTS_PER_CUBIC_CURVE] = handles2
+	block[3::N_POINTS_PER_CUBIC_CURVE] = anchors2
+	return block
+
+# Bezier approximation of a circular arc, matching the number of components and handle lengths historically used by _add_geom_arc
+def arc_points(
+		start_angle:float	= 0,
+		angle:float 		= np.pi / 2,
+		center:list[float]	= (0, 0, 0),
+		radius:float = 1) -> np.ndarray:
+	num_components:int = int(9 * abs(start_angle - angle) / (2 * np.pi)) + 1
+	d_theta:float = angle / (num_components - 1.0)
+
+	thetas:np.ndarray = np.linspace(start_angle, start_angle + angle, num_components)
+	anchors:np.ndarray = np.zeros((num_components, 3))
+	anchors[:, 0] = radius * np.cos(thetas)
+	anchors[:, 1] = radius * np.sin(thetas)
+
+	tangent_vectors:np.ndarray = np.zeros(anchors.shape)
+	tangent_vectors[:, 0] = -anchors[:, 1]
+	tangent_vectors[:, 1] = anchors[:, 0]
+
+	anchors += np.asarray(center, dtype=float)
+	return _interleave_curves(
+		anchors[:-1],
+		anchors[:-1] + (d_theta / 3) * tangent_vectors[:-1],
+		anchors[1:] - (d_theta / 3) * tangent_vectors[1:],
+		anchors[1:]
+	)
+
+# Bezier approximation of an elliptical arc, produced by stretching an arc of diameter 1 to the given width and height
+def elliptical_arc_points(
+		start_angle:float	= 0,
+		angle:float 		= np.pi / 2,
+		center:list[float]	= (0, 0, 0),
+		width:float = 2,
+		height:float = 1) -> np.ndarray:
+	block:np.ndarray = arc_points(start_angle, angle, (0, 0, 0), radius = 0.5)
+	block[:, 0] *= width
+	block[:, 1] *= height
+	block += np.asarray(center, dtype=float)
+	return block
+
+# Straight line segments through the given vertices, with handles at thirds so each curve is a straight line
+def linear_path_points(vertices:list[list[float]]) -> np.ndarray:
+	vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+	start_corners:np.ndarray = vertices[:-1]
+	end_corners:np.ndarray = vertices[1:]
+	t_values:np.ndarray = np.linspace(0, 1, N_POINTS_PER_CUBIC_CURVE)
+	block:np.ndarray = np.empty((N_POINTS_PER_CUBIC_CURVE * len(start_corners), 3))
+	for i, t in enumerate(t_values):
+		block[i::N_POINTS_PER_CUBIC_CURVE] = (1 - t) * start_corners + t * end_corners
+	return block
+
+# Splits a polyline at the given fraction of its length, returning the split point and the indices of the vertices on either side of it
+def split_polyline(vertices:list[list[float]], fraction:float) -> tuple[np.ndarray, int, int]:
+	vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+	cumulative_lengths:np.ndarray = np.concatenate(([0.], np.cumsum(np.linalg.norm(np.diff(vertices, axis=0), axis=1))))
+	split_length:float = fraction * cumulative_lengths[-1]
+	segment:int = int(np.clip(np.searchsorted(cumulative_lengths, split_length, side='right') - 1, 0, len(vertices) - 2))
+	segment_length:float = cumulative_lengths[segment + 1] - cumulative_lengths[segment]
+	t:float = 0. if segment_length == 0 else (split_length - cumulative_lengths[segment]) / segment_length
+	return vertices[segment] + t * (vertices[segment + 1] - vertices[segment]), segment, segment + 1
+
+# Disconnected linear paths, concatenated into a single block
+def polygram_points(*vertex_groups:list[list[float]]) -> np.ndarray:
+	blocks:list[np.ndarray] = [linear_path_points(vertex_group) for vertex_group in vertex_groups]
+	if not blocks:
+		return np.zeros((0, 3))
+	return np.concatenate(blocks)
+
+# Vertices of the (optionally notched) triangular pointer drawn by _add_geom_pointer
+def pointer_vertices(
+		tip_coord:list[float],
+		target_coord:list[float],
+		width:float=0.5,
+		length:float=0.7,
+		pointer_notch_depth_ratio:float=0.3) -> np.ndarray:
+	tip_coord = np.asarray(tip_coord, dtype=float)
+	direction_vector:np.ndarray = np.asarray(target_coord, dtype=float) - tip_coord
+	direction_vector = direction_vector / np.linalg.norm(direction_vector)
+	orthogonal_vector:np.ndarray = np.array([direction_vector[1], -direction_vector[0], 0])
+	return np.array([
+		tip_coord,
+		tip_coord - direction_vector * length + orthogonal_vector * width / 2,
+		tip_coord - direction_vector * length * (1 - pointer_notch_depth_ratio),
+		tip_coord - direction_vector * length - orthogonal_vector * width / 2,
+		tip_coord
+	])
+
+# Bernstein basis of a cubic Bezier curve at the given parameters, shape (len(t), 4)
+def cubic_bernstein_basis(t:np.ndarray) -> np.ndarray:
+	t = np.asarray(t, dtype=float)
+	s:np.ndarray = 1 - t
+	return np.stack((s ** 3, 3 * s ** 2 * t, 3 * s * t ** 2, t ** 3), axis=-1)
+
+# Cumulative arc-length table of the cubic Bezier curves of a (4n, 3) point block, each curve sampled at the given number of chords.
+# Returns the curves, shape (n, 4, 3), and the cumulative length at every sample, shape (n * samples + 1,), starting at 0.
+def arc_length_table(points:np.ndarray, samples_per_curve:int) -> tuple[np.ndarray, np.ndarray]:
+	points = np.asarray(points, dtype=float)
+	curves:np.ndarray = points[:len(points) // N_POINTS_PER_CUBIC_CURVE * N_POINTS_PER_CUBIC_CURVE].reshape(-1, N_POINTS_PER_CUBIC_CURVE, 3)
+	segments:np.ndarray = np.diff(np.matmul(cubic_bernstein_basis(np.linspace(0, 1, samples_per_curve + 1)), curves), axis=1)
+	segment_lengths:np.ndarray = np.sqrt(np.einsum('csd,csd->cs', segments, segments)).ravel()
+	return curves, np.concatenate(([0.], np.cumsum(segment_lengths)))
+
+# The _add_geom_ helpers of circuit elements. They only rely on the points attribute and the append_points, start_new_path and get_start_anchors
+# methods, as provided by VMobject for circuit elements, and by PointsCanvas to draw geometries without manim.
+class GeometryHelpers:
+	# Helper methods which generate and add the necessary bezier curves to define some common geometries. These become extremely useful when generating complex geometries.
+	# Each helper computes its whole block of curves with the batched kernels above, and appends it with a single append_points call.
+	def _add_geom_arc(	self:"GeometryHelpers",
+				   		start_angle:float	= 0,
+				   		angle:float 		= np.pi / 2,
+						center:list[float]	= _ORIGIN,
+						radius:float = 1) -> None:
+		self._close_last_curve()
+		self.append_points(arc_points(start_angle, angle, center, radius))
+	def _add_geom_circle(	self:"GeometryHelpers",
+							start_angle:float	= 0,
+							center:list[float]	= _ORIGIN,
+							radius:float = 1) -> None:
+		self._add_geom_arc(start_angle, 2 * np.pi, center, radius)
+	def _add_geom_elliptical_arc(	self:"GeometryHelpers",
+									start_angle:float	= 0,
+									angle:float 		= np.pi / 2,
+									center:list[float]	= _ORIGIN,
+									width:float = 2,
+									height:float = 1) -> None:
+		self._close_last_curve()
+		self.append_points(elliptical_arc_points(start_angle, angle, center, width, height))
+	def _add_geom_ellipse(	self:"GeometryHelpers",
+							start_angle:float	= 0,
+							center:list[float]	= _ORIGIN,
+							width:float = 2,
+							height:float = 1) -> None:
+		self._add_geom_elliptical_arc(start_angle, 2 * np.pi, center, width, height)
+	def _add_geom_linear_path(	self:"GeometryHelpers",
+						   		vertices:list[list[float]]) -> None:
+		if len(vertices) < 2:
+			self.start_new_path(np.array(vertices[0]))
+			return
+		self._close_last_curve()
+		self.append_points(linear_path_points(vertices))
+	def _add_geom_polygram(	self:"GeometryHelpers",
+							*vertex_groups:list[list[float]]) -> None:
+		if any(len(vertex_group) < 2 for vertex_group in vertex_groups):
+			for vertex_group in vertex_groups:
+				self._add_geom_linear_path(vertex_group)
+			return
+		self._close_last_curve()
+		self.append_points(polygram_points(*vertex_groups))
+	def _add_geom_pointer(
+			self:"GeometryHelpers",
+			tip_coord:list[float]=_ORIGIN,
+			target_coord:list[float]=_ORIGIN,
+			width:float=0.5,
+			length:float=0.7,
+			pointer_notch_depth_ratio:float=0.3) -> None:
+		self._add_geom_linear_path(pointer_vertices(tip_coord, target_coord, width, length, pointer_notch_depth_ratio))
+
+	# When adding bezier curves and defining the geometry of a circuit element, this is a useful method to close any unclosed bezier curves in the internal points list.
+	def _close_last_curve(self:"GeometryHelpers") -> None:
+		if len(self.points) % 4 != 0:
+			last_anchor = self.get_start_anchors()[-1]
+			for _ in range(4 - (len(self.points) % 4)):
+				self.append_points([last_anchor])
+
+# Bare points container drawing with the _add_geom_ helpers, following the point conventions of VMobject
+class PointsCanvas(GeometryHelpers):
+	def __init__(self:"PointsCanvas") -> None:
+		self.points:np.ndarray = np.zeros((0, 3))
+
+	def append_points(self:"PointsCanvas", new_points:np.ndarray) -> "PointsCanvas":
+		self.points = np.concatenate((self.points, np.asarray(new_points, dtype=float).reshape(-1, 3)))
+		return self
+
+	# Starts a new curve at the given point, closing any unfinished curve with copies of its start anchor
+	def start_new_path(self:"PointsCanvas", point:list[float]) -> "PointsCanvas":
+		if len(self.points) % N_POINTS_PER_CUBIC_CURVE != 0:
+			closure:list[np.ndarray] = [self.get_start_anchors()[-1]] * (N_POINTS_PER_CUBIC_CURVE - len(self.points) % N_POINTS_PER_CUBIC_CURVE)
+			return self.append_points(closure + [point])
+		return self.append_points([point])
+
+	def get_start_anchors(self:"PointsCanvas") -> np.ndarray:
+		return self.points[0::N_POINTS_PER_CUBIC_CURVE]
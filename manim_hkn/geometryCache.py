@@ -0,0 +1,314 @@
+"""
+Keyed cache of canonical circuit element geometries.
+Every instance of a circuit element class built with the same shape-affecting parameters has an identical Bezier points array, so the
+array is generated once, stored here, and each new instance is handed a copy.
+
+The cache can also persist geometries on disk, so that new render processes skip generating them: set the environment variable
+MANIM_HKN_GEOMETRY_CACHE_DIR, or call geometry_cache.set_directory(path). Each geometry is stored as a memory-mapped .npy points file
+and a .json file with its key, under a subdirectory named after a hash of the geometry source code, so that
+any change to cElements.py, elementGeometry.py or geometry.py (or to the module defining an element class) invalidates the stored geometries.
+Manage the disk cache from the command line with:
+	python -m manim_hkn.geometryCache prewarm      # store the default geometry of every circuit element
+	python -m manim_hkn.geometryCache info
+	python -m manim_hkn.geometryCache clear [--stale]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import warnings
+from collections import OrderedDict
+from typing import Hashable
+import numpy as np
+
+# Environment variable naming the directory of the disk cache. The disk cache is off when it is unset.
+CACHE_DIR_ENV_VAR:str = 'MANIM_HKN_GEOMETRY_CACHE_DIR'
+# Bumped whenever the layout of the files on disk changes
+_DISK_FORMAT_VERSION:int = 2
+# Sources whose changes invalidate every stored geometry
+_GEOMETRY_SOURCES:tuple[str, ...] = ('cElements.py', 'elementGeometry.py', 'geometry.py')
+
+# Only the points are stored: the terminal coordinates of an element are given by its geometry object, which is built before its points
+class GeometryCacheEntry:
+	__slots__ = ('points',)
+
+	def __init__(self:"GeometryCacheEntry", points:np.ndarray) -> None:
+		# Entries are shared between every element built from them, so they are stored read-only to catch accidental in-place edits
+		# Geometries loaded from disk stay memory-mapped, read-only files
+		self.points:np.ndarray = points if isinstance(points, np.memmap) else np.array(points, dtype=float)
+		self.points.flags.writeable = False
+
+# Hash of the source files of the package geometry, naming the disk cache subdirectory of the current code
+def _package_fingerprint() -> str:
+	digest = hashlib.sha256(f'format {_DISK_FORMAT_VERSION}'.encode())
+	package_directory:str = os.path.dirname(os.path.abspath(__file__))
+	for source in _GEOMETRY_SOURCES:
+		with open(os.path.join(package_directory, source), 'rb') as source_file:
+			digest.update(source_file.read())
+	return digest.hexdigest()[:16]
+
+# Hash of the source file of the module defining a class, for element classes defined outside the package geometry sources
+def _module_fingerprint(module_name:str) -> str:
+	module = sys.modules.get(module_name)
+	path:str | None = getattr(module, '__file__', None)
+	if path is None or not os.path.isfile(path):
+		return ''
+	with open(path, 'rb') as source_file:
+		return hashlib.sha256(source_file.read()).hexdigest()[:16]
+
+# Stable text form of a geometry key: the qualified name of its class, and the repr of its parameters. None for keys which cannot be stored, ex: parameters whose repr is an address.
+def _describe_key(key:Hashable) -> str | None:
+	if not isinstance(key, tuple) or len(key) == 0 or not isinstance(key[0], type):
+		return None
+	parameters:str = repr(key[1:])
+	if ' at 0x' in parameters:
+		return None
+	return f'{key[0].__module__}.{key[0].__qualname__}{parameters}'
+
+class GeometryCache:
+	def __init__(self:"GeometryCache", maxsize:int = 256, enabled:bool = True, directory:str | None = None) -> None:
+		if maxsize < 1:
+			raise ValueError(f'Invalid Cache Size: {maxsize}, the cache must be able to hold at least one geometry.')
+		self.maxsize:int = maxsize
+		# Global opt-out switch. When disabled, every element regenerates its geometry from scratch
+		self.enabled:bool = enabled
+		self.hits:int = 0
+		self.misses:int = 0
+		self.disk_hits:int = 0
+		self.disk_writes:int = 0
+		self._entries:OrderedDict[Hashable, GeometryCacheEntry] = OrderedDict()
+		self._directory:str | None = None
+		self._fingerprint:str | None = None
+		self._module_fingerprints:dict[str, str] = {}
+		self.set_directory(directory)
+
+	# Sets the root directory of the disk cache, or turns the disk cache off with None
+	def set_directory(self:"GeometryCache", directory:str | None) -> None:
+		self._directory = None if directory is None else os.path.abspath(os.path.expanduser(directory))
+
+	@property
+	def directory(self:"GeometryCache") -> str | None:
+		return self._directory
+
+	# Warns once, as the disk cache stays off afterwards
+	def _turn_off_disk(self:"GeometryCache", reason:str, error:OSError) -> None:
+		warnings.warn(f'Geometry cache directory {self._directory} {reason}, the disk cache is turned off: {error}')
+		self._directory = None
+
+	# Subdirectory holding the geometries generated by the current geometry source code, or None if the disk cache is (or was just turned) off
+	def _fingerprint_directory(self:"GeometryCache") -> str | None:
+		if self._directory is None:
+			return None
+		if self._fingerprint is None:
+			try:
+				self._fingerprint = _package_fingerprint()
+			except OSError as error:
+				self._turn_off_disk('cannot be keyed, as the geometry sources are unreadable', error)
+				return None
+		return os.path.join(self._directory, self._fingerprint)
+
+	# Path of the files of a key on disk, without extension, or None if the key cannot be stored
+	def _disk_path(self:"GeometryCache", key:Hashable) -> str | None:
+		description:str | None = _describe_key(key)
+		if description is None:
+			return None
+		directory:str | None = self._fingerprint_directory()
+		if directory is None:
+			return None
+		module_name:str = key[0].__module__
+		if module_name not in self._module_fingerprints:
+			try:
+				self._module_fingerprints[module_name] = '' if module_name.startswith('manim_hkn.') else _module_fingerprint(module_name)
+			except OSError as error:
+				self._turn_off_disk(f'cannot be keyed, as the source of {module_name} is unreadable', error)
+				return None
+		digest:str = hashlib.sha256(f'{description}|{self._module_fingerprints[module_name]}'.encode()).hexdigest()[:32]
+		return os.path.join(directory, digest)
+
+	# The metadata records where the points start in the .npy file, so that they are mapped without parsing the .npy header
+	def _load(self:"GeometryCache", key:Hashable) -> GeometryCacheEntry | None:
+		path:str | None = self._disk_path(key)
+		if path is None:
+			return None
+		try:
+			with open(path + '.json') as metadata_file:
+				metadata:dict = json.load(metadata_file)
+			if metadata.get('key') != _describe_key(key):
+				return None
+			points:np.ndarray = np.memmap(path + '.npy', dtype=metadata['dtype'], mode='r', offset=metadata['offset'], shape=tuple(metadata['shape']))
+		except (OSError, ValueError, KeyError):
+			return None
+		return GeometryCacheEntry(points)
+
+	# Writes the entry next to the other geometries of the current source code, points first. Each file is written to a temporary file and renamed, so concurrent render processes never read a partial entry.
+	def _store(self:"GeometryCache", key:Hashable, entry:GeometryCacheEntry) -> None:
+		path:str | None = self._disk_path(key)
+		if path is None:
+			return
+		try:
+			os.makedirs(os.path.dirname(path), exist_ok=True)
+			points_size:int = self._write_atomic(path + '.npy', lambda output_file: np.save(output_file, entry.points))
+			metadata:dict = {
+				'key': _describe_key(key),
+				'dtype': entry.points.dtype.str,
+				'shape': list(entry.points.shape),
+				'offset': points_size - entry.points.nbytes
+			}
+			self._write_atomic(path + '.json', lambda output_file: output_file.write(json.dumps(metadata).encode()))
+		except OSError as error:
+			self._turn_off_disk('is not writable', error)
+			return
+		self.disk_writes += 1
+
+	# Writes a file through a temporary file in the same directory, and returns its size
+	def _write_atomic(self:"GeometryCache", path:str, write) -> int:
+		descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+		try:
+			with os.fdopen(descriptor, 'wb') as output_file:
+				write(output_file)
+			size:int = os.path.getsize(temporary_path)
+			os.replace(temporary_path, path)
+		except BaseException:
+			os.unlink(temporary_path)
+			raise
+		return size
+
+	def __len__(self:"GeometryCache") -> int:
+		return len(self._entries)
+
+	# Whether the geometry is in memory, or stored on disk when the disk cache is on
+	def __contains__(self:"GeometryCache", key:Hashable) -> bool:
+		if key in self._entries:
+			return True
+		path:str | None = None if self._directory is None else self._disk_path(key)
+		return path is not None and os.path.isfile(path + '.json') and os.path.isfile(path + '.npy')
+
+	# Geometries missing from memory are looked up on disk, when the disk cache is on
+	def get(self:"GeometryCache", key:Hashable) -> GeometryCacheEntry | None:
+		entry = self._entries.get(key)
+		if entry is None and self._directory is not None:
+			entry = self._load(key)
+			if entry is not None:
+				self.disk_hits += 1
+				self._insert(key, entry)
+		if entry is None:
+			self.misses += 1
+			return None
+		self._entries.move_to_end(key)
+		self.hits += 1
+		return entry
+
+	# Stores a freshly generated geometry, in memory and on disk when the disk cache is on
+	def put(self:"GeometryCache", key:Hashable, points:np.ndarray) -> GeometryCacheEntry:
+		entry = GeometryCacheEntry(points)
+		self._insert(key, entry)
+		if self._directory is not None:
+			self._store(key, entry)
+		return entry
+
+	# Evicts the least recently used entries beyond maxsize
+	def _insert(self:"GeometryCache", key:Hashable, entry:GeometryCacheEntry) -> None:
+		self._entries[key] = entry
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.maxsize:
+			self._entries.popitem(last=False)
+
+	def resize(self:"GeometryCache", maxsize:int) -> None:
+		if maxsize < 1:
+			raise ValueError(f'Invalid Cache Size: {maxsize}, the cache must be able to hold at least one geometry.')
+		self.maxsize = maxsize
+		while len(self._entries) > self.maxsize:
+			self._entries.popitem(last=False)
+
+	# Clears the in-memory entries and the counters. The disk cache is left untouched, see clear_disk.
+	def clear(self:"GeometryCache") -> None:
+		self._entries.clear()
+		self.hits = 0
+		self.misses = 0
+		self.disk_hits = 0
+		self.disk_writes = 0
+
+	# Deletes the stored geometries of every version of the source code, or with stale_only, of every version but the current one. Returns the number of deleted subdirectories.
+	def clear_disk(self:"GeometryCache", stale_only:bool = False) -> int:
+		if self._directory is None or not os.path.isdir(self._directory):
+			return 0
+		fingerprint_directory:str | None = self._fingerprint_directory()
+		if fingerprint_directory is None:
+			return 0
+		current:str = os.path.basename(fingerprint_directory)
+		removed:int = 0
+		for name in os.listdir(self._directory):
+			path:str = os.path.join(self._directory, name)
+			if os.path.isdir(path) and not (stale_only and name == current):
+				shutil.rmtree(path)
+				removed += 1
+		return removed
+
+	def info(self:"GeometryCache") -> dict[str, int | bool | str | None]:
+		directory:str | None = self._fingerprint_directory()
+		info:dict[str, int | bool | str | None] = {
+			'enabled'		: self.enabled,
+			'hits'			: self.hits,
+			'misses'		: self.misses,
+			'size'			: len(self._entries),
+			'maxsize'		: self.maxsize,
+			'directory'		: self._directory,
+			'disk_hits'		: self.disk_hits,
+			'disk_writes'	: self.disk_writes
+		}
+		if directory is not None:
+			files:list[str] = os.listdir(directory) if os.path.isdir(directory) else []
+			info['fingerprint'] = os.path.basename(directory)
+			info['disk_size'] = sum(1 for name in files if name.endswith('.npy'))
+			info['disk_bytes'] = sum(os.path.getsize(os.path.join(directory, name)) for name in files)
+		return info
+
+# Process-wide cache shared by every _CircuitElementTemplate subclass
+geometry_cache:GeometryCache = GeometryCache(directory=os.environ.get(CACHE_DIR_ENV_VAR) or None)
+
+# Builds every circuit element class which can be constructed with its default parameters, storing their geometries. Returns the names of the classes built.
+def prewarm() -> list[str]:
+	from manim_hkn import cElements
+	built:list[str] = []
+	pending:list[type] = list(cElements._CircuitElementTemplate.__subclasses__())
+	while pending:
+		element_class:type = pending.pop(0)
+		pending.extend(element_class.__subclasses__())
+		if element_class._GEOMETRY_KEY_ATTRS is None or element_class.__name__.startswith('_'):
+			continue
+		for reverse_points in (False, True):
+			try:
+				element_class(reverse_points=reverse_points)
+			except TypeError:
+				break
+		else:
+			built.append(element_class.__name__)
+	return built
+
+def main(argv:list[str] | None = None) -> int:
+	# Run with python -m, this module is __main__, and the cache the elements use is the one of the imported package module
+	from manim_hkn.geometryCache import geometry_cache as cache
+	parser = argparse.ArgumentParser(description='Manage the disk cache of circuit element geometries.')
+	parser.add_argument('command', choices=('prewarm', 'clear', 'info'))
+	parser.add_argument('--dir', default=cache.directory, help=f'cache directory (default: ${CACHE_DIR_ENV_VAR})')
+	parser.add_argument('--stale', action='store_true', help='with clear, only delete the geometries of previous versions of the source code')
+	arguments = parser.parse_args(argv)
+	if arguments.dir is None:
+		parser.error(f'no cache directory, pass --dir or set ${CACHE_DIR_ENV_VAR}')
+	cache.set_directory(arguments.dir)
+
+	if arguments.command == 'prewarm':
+		built:list[str] = prewarm()
+		print(f'Built {len(built)} element classes ({", ".join(built)}): {cache.disk_writes} geometries stored, {cache.disk_hits} already in {cache.directory}')
+	elif arguments.command == 'clear':
+		print(f'Deleted {cache.clear_disk(arguments.stale)} cache version(s) from {cache.directory}')
+	else:
+		print(json.dumps(cache.info(), indent='\t'))
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Multi-process rendering of a Scene, split by animation.
+A first pass replays the scene's construct with every animation skipped, only to record the run time of each play call. The play calls
+are then partitioned into contiguous segments of about equal run time, each rendered by a worker process. A worker replays construct
+from the start, skipping the animations before its segment (like manim's -n option) to reach the scene state at the start of the
+segment, and writes the partial movie files of its own animations. The partial movie files are named and written exactly as in a serial
+render, so concatenating them in animation order produces the same movie.
+Workers are forked, so that they inherit the manim config and the scene class: this driver targets Linux and the Cairo renderer, and
+needs no display. Sounds, subcaptions and sections of the scene are not carried over from the workers. Updaters must not depend on the
+frame rate (the wire and circuit updaters of manim_hkn do not), since skipped animations update the scene in a single step.
+
+	python -m manim_hkn.parallelRender examples/test.py test --processes 8 --quality l
+"""
+
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, Sequence
+import numpy as np
+from manim import Scene, config
+from manim.constants import QUALITIES
+from manim.utils.exceptions import EndSceneEarlyException
+
+class SegmentTiming(NamedTuple):
+	# Indices of the first and last play calls of the segment
+	first_animation:int
+	last_animation:int
+	# Duration of the segment in the movie, in seconds
+	run_time:float
+	# Wall time of the worker, including the replay of the animations before the segment, in seconds
+	render_time:float
+
+class ParallelRenderResult(NamedTuple):
+	# None when the scene has no play calls to combine
+	movie_file_path:Path | None
+	segments:list[SegmentTiming]
+	# Wall times of the stages of the render: 'partition', 'render', 'combine' and 'total', in seconds
+	timings:dict[str, float]
+
+# Scene rendered by the worker processes, set by the pool initializer
+_worker_scene_class:type[Scene] | None = None
+_worker_scene_kwargs:dict[str, Any] = {}
+
+# Splits play calls, given their run times, into at most the given number of contiguous segments of about equal run time
+def partition_animations(run_times:Sequence[float], segments:int) -> list[tuple[int, int]]:
+	if segments < 1:
+		raise ValueError(f'Invalid Segments: {segments}, it must be at least 1.')
+	if len(run_times) == 0:
+		return []
+	cumulative:np.ndarray = np.cumsum(run_times, dtype=float)
+	cuts:np.ndarray = np.searchsorted(cumulative, cumulative[-1] * np.arange(1, segments) / segments) + 1
+	bounds:np.ndarray = np.unique(np.concatenate(([0], np.minimum(cuts, len(run_times)), [len(run_times)])))
+	return [(int(first), int(end) - 1) for first, end in zip(bounds, bounds[1:])]
+
+# Replays construct with every animation skipped, and returns the run time of each play call
+def _play_run_times(scene_class:type[Scene], scene_kwargs:dict[str, Any]) -> list[float]:
+	scene:Scene = scene_class(skip_animations=True, **scene_kwargs)
+	run_times:list[float] = []
+	renderer_play = scene.renderer.play
+	def play(played_scene:Scene, *args, **kwargs) -> None:
+		start:float = played_scene.renderer.time
+		renderer_play(played_scene, *args, **kwargs)
+		run_times.append(played_scene.renderer.time - start)
+	scene.renderer.play = play
+	scene.setup()
+	try:
+		scene.construct()
+	except EndSceneEarlyException:
+		pass
+	scene.tear_down()
+	return run_times
+
+def _init_worker(scene_class:type[Scene], scene_kwargs:dict[str, Any]) -> None:
+	global _worker_scene_class, _worker_scene_kwargs
+	_worker_scene_class, _worker_scene_kwargs = scene_class, scene_kwargs
+	# Progress bars of concurrent workers would interleave on the terminal
+	config.progress_bar = 'none'
+
+# Renders the play calls of a segment, and returns their partial movie files and the wall time of the worker
+def _render_segment(first_animation:int, last_animation:int) -> tuple[list[str | None], float]:
+	start:float = time.perf_counter()
+	config.from_animation_number = first_animation
+	config.upto_animation_number = last_animation
+	scene:Scene = _worker_scene_class(**_worker_scene_kwargs)
+	file_writer = scene.renderer.file_writer
+	# The driver combines the partial movie files of every segment, the worker only waits for its own to be written
+	file_writer.finish = file_writer.join_all_encode_jobs
+	scene.render()
+	return file_writer.partial_movie_files[first_animation:last_animation + 1], time.perf_counter() - start
+
+# Renders a scene with a pool of processes, each rendering a contiguous segment of its animations, and combines the partial movie files
+def render_parallel(scene_class:type[Scene], processes:int | None = None, segments:int | None = None, **scene_kwargs) -> ParallelRenderResult:
+	processes = (os.cpu_count() or 1) if processes is None else processes
+	if processes < 1:
+		raise ValueError(f'Invalid Processes: {processes}, it must be at least 1.')
+	total_start:float = time.perf_counter()
+	run_times:list[float] = _play_run_times(scene_class, scene_kwargs)
+	first_played:int = max(0, config.from_animation_number)
+	ranges:list[tuple[int, int]] = [(first + first_played, last + first_played) for first, last in partition_animations(run_times[first_played:], processes if segments is None else segments)]
+	timings:dict[str, float] = {'partition': time.perf_counter() - total_start}
+
+	render_start:float = time.perf_counter()
+	partial_movie_files:list[str | None] = []
+	segment_timings:list[SegmentTiming] = []
+	if ranges:
+		context = multiprocessing.get_context('fork')
+		with ProcessPoolExecutor(min(processes, len(ranges)), mp_context=context, initializer=_init_worker, initargs=(scene_class, scene_kwargs)) as pool:
+			futures = [pool.submit(_render_segment, first, last) for first, last in ranges]
+			for (first, last), future in zip(ranges, futures):
+				files, render_time = future.result()
+				partial_movie_files.extend(files)
+				segment_timings.append(SegmentTiming(first, last, float(sum(run_times[first:last + 1])), render_time))
+	timings['render'] = time.perf_counter() - render_start
+
+	combine_start:float = time.perf_counter()
+	scene:Scene = scene_class(**scene_kwargs)
+	file_writer = scene.renderer.file_writer
+	file_writer.partial_movie_files = partial_movie_files
+	file_writer.combine_to_movie()
+	movie_file_path:Path | None = Path(file_writer.movie_file_path) if any(file is not None for file in partial_movie_files) else None
+	timings['combine'] = time.perf_counter() - combine_start
+	timings['total'] = time.perf_counter() - total_start
+	return ParallelRenderResult(movie_file_path, segment_timings, timings)
+
+# Imports the scene class from a Python file, like the manim command line does
+def _load_scene_class(file:str, scene_name:str) -> type[Scene]:
+	path:Path = Path(file).resolve()
+	spec = importlib.util.spec_from_file_location(path.stem, path)
+	if spec is None or spec.loader is None:
+		raise ValueError(f'Invalid File: {file}.')
+	module = importlib.util.module_from_spec(spec)
+	sys.modules[path.stem] = module
+	spec.loader.exec_module(module)
+	scene_class = getattr(module, scene_name, None)
+	if not (isinstance(scene_class, type) and issubclass(scene_class, Scene)):
+		raise ValueError(f'Invalid Scene: {scene_name}, it is not a Scene defined in {file}.')
+	return scene_class
+
+def main(argv:list[str] | None = None) -> None:
+	quality_flags:dict[str, str] = {quality['flag']: name for name, quality in QUALITIES.items() if quality['flag'] is not None}
+	parser = argparse.ArgumentParser(prog='python -m manim_hkn.parallelRender', description='Render a scene with a pool of processes, split by animation.')
+	parser.add_argument('file', help='Python file defining the scene')
+	parser.add_argument('scene', help='name of the Scene class to render')
+	parser.add_argument('--processes', type=int, default=None, help='number of worker processes, the number of CPUs by default')
+	parser.add_argument('--segments', type=int, default=None, help='number of segments, the number of processes by default')
+	parser.add_argument('--quality', '-q', choices=sorted(quality_flags), default=None, help='render quality, as in the manim command line')
+	parser.add_argument('--disable_caching', action='store_true', help='do not reuse cached partial movie files')
+	arguments = parser.parse_args(argv)
+
+	config.input_file = arguments.file
+	config.quality = quality_flags.get(arguments.quality)
+	config.disable_caching = config.disable_caching or arguments.disable_caching
+	result:ParallelRenderResult = render_parallel(_load_scene_class(arguments.file, arguments.scene), arguments.processes, arguments.segments)
+	print(f'{"segment":>8} {"animations":>11} {"run time (s)":>13} {"render (s)":>11}')
+	for index, segment in enumerate(result.segments):
+		print(f'{index:>8} {f"{segment.first_animation}-{segment.last_animation}":>11} {segment.run_time:>13.2f} {segment.render_time:>11.2f}')
+	print(', '.join(f'{stage} {seconds:.2f} s' for stage, seconds in result.timings.items()))
+	if result.movie_file_path is not None:
+		print(f'Movie written to {result.movie_file_path}')
+
+if __name__ == '__main__':
+	main()
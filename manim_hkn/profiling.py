@@ -0,0 +1,276 @@
+"""
+Opt-in profiling of circuit scenes, to tell where the time of a slow render goes.
+While a Profiler is enabled, it times circuit element construction (__init__), generate_points, the stroke width sync of circuit elements
+(_sync_stroke_width), every mobject updater (ex: Wire._update_shape, Circuit.resolve) and the interpolation of the Create and Uncreate
+animations. Attached to a scene, it also times the rasterization of every frame by the Cairo camera, and closes a frame after each one is
+rendered. Timings are aggregated per event, per class (of the element, or of the mobject an updater runs on) and per frame, and can be
+exported as a JSON report and as a Chrome trace (chrome://tracing, or https://ui.perfetto.dev).
+The profiler replaces the instrumented methods only while it is enabled, and restores the original methods once disabled: a scene
+rendered without a profiler, or after it was disabled, runs exactly the same code as if this module had never been imported.
+Nested timings are inclusive: a construction includes the generate_points call it makes, an updater the wire regenerations it triggers.
+
+	class Walkthrough(CircuitScene):
+		def construct(self):
+			Profiler().attach(self, report_path='profile.json', trace_path='trace.json')
+			...
+
+	with Profiler() as profiler:
+		circuit = rc_ladder(100)
+	print(profiler.report()['by_class'])
+"""
+
+import functools
+import inspect
+import json
+import os
+import time
+from typing import Callable
+from manim import Mobject, Scene
+from manim.animation.creation import Create
+from manim_hkn.animations import _ArcLengthCreate
+from manim_hkn.cElements import _CircuitElementTemplate
+
+# The profiler currently enabled, at most one at a time as each one replaces the methods the other would restore
+_enabled_profiler:"Profiler | None" = None
+
+def _updater_name(updater:Callable) -> str:
+	return getattr(updater, '__qualname__', None) or type(updater).__name__
+
+# Every subclass of the class, and the class itself
+def _class_tree(cls:type) -> list[type]:
+	classes:list[type] = [cls]
+	for subclass in cls.__subclasses__():
+		classes += [member for member in _class_tree(subclass) if member not in classes]
+	return classes
+
+class Profiler:
+	# trace keeps every timing for the Chrome trace, without it only the aggregates are kept
+	def __init__(self:"Profiler", trace:bool = True) -> None:
+		self.trace:bool = trace
+		self._patches:list[tuple[type, str, Callable | None]] = []
+		# Instances which are being constructed or generated, for which nested calls (ex: super().__init__) are not timed again
+		self._active:set[tuple[str, int]] = set()
+		self.reset()
+
+	@property
+	def enabled(self:"Profiler") -> bool:
+		return _enabled_profiler is self
+
+	def reset(self:"Profiler") -> None:
+		self.frames:int = 0
+		# (event, name, class) -> [count, total ns, max ns]
+		self._aggregates:dict[tuple[str, str, str], list[int]] = {}
+		# Total ns of every event, per frame, including the open frame
+		self._frame_totals:list[dict[str, int]] = [{}]
+		# (event, name, class, start ns, duration ns, frame)
+		self._events:list[tuple[str, str, str, int, int, int]] = []
+		self._frame_ends:list[int] = []
+		self._origin:int = time.perf_counter_ns()
+
+	def _record(self:"Profiler", event:str, name:str, cls:str, start:int, end:int) -> None:
+		duration:int = end - start
+		aggregate:list[int] | None = self._aggregates.get((event, name, cls))
+		if aggregate is None:
+			self._aggregates[(event, name, cls)] = [1, duration, duration]
+		else:
+			aggregate[0] += 1
+			aggregate[1] += duration
+			if duration > aggregate[2]:
+				aggregate[2] = duration
+		frame_totals:dict[str, int] = self._frame_totals[-1]
+		frame_totals[event] = frame_totals.get(event, 0) + duration
+		if self.trace:
+			self._events.append((event, name, cls, start, duration, self.frames))
+
+	def end_frame(self:"Profiler") -> None:
+		self.frames += 1
+		self._frame_totals.append({})
+		if self.trace:
+			self._frame_ends.append(time.perf_counter_ns())
+
+	def enable(self:"Profiler") -> "Profiler":
+		global _enabled_profiler
+		if _enabled_profiler is self:
+			return self
+		if _enabled_profiler is not None:
+			raise ValueError('Invalid Profiler: another profiler is already enabled.')
+		elements:list[type] = _class_tree(_CircuitElementTemplate)
+		for cls in elements:
+			for method, event in (('__init__', 'construct'), ('generate_points', 'generate_points')):
+				if method in cls.__dict__:
+					self._patch(cls, method, self._outermost(cls.__dict__[method], event))
+		self._patch(_CircuitElementTemplate, '_sync_stroke_width', self._timed(_CircuitElementTemplate._sync_stroke_width, 'stroke_sync'))
+		# Circuit elements are created by CreateElement, anything else, ex: a Circuit, by manim's Create (and Uncreate, a subclass)
+		for cls in (_ArcLengthCreate, Create):
+			self._patch(cls, 'interpolate_mobject', self._timed_create(cls.interpolate_mobject))
+		self._patch(Mobject, 'update', self._timed_update())
+		_enabled_profiler = self
+		return self
+
+	def disable(self:"Profiler") -> "Profiler":
+		global _enabled_profiler
+		if _enabled_profiler is not self:
+			return self
+		# In reverse order, as a class may have been patched more than once
+		for cls, method, original in reversed(self._patches):
+			if original is None:
+				delattr(cls, method)
+			else:
+				setattr(cls, method, original)
+		self._patches = []
+		self._active.clear()
+		_enabled_profiler = None
+		return self
+
+	def __enter__(self:"Profiler") -> "Profiler":
+		return self.enable()
+
+	def __exit__(self:"Profiler", *exc_info) -> None:
+		self.disable()
+
+	# Inherited methods are patched on the class itself, and deleted from it once restored
+	def _patch(self:"Profiler", cls:type, method:str, wrapper:Callable) -> None:
+		self._patches.append((cls, method, cls.__dict__.get(method)))
+		setattr(cls, method, wrapper)
+
+	# Times the method once per instance, ex: the __init__ of a subclass, but not the super().__init__ calls it makes
+	def _outermost(self:"Profiler", function:Callable, event:str) -> Callable:
+		active:set[tuple[str, int]] = self._active
+		@functools.wraps(function)
+		def wrapper(instance, *args, **kwargs):
+			key:tuple[str, int] = (event, id(instance))
+			if key in active:
+				return function(instance, *args, **kwargs)
+			active.add(key)
+			start:int = time.perf_counter_ns()
+			try:
+				return function(instance, *args, **kwargs)
+			finally:
+				end:int = time.perf_counter_ns()
+				active.discard(key)
+				name:str = type(instance).__name__
+				self._record(event, name, name, start, end)
+		return wrapper
+
+	def _timed(self:"Profiler", function:Callable, event:str) -> Callable:
+		@functools.wraps(function)
+		def wrapper(instance, *args, **kwargs):
+			start:int = time.perf_counter_ns()
+			try:
+				return function(instance, *args, **kwargs)
+			finally:
+				name:str = type(instance).__name__
+				self._record(event, name, name, start, time.perf_counter_ns())
+		return wrapper
+
+	# Named after the animation, and classed by the animated mobject
+	def _timed_create(self:"Profiler", function:Callable) -> Callable:
+		@functools.wraps(function)
+		def wrapper(animation, alpha:float) -> None:
+			start:int = time.perf_counter_ns()
+			try:
+				function(animation, alpha)
+			finally:
+				self._record('create', type(animation).__name__, type(animation.mobject).__name__, start, time.perf_counter_ns())
+		return wrapper
+
+	# Mobject.update, with each updater timed on its own. Named after the updater, and classed by the mobject it runs on.
+	def _timed_update(self:"Profiler") -> Callable:
+		update:Callable = Mobject.update
+		@functools.wraps(update)
+		def wrapper(mobject:Mobject, dt:float = 0, recursive:bool = True) -> Mobject:
+			if mobject.updating_suspended:
+				return mobject
+			for updater in mobject.updaters:
+				start:int = time.perf_counter_ns()
+				try:
+					if 'dt' in inspect.signature(updater).parameters:
+						updater(mobject, dt)
+					else:
+						updater(mobject)
+				finally:
+					self._record('updater', _updater_name(updater), type(mobject).__name__, start, time.perf_counter_ns())
+			if recursive:
+				for submobject in mobject.submobjects:
+					submobject.update(dt, recursive=recursive)
+			return mobject
+		return wrapper
+
+	# Enables the profiler, times the rasterization of the scene's frames and closes a profiler frame after each one is rendered.
+	# When given, the report and the Chrome trace are written at the end of the scene, and the profiler is then disabled.
+	def attach(self:"Profiler", scene:Scene, report_path:str | None = None, trace_path:str | None = None) -> "Profiler":
+		self.enable()
+		renderer = scene.renderer
+		camera = renderer.camera
+		capture_mobjects:Callable = camera.capture_mobjects
+		render:Callable = renderer.render
+		# Both pass through once the profiler is disabled, as the renderer may be wrapped again afterwards (ex: by a FrameDeduplicator)
+		def timed_capture_mobjects(*args, **kwargs):
+			if not self.enabled:
+				return capture_mobjects(*args, **kwargs)
+			start:int = time.perf_counter_ns()
+			try:
+				return capture_mobjects(*args, **kwargs)
+			finally:
+				self._record('render', 'capture_mobjects', type(camera).__name__, start, time.perf_counter_ns())
+		def framed_render(*args, **kwargs):
+			render(*args, **kwargs)
+			if self.enabled:
+				self.end_frame()
+		camera.capture_mobjects = timed_capture_mobjects
+		renderer.render = framed_render
+
+		if report_path is not None or trace_path is not None:
+			tear_down:Callable = scene.tear_down
+			def exporting_tear_down(*args, **kwargs):
+				tear_down(*args, **kwargs)
+				if report_path is not None:
+					self.export(report_path)
+				if trace_path is not None:
+					self.export_chrome_trace(trace_path)
+				self.disable()
+			scene.tear_down = exporting_tear_down
+		return self
+
+	@staticmethod
+	def _summary(count:int, total:int, maximum:int) -> dict:
+		return {'count': count, 'total_ms': total / 1e6, 'mean_us': total / count / 1e3, 'max_us': maximum / 1e3}
+
+	# Aggregated timings: per event, per class and event, per name and event (ex: per updater), and the total ms of every event per frame
+	def report(self:"Profiler") -> dict:
+		groupings:dict[str, dict[tuple, list[int]]] = {'by_event': {}, 'by_class': {}, 'by_name': {}}
+		for (event, name, cls), (count, total, maximum) in self._aggregates.items():
+			for grouping, key in (('by_event', (event,)), ('by_class', (cls, event)), ('by_name', (name, event))):
+				aggregate:list[int] | None = groupings[grouping].get(key)
+				if aggregate is None:
+					groupings[grouping][key] = [count, total, maximum]
+				else:
+					aggregate[0] += count
+					aggregate[1] += total
+					aggregate[2] = max(aggregate[2], maximum)
+		report:dict = {'frames': self.frames, 'by_event': {event: self._summary(*aggregate) for (event,), aggregate in sorted(groupings['by_event'].items())}}
+		for grouping in ('by_class', 'by_name'):
+			report[grouping] = {}
+			for (key, event), aggregate in sorted(groupings[grouping].items()):
+				report[grouping].setdefault(key, {})[event] = self._summary(*aggregate)
+		report['per_frame'] = [{event: total / 1e6 for event, total in totals.items()} for totals in self._frame_totals[:self.frames]]
+		return report
+
+	def export(self:"Profiler", path:str) -> None:
+		with open(path, 'w') as file:
+			json.dump(self.report(), file, indent='\t')
+
+	# Trace event format: one complete event per timing, and one instant event at the end of every frame
+	def chrome_trace(self:"Profiler") -> dict:
+		if not self.trace:
+			raise ValueError('Invalid Profiler: the trace of a profiler created with trace=False is not kept.')
+		pid:int = os.getpid()
+		events:list[dict] = [{'name': name, 'cat': event, 'ph': 'X', 'ts': (start - self._origin) / 1e3, 'dur': duration / 1e3, 'pid': pid, 'tid': 0,
+			'args': {'class': cls, 'frame': frame}} for event, name, cls, start, duration, frame in self._events]
+		events += [{'name': 'frame', 'cat': 'frame', 'ph': 'i', 's': 'g', 'ts': (end - self._origin) / 1e3, 'pid': pid, 'tid': 0, 'args': {'frame': frame}}
+			for frame, end in enumerate(self._frame_ends)]
+		return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+	def export_chrome_trace(self:"Profiler", path:str) -> None:
+		with open(path, 'w') as file:
+			json.dump(self.chrome_trace(), file)
@@ -0,0 +1,165 @@
+"""
+Rendering optimizations for circuit scenes with the Cairo renderer.
+Manim only freezes the frame of a wait when nothing in the scene has a time-based updater. Otherwise, and for every frame of an animation,
+the whole scene is rasterized again, even when the schematic and everything else on screen is static (a wait with a clock or counter
+updater, an animation of an invisible mobject, the idle part of a Succession). A FrameDeduplicator attached to a scene computes, before
+each frame, the state of everything the camera would draw: the points and style arrays of every displayed mobject, reduced to CRC32
+checksums, their draw order, and the camera frame. When this state is the same as for the previous frame, the previous frame is written
+again instead of being rasterized. Content checksums are used rather than the points versions of the circuit elements, since manim's
+partial animations write points in place.
+
+A StaticLayer groups circuit elements and wires which mostly stay still while a few annotations (labels, arrows, graphs) animate over them.
+Added directly to a scene rendered with a FrameDeduplicator, the static layers are rasterized once into a cached background bitmap, and
+each frame only draws the other mobjects over a copy of it. The bitmap is rasterized again whenever the state of any layer member, or of
+the camera, changes. Static layers are drawn below every other mobject of the scene, whatever the order they were added in.
+CircuitScene is a Scene with a FrameDeduplicator attached.
+
+	class Walkthrough(CircuitScene):
+		def construct(self):
+			...
+			self.add(StaticLayer(schematic))
+			self.play(Write(label))
+			self.wait(10)
+			print(self.frame_deduplicator.info())
+"""
+
+import time
+import zlib
+import numpy as np
+from manim import Scene, Mobject, Group
+from manim.camera.camera import Camera
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+from manim_hkn.terminal import _TerminalAnchors
+
+# Array and scalar attributes of a mobject, besides its points, that change how the Cairo camera draws it
+_STYLE_ARRAYS:tuple[str, ...] = ('fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas', 'sheen_direction', 'pixel_array', 'rgbas')
+_STYLE_VALUES:tuple[str, ...] = ('background_stroke_width', 'sheen_factor', 'joint_type', 'cap_style', 'shade_in_3d', 'z_index')
+
+def _array_state(array) -> tuple:
+	array = np.ascontiguousarray(array)
+	return array.shape, zlib.crc32(array)
+
+# State of everything the camera reads to draw the mobject, without its submobjects.
+# Style attributes are read from the instance dictionary, as missing attributes are slow to look up on a Mobject. The stroke width is
+# read through its property, which circuit elements keep in sync with their scale.
+def mobject_state(mobject:Mobject) -> tuple:
+	attributes:dict = vars(mobject)
+	return (mobject, _array_state(mobject.points), getattr(mobject, 'stroke_width', None),
+		*(_array_state(attributes[name]) for name in _STYLE_ARRAYS if attributes.get(name) is not None),
+		*(attributes.get(name) for name in _STYLE_VALUES))
+
+def _camera_state(camera:Camera) -> tuple:
+	frame:Mobject | None = getattr(camera, 'frame', None)
+	return (tuple(np.asarray(camera.frame_center, dtype=float)), camera.frame_width, camera.frame_height, str(camera.background_color),
+		camera.background_opacity, id(camera.background), None if frame is None else _array_state(frame.points))
+
+# Group of mobjects rasterized once into a cached background, see the module docstring
+class StaticLayer(Group):
+	pass
+
+# Mobjects the camera draws for the given top level mobjects, in drawing order. Terminal anchors are never visible.
+def _displayed_family(mobjects:list[Mobject], camera:Camera, excluded_ids:set[int] = frozenset()) -> list[Mobject]:
+	return [member for member in extract_mobject_family_members(mobjects, use_z_index=camera.use_z_index, only_those_with_points=True)
+		if not isinstance(member, _TerminalAnchors) and id(member) not in excluded_ids]
+
+# State of a whole frame of the scene, two frames with equal states are identical: the states of the camera, of the static layers, and of every other mobject drawn
+def frame_state(scene:Scene) -> tuple[tuple, tuple, tuple]:
+	camera:Camera = scene.renderer.camera
+	layers:list[StaticLayer] = [mobject for mobject in scene.mobjects if isinstance(mobject, StaticLayer)]
+	layer_members:list[Mobject] = _displayed_family(layers, camera)
+	return (_camera_state(camera),
+		tuple(mobject_state(member) for member in layer_members),
+		tuple(mobject_state(member) for member in _displayed_family(list_update(scene.mobjects, scene.foreground_mobjects), camera, {id(member) for member in layer_members})))
+
+# Writes the previous frame again instead of rasterizing the scene whenever nothing it draws has changed since that frame, and draws the static layers of the scene from a cached background
+class FrameDeduplicator:
+	def __init__(self:"FrameDeduplicator") -> None:
+		self.rendered_frames:int = 0
+		self.reused_frames:int = 0
+		# Rendered frames which rasterized the static layers again, and which drew them from the cached background
+		self.layer_renders:int = 0
+		self.layer_reuses:int = 0
+		# Seconds spent computing frame states
+		self.state_time:float = 0.
+		self._state:tuple | None = None
+		self._frame:np.ndarray | None = None
+		self._layer_state:tuple | None = None
+		self._layer_image:np.ndarray | None = None
+
+	# Replaces the render method of the scene's Cairo renderer, which is called once per frame of every animation
+	def attach(self:"FrameDeduplicator", scene:Scene) -> "FrameDeduplicator":
+		renderer = scene.renderer
+		if not isinstance(renderer, CairoRenderer):
+			raise ValueError(f'Invalid Renderer: {type(renderer).__name__}, frame deduplication needs the Cairo renderer.')
+		render = renderer.render
+		def deduplicated_render(scene:Scene, time:float, moving_mobjects=None) -> None:
+			if renderer.skip_animations:
+				return render(scene, time, moving_mobjects)
+			self.render(renderer, scene, moving_mobjects)
+		renderer.render = deduplicated_render
+		return self
+
+	def render(self:"FrameDeduplicator", renderer:CairoRenderer, scene:Scene, moving_mobjects) -> None:
+		start:float = time.perf_counter()
+		state:tuple = frame_state(scene)
+		self.state_time += time.perf_counter() - start
+		if self._frame is not None and state == self._state:
+			self.reused_frames += 1
+		else:
+			self.rendered_frames += 1
+			if state[1]:
+				self._update_layered_frame(renderer, scene, state)
+			else:
+				renderer.update_frame(scene, moving_mobjects)
+			# The frame is never modified once written, so the same array is written again for every repeat
+			self._frame = renderer.get_frame()
+			self._state = state
+		renderer.add_frame(self._frame)
+
+	# Draws every mobject which is not part of a static layer over the background of the static layers, rasterizing it again if they changed
+	def _update_layered_frame(self:"FrameDeduplicator", renderer:CairoRenderer, scene:Scene, state:tuple[tuple, tuple, tuple]) -> None:
+		camera:Camera = renderer.camera
+		layers:list[StaticLayer] = [mobject for mobject in scene.mobjects if isinstance(mobject, StaticLayer)]
+		layer_state:tuple = state[:2]
+		if self._layer_image is None or layer_state != self._layer_state:
+			self.layer_renders += 1
+			camera.reset()
+			camera.capture_mobjects(layers)
+			self._layer_image = camera.pixel_array.copy()
+			self._layer_state = layer_state
+		else:
+			self.layer_reuses += 1
+			camera.set_frame_to_background(self._layer_image)
+		camera.capture_mobjects(list_update(scene.mobjects, scene.foreground_mobjects), excluded_mobjects=layers)
+
+	def info(self:"FrameDeduplicator") -> dict:
+		frames:int = self.rendered_frames + self.reused_frames
+		return {
+			'rendered_frames': self.rendered_frames,
+			'reused_frames': self.reused_frames,
+			'reused_fraction': self.reused_frames / frames if frames else 0.,
+			'layer_renders': self.layer_renders,
+			'layer_reuses': self.layer_reuses,
+			'state_time': self.state_time
+		}
+
+	def reset(self:"FrameDeduplicator") -> None:
+		self.rendered_frames = 0
+		self.reused_frames = 0
+		self.layer_renders = 0
+		self.layer_reuses = 0
+		self.state_time = 0.
+		self._state = None
+		self._frame = None
+		self._layer_state = None
+		self._layer_image = None
+
+# Scene deduplicating its static frames and caching its static layers, see FrameDeduplicator
+class CircuitScene(Scene):
+	def __init__(self:"CircuitScene", **kwargs) -> None:
+		super().__init__(**kwargs)
+		self.frame_deduplicator:FrameDeduplicator = FrameDeduplicator()
+		if isinstance(self.renderer, CairoRenderer):
+			self.frame_deduplicator.attach(self)
@@ -1,31 +1,93 @@
+"""
+Terminals of circuit elements.
+All terminals of an element are stored as rows of a single hidden _TerminalAnchors VMobject, a submobject of the element, so that they
+follow every transform applied to the element (shift, scale, rotate, apply_function, animations) exactly like the element's own points.
+Each terminal takes two degenerate cubic curves, from the rightmost to the leftmost and from the top to the bottom point of a small circle
+around it. These give its center and its size under any affine transform, and, being curve anchors, keep the bounding box of the element
+identical to the one of a full Dot per terminal.
+A Terminal is a lightweight view onto its rows, offering the same get_center() and width used on the former Dot based terminals.
+"""
+
 import numpy as np
-from manim import Dot
+from manim import VMobject
 from manim.typing import Vector3D, Point3D
-from manim.constants import ORIGIN
-from manim.utils.color.manim_colors import BLUE
-from functools import reduce
-import operator as op
-
-class Terminal(Dot):
-	def __init__(self, *args, **kwargs):
-		kwargs['radius'] 			= kwargs.get('radius', 1) / 30.
-		kwargs['stroke_width'] 		= kwargs.get('stroke_width', 0)
-		kwargs['fill_opacity'] 		= kwargs.get('fill_opacity', 0)
-		kwargs['stroke_opacity'] 	= kwargs.get('stroke_opacity', 0)
-		kwargs['color']		 		= kwargs.get('color', BLUE.invert()).invert()
-
-		self._terminal_center:Point3D = ORIGIN
-
-		Dot.__init__(self, *args, **kwargs)
-	
-	def generate_points(self) -> None:
-		super().generate_points()
-		self.points = np.concatenate(([self.arc_center for i in range(4)], self.points))
-	
-	def get_center(self) -> Point3D:
-		return self.points[0]
-	def get_arc_center(self) -> Point3D:
-		return self.points[0]
-	def get_center_of_mass(self) -> Point3D:
-		return self.points[0]
-	
+
+# Rows of a terminal within its block of the anchors: the curves +x to -x and +y to -y, with handles on their anchors.
+# Only curve anchors define the bounding box of a VMobject, so every extreme of the terminal circle is an anchor.
+_ROWS_PER_TERMINAL:int = 8
+_CIRCLE_OFFSETS:np.ndarray = np.array([[1, 0, 0], [1, 0, 0], [-1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, 1, 0], [0, -1, 0], [0, -1, 0]], dtype=float)
+
+# Invisible VMobject holding the anchor rows of every terminal of an element
+class _TerminalAnchors(VMobject):
+	def __init__(self:"_TerminalAnchors", coords:list[list[float]], radius:float = 1, **kwargs) -> None:
+		self._initial_coords:np.ndarray = np.array(coords, dtype=float).reshape(-1, 3)
+		self._radius:float = radius
+		kwargs['stroke_width'] 		= 0
+		kwargs['fill_opacity'] 		= 0
+		kwargs['stroke_opacity'] 	= 0
+		VMobject.__init__(self, **kwargs)
+
+	def generate_points(self:"_TerminalAnchors") -> None:
+		self.points = (self._initial_coords[:, None, :] + self._radius * _CIRCLE_OFFSETS[None, :, :]).reshape(-1, 3)
+
+	# Partial animations (Create, Uncreate, ShowPassingFlash...) draw parts of the element's curves, but anchors must always remain whole
+	def pointwise_become_partial(self:"_TerminalAnchors", vmobject:VMobject, a:float, b:float) -> "_TerminalAnchors":
+		if isinstance(vmobject, _TerminalAnchors) and len(vmobject.points) == len(self.points):
+			self.points = vmobject.points.copy()
+		return self
+
+	# Transforms between elements with different numbers of terminals pad the shorter anchors with copies of their last terminal, which keeps the rows of every terminal in place
+	def align_points(self:"_TerminalAnchors", vmobject:VMobject) -> "_TerminalAnchors":
+		if not isinstance(vmobject, _TerminalAnchors):
+			return VMobject.align_points(self, vmobject)
+		row_count:int = max(len(self.points), len(vmobject.points))
+		for anchors in (self, vmobject):
+			if 0 < len(anchors.points) < row_count:
+				missing:int = (row_count - len(anchors.points)) // _ROWS_PER_TERMINAL
+				anchors.points = np.concatenate((anchors.points, np.tile(anchors.points[-_ROWS_PER_TERMINAL:], (missing, 1))))
+		return self
+
+	# Center of the terminal at the given index: the midpoint of its +x and -x anchors, exact under any affine transform
+	def get_terminal_center(self:"_TerminalAnchors", index:int) -> Point3D:
+		row:int = index * _ROWS_PER_TERMINAL
+		return (self.points[row] + self.points[row + 3]) / 2
+
+	# Width of the transformed terminal circle: the x extent of the ellipse spanned by its two half axes
+	def get_terminal_width(self:"_TerminalAnchors", index:int) -> float:
+		row:int = index * _ROWS_PER_TERMINAL
+		half_x:np.ndarray = (self.points[row] - self.points[row + 3]) / 2
+		half_y:np.ndarray = (self.points[row + 4] - self.points[row + 7]) / 2
+		return 2 * float(np.hypot(half_x[0], half_y[0]))
+
+	def shift_terminal(self:"_TerminalAnchors", index:int, vector:Vector3D) -> None:
+		row:int = index * _ROWS_PER_TERMINAL
+		if not self.points.flags.writeable:
+			self.points = self.points.copy()
+		self.points[row:row + _ROWS_PER_TERMINAL] += vector
+
+# View onto the rows of one terminal in its element's anchors. Terminals are compared by identity, and are copied along with their element.
+class Terminal:
+	__slots__ = ('_anchors', '_index')
+
+	def __init__(self:"Terminal", anchors:_TerminalAnchors, index:int) -> None:
+		self._anchors:_TerminalAnchors = anchors
+		self._index:int = index
+
+	def get_center(self:"Terminal") -> Point3D:
+		return self._anchors.get_terminal_center(self._index)
+	def get_arc_center(self:"Terminal") -> Point3D:
+		return self.get_center()
+	def get_center_of_mass(self:"Terminal") -> Point3D:
+		return self.get_center()
+
+	@property
+	def width(self:"Terminal") -> float:
+		return self._anchors.get_terminal_width(self._index)
+
+	# Moves this terminal alone, ex: the ends of a Wire. Moving the element moves all of its terminals with it.
+	def shift(self:"Terminal", vector:Vector3D) -> "Terminal":
+		self._anchors.shift_terminal(self._index, np.asarray(vector, dtype=float))
+		return self
+
+	def move_to(self:"Terminal", point:Point3D) -> "Terminal":
+		return self.shift(np.asarray(point, dtype=float) - self.get_center())
@@ -0,0 +1,58 @@
+"""
+Circuit building utilities: wiring, netlists, SPICE import, circuit simulation, logic simulation, routing, layout, generators and
+batched transforms.
+Every public name is imported lazily on first access (PEP 562), so that importing this package does not import manim.
+"""
+
+import importlib
+import importlib.util
+
+# Module defining each public name
+_LAZY_ATTRIBUTES:dict[str, str] = {
+	'connect_with_straight_wire'	: 'manim_hkn.utils.circuitBuilder',
+	'connect_with_square_wire'		: 'manim_hkn.utils.circuitBuilder',
+	'split_wire'					: 'manim_hkn.utils.circuitBuilder',
+	'Circuit'						: 'manim_hkn.utils.netlist',
+	'import_spice'					: 'manim_hkn.utils.spiceImporter',
+	'build_spice_circuit'			: 'manim_hkn.utils.spiceImporter',
+	'SpiceCircuit'					: 'manim_hkn.utils.spiceImporter',
+	'parse_spice'					: 'manim_hkn.utils.spiceParser',
+	'parse_spice_value'				: 'manim_hkn.utils.spiceParser',
+	'SpiceCard'						: 'manim_hkn.utils.spiceParser',
+	'CircuitSolver'					: 'manim_hkn.utils.solver',
+	'SolverElement'					: 'manim_hkn.utils.solver',
+	'SimulationResult'				: 'manim_hkn.utils.solver',
+	'LogicNetwork'					: 'manim_hkn.utils.logicSim',
+	'LogicTrace'					: 'manim_hkn.utils.logicSim',
+	'SignalPainter'					: 'manim_hkn.utils.logicSim',
+	'OrthogonalRouter'				: 'manim_hkn.utils.router',
+	'layout_elements'				: 'manim_hkn.utils.layout',
+	'layout_circuit'				: 'manim_hkn.utils.layout',
+	'CircuitArray'					: 'manim_hkn.utils.generators',
+	'ladder'						: 'manim_hkn.utils.generators',
+	'rc_ladder'						: 'manim_hkn.utils.generators',
+	'lc_ladder'						: 'manim_hkn.utils.generators',
+	'r2r_dac'						: 'manim_hkn.utils.generators',
+	'resistor_grid'					: 'manim_hkn.utils.generators',
+	'batch_transform'				: 'manim_hkn.utils.batchTransform',
+	'BatchTransform'				: 'manim_hkn.utils.batchTransform'
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name:str):
+	if name.startswith('__'):
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+	if name in _LAZY_ATTRIBUTES:
+		value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+	elif importlib.util.find_spec(f'{__name__}.{name}') is not None:
+		# Submodules, ex: from manim_hkn.utils import circuitBuilder
+		value = importlib.import_module(f'{__name__}.{name}')
+	else:
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+	# Cached on the module, so later accesses skip __getattr__
+	globals()[name] = value
+	return value
+
+def __dir__() -> list[str]:
+	return sorted(set(globals()) | set(__all__))
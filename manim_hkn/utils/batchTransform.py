@@ -0,0 +1,139 @@
+"""
+Batched transforms of many circuit elements at once.
+Transforms recorded on a BatchTransform (shift, scale, rotate, stretch, flip, apply_matrix, move_to) are only composed into one affine map.
+When the batch is applied, on leaving its with block, the points of every mobject in the batch are transformed by a single matrix multiply
+over their concatenation, and the wires depending on them are then resolved once, by their Circuit or by their own shape update.
+Stroke widths follow the new scale lazily: each element recomputes its width once, the next time it is read.
+
+	with batch_transform(circuit) as batch:
+		batch.scale(0.4).shift(LEFT * 2).rotate(PI / 2)
+"""
+
+import numpy as np
+from manim import Mobject
+from manim.constants import ORIGIN, OUT, UP, PI
+from manim.typing import Vector3D, Point3D
+from manim.utils.space_ops import rotation_matrix
+from manim_hkn.cElements import Wire
+from manim_hkn.utils.netlist import Circuit
+
+class BatchTransform:
+	def __init__(self:"BatchTransform", *mobjects:Mobject) -> None:
+		if len(mobjects) == 0:
+			raise ValueError('Invalid Mobjects: (), a batch transform needs at least one mobject.')
+		self._mobjects:tuple[Mobject, ...] = mobjects
+		# The composed transform maps every point p to _matrix @ p + _offset
+		self._matrix:np.ndarray = np.identity(3)
+		self._offset:np.ndarray = np.zeros(3)
+		# Points defining the boundary of the batched mobjects before any transform
+		self._initial_boundary:np.ndarray | None = None
+
+	def __enter__(self:"BatchTransform") -> "BatchTransform":
+		return self
+
+	def __exit__(self:"BatchTransform", exc_type, exc_value, traceback) -> None:
+		if exc_type is None:
+			self.apply()
+
+	def _get_initial_boundary(self:"BatchTransform") -> np.ndarray:
+		if self._initial_boundary is None:
+			self._initial_boundary = np.concatenate([mobject.get_points_defining_boundary() for mobject in self._mobjects]).reshape(-1, 3)
+		return self._initial_boundary
+
+	# Center of the bounding box of the batched mobjects as transformed so far, like Mobject.get_center after the same transforms.
+	# Scale, rotate and stretch default to transforming about it, like the mobject methods.
+	def get_center(self:"BatchTransform") -> Point3D:
+		boundary:np.ndarray = self._get_initial_boundary()
+		if len(boundary) == 0:
+			return self._offset.copy()
+		boundary = boundary @ self._matrix.T + self._offset
+		return (boundary.min(axis=0) + boundary.max(axis=0)) / 2
+
+	# Composes the linear map, applied about the given point, after the transforms recorded so far
+	def _compose(self:"BatchTransform", matrix:np.ndarray, about_point:Point3D | None) -> "BatchTransform":
+		about_point = self.get_center() if about_point is None else np.asarray(about_point, dtype=float)
+		self._matrix = matrix @ self._matrix
+		self._offset = matrix @ (self._offset - about_point) + about_point
+		return self
+
+	def shift(self:"BatchTransform", *vectors:Vector3D) -> "BatchTransform":
+		self._offset = self._offset + np.sum(np.asarray(vectors, dtype=float).reshape(-1, 3), axis=0)
+		return self
+
+	def move_to(self:"BatchTransform", point:Point3D) -> "BatchTransform":
+		return self.shift(np.asarray(point, dtype=float) - self.get_center())
+
+	def scale(self:"BatchTransform", scale_factor:float, about_point:Point3D | None = None) -> "BatchTransform":
+		return self._compose(scale_factor * np.identity(3), about_point)
+
+	def stretch(self:"BatchTransform", factor:float, dim:int, about_point:Point3D | None = None) -> "BatchTransform":
+		if dim not in (0, 1, 2):
+			raise ValueError(f'Invalid Dimension: {dim}, it must be 0, 1 or 2.')
+		matrix:np.ndarray = np.identity(3)
+		matrix[dim, dim] = factor
+		return self._compose(matrix, about_point)
+
+	def rotate(self:"BatchTransform", angle:float, axis:Vector3D = OUT, about_point:Point3D | None = None) -> "BatchTransform":
+		return self._compose(rotation_matrix(angle, axis), about_point)
+
+	def flip(self:"BatchTransform", axis:Vector3D = UP, about_point:Point3D | None = None) -> "BatchTransform":
+		return self.rotate(PI, axis, about_point)
+
+	# Like Mobject.apply_matrix, the matrix is applied about the origin unless an about point is given
+	def apply_matrix(self:"BatchTransform", matrix:np.ndarray, about_point:Point3D = ORIGIN) -> "BatchTransform":
+		full_matrix:np.ndarray = np.identity(3)
+		matrix = np.asarray(matrix, dtype=float)
+		full_matrix[:matrix.shape[0], :matrix.shape[1]] = matrix
+		return self._compose(full_matrix, about_point)
+
+	# Transforms the points of every mobject in the batch at once, resolves the dependent wires once, and resets the batch to the identity
+	def apply(self:"BatchTransform") -> "BatchTransform":
+		members:list[Mobject] = []
+		circuits:list[Circuit] = []
+		member_ids:set[int] = set()
+		for mobject in self._mobjects:
+			for member in mobject.get_family():
+				if id(member) in member_ids:
+					continue
+				member_ids.add(id(member))
+				if isinstance(member, Circuit):
+					circuits.append(member)
+				if len(member.points) > 0:
+					members.append(member)
+		if not members or (np.array_equal(self._matrix, np.identity(3)) and not self._offset.any()):
+			return self._reset()
+
+		# Wires up to date with their points stay so, as the map keeps the shape of their path
+		wires:list[Wire] = [member for member in members if isinstance(member, Wire)]
+		up_to_date:list[bool] = [wire._generated_version == wire._points_version for wire in wires]
+		resolved_circuits:list[Circuit] = [circuit for circuit in circuits if circuit._is_resolved()]
+
+		sizes:np.ndarray = np.fromiter((len(member.points) for member in members), dtype=np.intp, count=len(members))
+		transformed:np.ndarray = np.concatenate([member.points for member in members]) @ self._matrix.T + self._offset
+		for member, points in zip(members, np.split(transformed, np.cumsum(sizes)[:-1])):
+			member.points = points
+
+		for wire, was_up_to_date in zip(wires, up_to_date):
+			if was_up_to_date:
+				wire._sync_generated_path()
+
+		for circuit in resolved_circuits:
+			circuit._transform_resolved(self._matrix, self._offset)
+
+		# One wire pass: every circuit resolves all of its wires together, and wires outside a circuit update their own shape
+		for circuit in circuits:
+			circuit.resolve()
+		for wire in wires:
+			if Wire._update_shape in wire.get_updaters():
+				wire._update_shape()
+		return self._reset()
+
+	def _reset(self:"BatchTransform") -> "BatchTransform":
+		self._matrix = np.identity(3)
+		self._offset = np.zeros(3)
+		self._initial_boundary = None
+		return self
+
+# Returns a batch transform over the given mobjects (circuits, groups or single elements), meant to be used as a context manager
+def batch_transform(*mobjects:Mobject) -> BatchTransform:
+	return BatchTransform(*mobjects)
@@ -1,47 +1,59 @@
+from typing import Sequence
+import numpy as np
 from manim.constants import X_AXIS, Y_AXIS, Z_AXIS
+from manim_hkn import geometry
 from manim_hkn.terminal import Terminal
 from manim_hkn.cElements import Wire, _CircuitElementTemplate
 
-def connect_with_straight_wire(left_cElem:_CircuitElementTemplate, left_terminal:Terminal, right_cElem:_CircuitElementTemplate, right_terminal:Terminal):
+def connect_with_straight_wire(left_cElem:_CircuitElementTemplate, left_terminal:Terminal, right_cElem:_CircuitElementTemplate, right_terminal:Terminal, update_shape:bool = True):
 	wire = Wire()
 	if left_cElem is not None and left_terminal is not None:
-		wire.bind_terminal('left',  left_cElem,  left_terminal,  X_AXIS+Y_AXIS+Z_AXIS)
+		wire.bind_terminal('left',  left_cElem,  left_terminal,  X_AXIS+Y_AXIS+Z_AXIS, update_shape)
 	if right_cElem is not None and right_terminal is not None:
-		wire.bind_terminal('right', right_cElem, right_terminal, X_AXIS+Y_AXIS+Z_AXIS)
+		wire.bind_terminal('right', right_cElem, right_terminal, X_AXIS+Y_AXIS+Z_AXIS, update_shape)
 	return wire
-def connect_with_square_wire(x_cElem:_CircuitElementTemplate, x_terminal:Terminal, y_cElem:_CircuitElementTemplate, y_terminal:Terminal, animation_start:str = 'x'):
+def connect_with_square_wire(x_cElem:_CircuitElementTemplate, x_terminal:Terminal, y_cElem:_CircuitElementTemplate, y_terminal:Terminal, animation_start:str = 'x', update_shape:bool = True):
 	if animation_start != 'x' and animation_start != 'y':
 		raise ValueError('Animation start must be either \'x\' or \'y\', corresponding to which terminal to start geometry generation at so that the user can specify create animation behaviors.')
 
 	hWire = Wire()
 	vWire = Wire()
 
-	vWire.bind_terminal('left' if animation_start == 'x' else 'right', x_cElem, x_terminal, X_AXIS+Y_AXIS+Z_AXIS)
-	hWire.bind_terminal('left' if animation_start == 'y' else 'right', y_cElem, y_terminal, X_AXIS+Y_AXIS+Z_AXIS)
+	vWire.bind_terminal('left' if animation_start == 'x' else 'right', x_cElem, x_terminal, X_AXIS+Y_AXIS+Z_AXIS, update_shape)
+	hWire.bind_terminal('left' if animation_start == 'y' else 'right', y_cElem, y_terminal, X_AXIS+Y_AXIS+Z_AXIS, update_shape)
 
-	vWire.bind_terminal('right' if animation_start == 'x' else 'left', x_cElem, x_terminal, X_AXIS)
-	vWire.bind_terminal('right' if animation_start == 'x' else 'left', y_cElem, y_terminal, Y_AXIS)
-	hWire.bind_terminal('right' if animation_start == 'y' else 'left', x_cElem, x_terminal, X_AXIS)
-	hWire.bind_terminal('right' if animation_start == 'y' else 'left', y_cElem, y_terminal, Y_AXIS)
+	vWire.bind_terminal('right' if animation_start == 'x' else 'left', x_cElem, x_terminal, X_AXIS, update_shape)
+	vWire.bind_terminal('right' if animation_start == 'x' else 'left', y_cElem, y_terminal, Y_AXIS, update_shape)
+	hWire.bind_terminal('right' if animation_start == 'y' else 'left', x_cElem, x_terminal, X_AXIS, update_shape)
+	hWire.bind_terminal('right' if animation_start == 'y' else 'left', y_cElem, y_terminal, Y_AXIS, update_shape)
 
 	return hWire, vWire
-def split_wire(wire:Wire, split_point:float = 0.5):
-	if split_point <= 0 or split_point >= 1:
-		raise ValueError('split_point must be between 0 and 1 (exclusive), to determine the location on the wire to split it into 2 wires.')
-	lWire = wire.copy()
-	rWire = wire.copy()
-	
-	lWire._terminal_bindings['left']  = wire._terminal_bindings['left']
-	lWire._terminal_bindings['right'] = [None, None, None]
-	rWire._terminal_bindings['left'] = [None, None, None]
-	rWire._terminal_bindings['right'] = wire._terminal_bindings['right']
+# Splits a wire into len(split_points) + 1 consecutive wires, at the given fractions of its length along its path, ex: the taps of a bus.
+# Each piece is a copy of the wire, which shares its geometry until the piece's path is generated once from its own endpoints and waypoints.
+def split_wire(wire:Wire, split_point:float | Sequence[float] = 0.5) -> tuple[Wire, ...]:
+	split_points:np.ndarray = np.atleast_1d(np.asarray(split_point, dtype=float))
+	if np.any(split_points <= 0) or np.any(split_points >= 1) or np.any(np.diff(split_points) <= 0):
+		raise ValueError('split_point must be between 0 and 1 (exclusive), to determine the location on the wire to split it into 2 wires. Several split points must be increasing.')
 
 	lCoord = wire.get_terminal_coord('left')
 	rCoord = wire.get_terminal_coord('right')
-
-	lWire.set_terminal_coordinate('left', lCoord)
-	lWire.set_terminal_coordinate('right', lCoord + (rCoord - lCoord) * split_point)
-	rWire.set_terminal_coordinate('left', lWire.get_terminal_coord('right'))
-	rWire.set_terminal_coordinate('right', rCoord)
-
-	return lWire, rWire
+	vertices = wire._path_vertices(np.array([lCoord, rCoord]))
+	# Wires with waypoints are split along their path, and each piece keeps the waypoints between its ends
+	splits = [geometry.split_polyline(vertices, fraction) for fraction in split_points]
+	ends = [lCoord, *(splitCoord for splitCoord, _, _ in splits), rCoord]
+	firsts = [1, *(after for _, _, after in splits)]
+	lasts = [*(before + 1 for _, before, _ in splits), len(vertices) - 1]
+
+	pieces:list[Wire] = []
+	for index in range(len(ends) - 1):
+		piece = wire.copy()
+		piece._terminal_bindings = {
+				'left'  : list(wire._terminal_bindings['left']) if index == 0 else [None, None, None],
+				'right' : list(wire._terminal_bindings['right']) if index == len(ends) - 2 else [None, None, None]
+			}
+		waypoints = vertices[firsts[index]:lasts[index]]
+		piece._waypoints = waypoints if len(waypoints) else None
+		piece._generated_coordinates = None
+		piece._apply_coordinates(np.array([ends[index], ends[index + 1]], dtype=float))
+		pieces.append(piece)
+	return tuple(pieces)
@@ -0,0 +1,217 @@
+"""
+Parametric generators of repeated circuit structures: ladders (RC, LC), R-2R DACs and resistor grids.
+Each generator builds the whole structure as a single CircuitArray mobject: the canonical geometry of every element type is taken once
+from the geometry cache, every instance is placed by one batched transform, and all element and wire curves are stored in one contiguous
+points buffer. Only the outer ports of the structure are Terminals, every internal node is a row of a coordinate table, and no updaters
+are attached, so a structure of thousands of elements costs a single mobject per frame.
+"""
+
+import numpy as np
+from manim_hkn.cElements import _CircuitElementTemplate, _SharedPoints, Resistor, Capacitor, Inductor
+from manim_hkn import geometry
+
+# Composite circuit element holding the points of many placed elements and the wires between them, built by the generators below
+class CircuitArray(_CircuitElementTemplate):
+	# The geometry is assembled by a generator, so it is never looked up in the geometry cache
+	_GEOMETRY_KEY_ATTRS:tuple[str, ...] | None = None
+	# The assembled geometry and node table are only ever replaced, so copies share them
+	_SHARED_ATTRS:tuple[str, ...] = (*_CircuitElementTemplate._SHARED_ATTRS, '_array_points', '_node_coords', '_node_indices')
+
+	def __init__(self:"CircuitArray",
+			  points:np.ndarray,
+			  ports:dict[str, np.ndarray],
+			  node_names:list[str],
+			  node_coords:np.ndarray,
+			  components:dict[str, tuple[type, slice]],
+			  **kwargs) -> None:
+		self._array_points:np.ndarray = points
+		# Coordinate table of the internal nodes, ex: get_node_coord('n3')
+		self.node_names:list[str] = node_names
+		self._node_indices:dict[str, int] = {name: index for index, name in enumerate(node_names)}
+		self._node_coords:np.ndarray = node_coords
+		# Element type and range of points of every placed element, ex: components['R3'] == (Resistor, slice(156, 208))
+		self.components:dict[str, tuple[type, slice]] = components
+		super().__init__(terminalCoords=ports, **kwargs)
+
+	# The assembled geometry is shared copy-on-write, so transforming the array (ex: in place, by rotate or scale) leaves it untouched
+	def generate_points(self:"CircuitArray") -> None:
+		self.points = _SharedPoints.share(self, self._array_points)
+		super().generate_points()
+
+	# The node table is kept in the array's original frame, and mapped through the transform relating the current ports to the original ones when read
+	def get_node_coord(self:"CircuitArray", name:str) -> np.ndarray:
+		if name not in self._node_indices:
+			raise ValueError(f'Invalid Node: {name}.')
+		return self.get_node_coords()[self._node_indices[name]]
+
+	def get_node_coords(self:"CircuitArray") -> np.ndarray:
+		original:np.ndarray = np.array(list(self._terminal_coords.values()), dtype=float)
+		current:np.ndarray = np.array([terminal.get_center() for terminal in self._terminals.values()])
+		# Least squares affine map from the original port coordinates to the current ones (exact for translations, rotations and uniform scaling)
+		if len(original) == 1:
+			return self._node_coords + (current[0] - original[0])
+		original_center:np.ndarray = original.mean(axis=0)
+		current_center:np.ndarray = current.mean(axis=0)
+		linear_map, *_ = np.linalg.lstsq(original[:, :2] - original_center[:2], current[:, :2] - current_center[:2], rcond=None)
+		coords:np.ndarray = self._node_coords - original_center
+		coords[:, :2] = coords[:, :2] @ linear_map
+		return coords + current_center
+
+	# Points of a single placed element, ex: to highlight one resistor of a ladder
+	def get_component_points(self:"CircuitArray", name:str) -> np.ndarray:
+		if name not in self.components:
+			raise ValueError(f'Invalid Component: {name}.')
+		return self.points[self.components[name][1]]
+
+# Accumulates placed elements and wires, and assembles them into a CircuitArray
+class _ArrayBuilder:
+	def __init__(self:"_ArrayBuilder") -> None:
+		self._blocks:list[np.ndarray] = []
+		self._point_count:int = 0
+		self._components:dict[str, tuple[type, slice]] = {}
+		self._prototypes:dict[type, _CircuitElementTemplate] = {}
+
+	# One instance per element type gives the canonical points and terminals, from the geometry cache after the first construction
+	def _prototype(self:"_ArrayBuilder", element_type:type) -> _CircuitElementTemplate:
+		if element_type not in self._prototypes:
+			self._prototypes[element_type] = element_type()
+		return self._prototypes[element_type]
+
+	# Places one instance of the element type at each center, turned by the given number of counterclockwise quarter turns, and returns the coordinates of each of their terminals
+	def place(self:"_ArrayBuilder", element_type:type, centers:np.ndarray, names:list[str], quarter_turns:int = 0) -> dict[str, np.ndarray]:
+		prototype:_CircuitElementTemplate = self._prototype(element_type)
+		centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+		cosine, sine = [(1, 0), (0, 1), (-1, 0), (0, -1)][quarter_turns % 4]
+		rotation:np.ndarray = np.array([[cosine, -sine, 0], [sine, cosine, 0], [0, 0, 1]], dtype=float)
+
+		canonical:np.ndarray = prototype.points @ rotation.T
+		block:np.ndarray = (canonical[None, :, :] + centers[:, None, :]).reshape(-1, 3)
+		self._append(block)
+		for index, name in enumerate(names):
+			start:int = self._point_count - len(block) + index * len(canonical)
+			self._components[name] = (element_type, slice(start, start + len(canonical)))
+		return {
+			terminal_name: (rotation @ prototype.get_terminal_coord(terminal_name))[None, :] + centers
+			for terminal_name in prototype._terminals}
+
+	# Adds straight wires from every start coordinate to the matching end coordinate
+	def wires(self:"_ArrayBuilder", starts:np.ndarray, ends:np.ndarray) -> None:
+		starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+		ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+		keep:np.ndarray = np.any(starts != ends, axis=1)
+		t_values:np.ndarray = np.linspace(0, 1, geometry.N_POINTS_PER_CUBIC_CURVE)[None, :, None]
+		self._append(((1 - t_values) * starts[keep, None, :] + t_values * ends[keep, None, :]).reshape(-1, 3))
+
+	def _append(self:"_ArrayBuilder", block:np.ndarray) -> None:
+		self._blocks.append(block)
+		self._point_count += len(block)
+
+	def build(self:"_ArrayBuilder", ports:dict[str, np.ndarray], nodes:dict[str, np.ndarray], **kwargs) -> CircuitArray:
+		node_names:list[str] = list(nodes)
+		node_coords:np.ndarray = np.array([nodes[name] for name in node_names], dtype=float).reshape(-1, 3)
+		return CircuitArray(np.concatenate(self._blocks), ports, node_names, node_coords, dict(self._components), **kwargs)
+
+# Reference designator letters of the element types, used to name the placed elements
+_DESIGNATORS:dict[type, str] = {Resistor: 'R', Capacitor: 'C', Inductor: 'L'}
+
+def _designator(element_type:type) -> str:
+	return _DESIGNATORS.get(element_type, element_type.__name__)
+
+# Series element length, between its two terminals
+def _span(builder:_ArrayBuilder, element_type:type) -> float:
+	prototype:_CircuitElementTemplate = builder._prototype(element_type)
+	return float(np.linalg.norm(prototype.get_terminal_coord('right') - prototype.get_terminal_coord('left')))
+
+# Ladder of stages, each a series element followed by a shunt element to the ground rail, ex: ladder(5, Inductor, Capacitor) for an LC low-pass filter.
+# Ports: 'in' and 'out' on the signal line, 'ground' at the start of the ground rail. Nodes: 'n0' (input) to 'n{stages}' (output).
+def ladder(stages:int, series_type:type = Resistor, shunt_type:type = Capacitor, gap:float = 1., **kwargs) -> CircuitArray:
+	if stages < 1:
+		raise ValueError(f'Invalid Stage Count: {stages}, a ladder must have at least one stage.')
+	builder = _ArrayBuilder()
+	series_span:float = _span(builder, series_type)
+	shunt_span:float = _span(builder, shunt_type)
+	pitch:float = series_span + gap
+	rail_y:float = -(shunt_span + 2 * gap)
+
+	# Node k sits at the gap before series element k, node 'stages' at the gap after the last one
+	node_x:np.ndarray = np.arange(stages + 1) * pitch
+	zeros:np.ndarray = np.zeros(stages + 1)
+	nodes:np.ndarray = np.stack((node_x, zeros, zeros), axis=1)
+	series:dict[str, np.ndarray] = builder.place(series_type, nodes[:-1] + [pitch / 2, 0, 0], [f'{_designator(series_type)}{k}' for k in range(stages)])
+	shunt_centers:np.ndarray = nodes[1:] + [0, rail_y / 2, 0]
+	shunt:dict[str, np.ndarray] = builder.place(shunt_type, shunt_centers, [f'{_designator(shunt_type)}{k}' for k in range(stages)], quarter_turns=1)
+
+	builder.wires(nodes[:-1], series['left'])
+	builder.wires(series['right'], nodes[1:])
+	builder.wires(nodes[1:], shunt['right'])
+	builder.wires(shunt['left'], shunt['left'] * [1, 0, 1] + [0, rail_y, 0])
+	rail_start:np.ndarray = np.array([0, rail_y, 0])
+	rail_end:np.ndarray = nodes[-1] + [0, rail_y, 0]
+	builder.wires(rail_start, rail_end)
+
+	ports:dict[str, np.ndarray] = {'in': nodes[0], 'out': nodes[-1], 'ground': rail_start}
+	return builder.build(ports, {f'n{k}': node for k, node in enumerate(nodes)}, **kwargs)
+
+def rc_ladder(stages:int, **kwargs) -> CircuitArray:
+	return ladder(stages, Resistor, Capacitor, **kwargs)
+
+def lc_ladder(stages:int, **kwargs) -> CircuitArray:
+	return ladder(stages, Inductor, Capacitor, **kwargs)
+
+# R-2R ladder DAC. The R resistors run along the output line, and a 2R leg drops from every node to its bit input, with the LSB end terminated by a 2R to ground.
+# Ports: 'out' (MSB end), 'b0' (LSB) to 'b{bits - 1}' (MSB), 'ground'. Nodes: 'n0' to 'n{bits - 1}'.
+def r2r_dac(bits:int, gap:float = 1., **kwargs) -> CircuitArray:
+	if bits < 1:
+		raise ValueError(f'Invalid Bit Count: {bits}, a DAC must have at least one bit.')
+	builder = _ArrayBuilder()
+	span:float = _span(builder, Resistor)
+	pitch:float = span + gap
+	leg_y:float = -(span + 2 * gap)
+
+	# The termination leg sits one pitch left of node 0, and drops to ground like the bit legs
+	node_x:np.ndarray = np.arange(-1, bits) * pitch
+	zeros:np.ndarray = np.zeros(bits + 1)
+	nodes:np.ndarray = np.stack((node_x, zeros, zeros), axis=1)
+	bit_nodes:np.ndarray = nodes[1:]
+	series:dict[str, np.ndarray] = builder.place(Resistor, bit_nodes[:-1] + [pitch / 2, 0, 0], [f'R{k}' for k in range(bits - 1)])
+	legs:dict[str, np.ndarray] = builder.place(Resistor, nodes + [0, leg_y / 2, 0], ['R_term'] + [f'R2_{k}' for k in range(bits)], quarter_turns=1)
+
+	builder.wires(bit_nodes[:-1], series['left'])
+	builder.wires(series['right'], bit_nodes[1:])
+	builder.wires(nodes[0], nodes[1])
+	builder.wires(nodes, legs['right'])
+	leg_ends:np.ndarray = nodes + [0, leg_y, 0]
+	builder.wires(legs['left'], leg_ends)
+
+	output:np.ndarray = bit_nodes[-1] + [gap, 0, 0]
+	builder.wires(bit_nodes[-1], output)
+	ports:dict[str, np.ndarray] = {'out': output, 'ground': leg_ends[0]}
+	ports.update({f'b{k}': leg_ends[k + 1] for k in range(bits)})
+	return builder.build(ports, {f'n{k}': node for k, node in enumerate(bit_nodes)}, **kwargs)
+
+# Mesh of resistors between the neighboring nodes of a rows x cols grid. Ports: the four corners. Nodes: 'n{row}_{col}', row 0 at the top.
+def resistor_grid(rows:int, cols:int, gap:float = 1., **kwargs) -> CircuitArray:
+	if rows < 1 or cols < 1 or rows * cols < 2:
+		raise ValueError(f'Invalid Grid Size: {rows}x{cols}, a resistor grid must have at least two nodes.')
+	builder = _ArrayBuilder()
+	pitch:float = _span(builder, Resistor) + 2 * gap
+	row_index, col_index = np.meshgrid(np.arange(rows), np.arange(cols), indexing='ij')
+	grid:np.ndarray = np.stack((col_index * pitch, -row_index * pitch, np.zeros((rows, cols))), axis=2)
+
+	horizontal_starts:np.ndarray = grid[:, :-1].reshape(-1, 3)
+	horizontal_ends:np.ndarray = grid[:, 1:].reshape(-1, 3)
+	vertical_starts:np.ndarray = grid[1:, :].reshape(-1, 3)
+	vertical_ends:np.ndarray = grid[:-1, :].reshape(-1, 3)
+	horizontal:dict[str, np.ndarray] = builder.place(Resistor, (horizontal_starts + horizontal_ends) / 2,
+		[f'RH{row}_{col}' for row in range(rows) for col in range(cols - 1)])
+	vertical:dict[str, np.ndarray] = builder.place(Resistor, (vertical_starts + vertical_ends) / 2,
+		[f'RV{row}_{col}' for row in range(rows - 1) for col in range(cols)], quarter_turns=1)
+
+	builder.wires(np.concatenate((horizontal_starts, vertical_starts)), np.concatenate((horizontal['left'], vertical['left'])))
+	builder.wires(np.concatenate((horizontal['right'], vertical['right'])), np.concatenate((horizontal_ends, vertical_ends)))
+
+	ports:dict[str, np.ndarray] = {
+		'top_left': grid[0, 0], 'top_right': grid[0, -1],
+		'bottom_left': grid[-1, 0], 'bottom_right': grid[-1, -1]}
+	nodes:dict[str, np.ndarray] = {f'n{row}_{col}': grid[row, col] for row in range(rows) for col in range(cols)}
+	return builder.build(ports, nodes, **kwargs)
@@ -0,0 +1,249 @@
+"""
+Layered (Sugiyama-style) schematic layout engine.
+Elements are placed in layers along the signal flow, from left to right: cycles are broken, elements are layered by longest path, long
+edges are split by dummy nodes, layers are ordered by barycenter sweeps, and elements are spaced along each layer and snapped to a grid.
+All positions are computed on NumPy arrays, and the final rotations and translations of every element are applied in a single batch.
+"""
+
+import math
+from typing import Iterable
+import numpy as np
+from manim_hkn.cElements import Wire, _CircuitElementTemplate
+from manim_hkn.utils.netlist import Circuit
+
+# Terminal names which drive the net they are on, used to orient the nets of a Circuit into signal flow
+DRIVING_TERMINALS:frozenset[str] = frozenset(('output', 'right', 'positive', 'collector', 'top'))
+
+# Reverses the edges closing cycles, found by an iterative depth first search, so that the graph becomes acyclic
+def _break_cycles(node_count:int, edges:np.ndarray) -> np.ndarray:
+	successors:list[list[int]] = [[] for _ in range(node_count)]
+	for edge_index, (source, dest) in enumerate(edges):
+		successors[source].append(edge_index)
+	# 0: unvisited, 1: on the current search path, 2: done
+	state:np.ndarray = np.zeros(node_count, dtype=np.int8)
+	reverse:np.ndarray = np.zeros(len(edges), dtype=bool)
+	for root in range(node_count):
+		if state[root]:
+			continue
+		state[root] = 1
+		stack:list[tuple[int, int]] = [(root, 0)]
+		while stack:
+			node, next_edge = stack[-1]
+			if next_edge == len(successors[node]):
+				state[node] = 2
+				stack.pop()
+				continue
+			stack[-1] = (node, next_edge + 1)
+			edge_index:int = successors[node][next_edge]
+			dest:int = edges[edge_index, 1]
+			if state[dest] == 1:
+				reverse[edge_index] = True
+			elif state[dest] == 0:
+				state[dest] = 1
+				stack.append((dest, 0))
+	edges = edges.copy()
+	edges[reverse] = edges[reverse][:, ::-1]
+	return edges
+
+# Layers every node of an acyclic graph by the length of the longest path reaching it, in topological (Kahn) order
+def _longest_path_layers(node_count:int, edges:np.ndarray) -> np.ndarray:
+	order:np.ndarray = np.argsort(edges[:, 0], kind='stable')
+	sorted_dests:np.ndarray = edges[order, 1]
+	indptr:np.ndarray = np.searchsorted(edges[order, 0], np.arange(node_count + 1))
+	in_degree:np.ndarray = np.bincount(edges[:, 1], minlength=node_count)
+	layers:np.ndarray = np.zeros(node_count, dtype=np.intp)
+	ready:list[int] = np.flatnonzero(in_degree == 0).tolist()
+	while ready:
+		node:int = ready.pop()
+		dests:np.ndarray = sorted_dests[indptr[node]:indptr[node + 1]]
+		if len(dests) == 0:
+			continue
+		np.maximum.at(layers, dests, layers[node] + 1)
+		np.subtract.at(in_degree, dests, 1)
+		ready.extend(dests[in_degree[dests] == 0].tolist())
+	return layers
+
+# Splits every edge spanning more than one layer into a chain of dummy nodes, one per crossed layer. Returns the layers of all nodes (dummies appended after the real ones) and the unit-span edges.
+def _insert_dummies(node_count:int, edges:np.ndarray, layers:np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+	spans:np.ndarray = layers[edges[:, 1]] - layers[edges[:, 0]]
+	short_edges:np.ndarray = edges[spans == 1]
+	long_edges:np.ndarray = edges[spans > 1]
+	long_spans:np.ndarray = spans[spans > 1]
+	dummy_count:int = int((long_spans - 1).sum())
+	all_layers:np.ndarray = np.concatenate((layers, np.zeros(dummy_count, dtype=np.intp)))
+	chains:list[np.ndarray] = [short_edges]
+	next_dummy:int = node_count
+	for (source, dest), span in zip(long_edges, long_spans):
+		dummies:np.ndarray = np.arange(next_dummy, next_dummy + span - 1)
+		all_layers[dummies] = layers[source] + np.arange(1, span)
+		next_dummy += span - 1
+		chain:np.ndarray = np.concatenate(([source], dummies, [dest]))
+		chains.append(np.stack((chain[:-1], chain[1:]), axis=1))
+	return all_layers, np.concatenate(chains).reshape(-1, 2).astype(np.intp)
+
+# Reorders the nodes of every layer by the barycenter of their neighbors in the previous layer of the sweep, alternating downward and upward sweeps
+def _order_layers(layers:np.ndarray, edges:np.ndarray, iterations:int) -> np.ndarray:
+	layer_count:int = int(layers.max(initial=0)) + 1
+	layer_nodes:list[np.ndarray] = [np.flatnonzero(layers == layer) for layer in range(layer_count)]
+	positions:np.ndarray = np.zeros(len(layers))
+	for nodes in layer_nodes:
+		positions[nodes] = np.arange(len(nodes))
+	edge_layers:np.ndarray = layers[edges[:, 1]]
+	edges_into:list[np.ndarray] = [edges[edge_layers == layer] for layer in range(layer_count)]
+
+	for iteration in range(iterations):
+		downward:bool = iteration % 2 == 0
+		sweep:range = range(1, layer_count) if downward else range(layer_count - 2, -1, -1)
+		for layer in sweep:
+			# Downward sweeps order a layer by the layer before it, upward sweeps by the layer after it
+			layer_edges:np.ndarray = edges_into[layer] if downward else edges_into[layer + 1][:, ::-1]
+			weights:np.ndarray = np.bincount(layer_edges[:, 1], weights=positions[layer_edges[:, 0]], minlength=len(layers))
+			counts:np.ndarray = np.bincount(layer_edges[:, 1], minlength=len(layers))
+			nodes:np.ndarray = layer_nodes[layer]
+			barycenters:np.ndarray = np.where(counts[nodes] > 0, weights[nodes] / np.maximum(counts[nodes], 1), positions[nodes])
+			positions[nodes[np.argsort(barycenters, kind='stable')]] = np.arange(len(nodes))
+	return positions
+
+# Places the nodes of every layer along the layer: each node is pulled towards the mean of its predecessors, while keeping at least node_spacing between consecutive nodes
+def _assign_offsets(layers:np.ndarray, edges:np.ndarray, positions:np.ndarray, node_spacing:float) -> np.ndarray:
+	layer_count:int = int(layers.max(initial=0)) + 1
+	offsets:np.ndarray = np.zeros(len(layers))
+	edge_layers:np.ndarray = layers[edges[:, 1]]
+	for layer in range(layer_count):
+		nodes:np.ndarray = np.flatnonzero(layers == layer)
+		nodes = nodes[np.argsort(positions[nodes], kind='stable')]
+		layer_edges:np.ndarray = edges[edge_layers == layer]
+		counts:np.ndarray = np.bincount(layer_edges[:, 1], minlength=len(layers))[nodes]
+		sums:np.ndarray = np.bincount(layer_edges[:, 1], weights=offsets[layer_edges[:, 0]], minlength=len(layers))[nodes]
+		desired:np.ndarray = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+		if np.all(np.isnan(desired)):
+			desired = (np.arange(len(nodes)) - (len(nodes) - 1) / 2) * node_spacing
+
+		# Enforcing offset[i] >= offset[i-1] + spacing is a running maximum of offset[i] - i * spacing. Nodes without predecessors pack after the node before them.
+		steps:np.ndarray = np.arange(len(nodes)) * node_spacing
+		relative:np.ndarray = np.maximum.accumulate(np.where(np.isnan(desired), -np.inf, desired - steps))
+		relative[np.isneginf(relative)] = relative[np.isfinite(relative)][0] if np.isfinite(relative).any() else 0.
+		layer_offsets:np.ndarray = relative + steps
+		# Spreading pushes nodes past their desired offsets, so the layer is shifted back by the mean excess
+		pulled:np.ndarray = ~np.isnan(desired)
+		if pulled.any():
+			layer_offsets -= np.mean(layer_offsets[pulled] - desired[pulled])
+		offsets[nodes] = layer_offsets
+	return offsets
+
+# Computes a layered layout of a directed graph. Returns the (x, y) position of every node, and its layer.
+def compute_layered_layout(
+		node_count:int,
+		edges:np.ndarray,
+		layer_spacing:float = 6.,
+		node_spacing:float = 4.,
+		grid_step:float = 0.5,
+		iterations:int = 8) -> tuple[np.ndarray, np.ndarray]:
+	edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+	edges = edges[edges[:, 0] != edges[:, 1]]
+	edges = np.unique(edges, axis=0)
+	edges = _break_cycles(node_count, edges)
+	layers:np.ndarray = _longest_path_layers(node_count, edges)
+
+	all_layers, unit_edges = _insert_dummies(node_count, edges, layers)
+	positions:np.ndarray = _order_layers(all_layers, unit_edges, iterations)
+	offsets:np.ndarray = _assign_offsets(all_layers, unit_edges, positions, node_spacing)[:node_count]
+
+	coords:np.ndarray = np.stack((layers * layer_spacing, -offsets), axis=1)
+	coords -= (coords.min(axis=0) + coords.max(axis=0)) / 2 if node_count else 0
+	if grid_step > 0:
+		coords = np.round(coords / grid_step) * grid_step
+	return coords, layers
+
+# Number of quarter turns (counterclockwise) bringing the given vector closest to the target direction
+def _quarter_turns(vector:np.ndarray, target_angle:float) -> int:
+	if not np.any(vector[:2]):
+		return 0
+	return int(round((target_angle - math.atan2(vector[1], vector[0])) / (math.pi / 2))) % 4
+
+# Lays out elements given their connections, as (source, source terminal, dest, dest terminal) tuples oriented along the signal flow, and applies the layout in one batch.
+# With rotate_elements, each element is turned by quarter turns so that its driving terminal faces the next layer. Spacings default to the largest element extent, plus a gap.
+def layout_elements(
+		elements:Iterable[_CircuitElementTemplate],
+		connections:Iterable[tuple[_CircuitElementTemplate, str, _CircuitElementTemplate, str]],
+		layer_spacing:float | None = None,
+		node_spacing:float | None = None,
+		grid_step:float = 0.5,
+		rotate_elements:bool = True,
+		iterations:int = 8,
+		center:list[float] = (0, 0, 0)) -> np.ndarray:
+	elements = [element for element in elements if not isinstance(element, Wire)]
+	connections = list(connections)
+	element_indices:dict[int, int] = {id(element): index for index, element in enumerate(elements)}
+	edges:np.ndarray = np.array([(element_indices[id(source)], element_indices[id(dest)])
+		for source, _, dest, _ in connections
+		if id(source) in element_indices and id(dest) in element_indices], dtype=np.intp).reshape(-1, 2)
+
+	# The points of every element's family are gathered into one array, with the element each point belongs to
+	families:list[list] = [[mobject for mobject in element.get_family() if len(mobject.points)] for element in elements]
+	point_blocks:list[np.ndarray] = [mobject.points for family in families for mobject in family]
+	block_owners:np.ndarray = np.repeat(np.arange(len(elements)), [len(family) for family in families])
+	block_sizes:np.ndarray = np.array([len(block) for block in point_blocks], dtype=np.intp)
+	points:np.ndarray = np.concatenate(point_blocks) if point_blocks else np.zeros((0, 3))
+	point_owners:np.ndarray = np.repeat(block_owners, block_sizes)
+	starts:np.ndarray = np.searchsorted(point_owners, np.arange(len(elements)))
+	centers:np.ndarray = (np.minimum.reduceat(points, starts) + np.maximum.reduceat(points, starts)) / 2
+	extents:np.ndarray = np.maximum.reduceat(points, starts) - np.minimum.reduceat(points, starts)
+
+	turns:np.ndarray = np.zeros(len(elements), dtype=np.intp)
+	if rotate_elements:
+		oriented:np.ndarray = np.zeros(len(elements), dtype=bool)
+		for outgoing, target_angle in ((True, 0.), (False, math.pi)):
+			for source, source_terminal, dest, dest_terminal in connections:
+				element, terminal = (source, source_terminal) if outgoing else (dest, dest_terminal)
+				index:int | None = element_indices.get(id(element))
+				if index is None or oriented[index]:
+					continue
+				oriented[index] = True
+				turns[index] = _quarter_turns(np.asarray(element.get_terminal_coord(terminal)) - centers[index], target_angle)
+	rotated_extents:np.ndarray = np.where((turns % 2 == 1)[:, None], extents[:, [1, 0, 2]], extents)
+
+	if layer_spacing is None:
+		layer_spacing = float(rotated_extents[:, 0].max(initial=0)) + 2.
+	if node_spacing is None:
+		node_spacing = float(rotated_extents[:, 1].max(initial=0)) + 1.
+	coords, _ = compute_layered_layout(len(elements), edges, layer_spacing, node_spacing, grid_step, iterations)
+	targets:np.ndarray = np.zeros((len(elements), 3))
+	targets[:, :2] = coords
+	targets += np.asarray(center, dtype=float)
+	targets[:, 2] = centers[:, 2]
+
+	# Every point is rotated about its element's center, and moved to the element's target position, in a single pass
+	angles:np.ndarray = turns * (math.pi / 2)
+	cosines:np.ndarray = np.round(np.cos(angles))
+	sines:np.ndarray = np.round(np.sin(angles))
+	rotations:np.ndarray = np.zeros((len(elements), 3, 3))
+	rotations[:, 0, 0] = cosines
+	rotations[:, 0, 1] = -sines
+	rotations[:, 1, 0] = sines
+	rotations[:, 1, 1] = cosines
+	rotations[:, 2, 2] = 1
+	transformed:np.ndarray = np.einsum('nij,nj->ni', rotations[point_owners], points - centers[point_owners]) + targets[point_owners]
+
+	block_starts:np.ndarray = np.concatenate(([0], np.cumsum(block_sizes)))
+	mobjects:list = [mobject for family in families for mobject in family]
+	for block_index, mobject in enumerate(mobjects):
+		mobject.points = transformed[block_starts[block_index]:block_starts[block_index + 1]]
+	return targets
+
+# Orients the nets of a circuit into connections, from the net's driving terminal to every other terminal of the net
+def circuit_connections(circuit:Circuit) -> list[tuple[_CircuitElementTemplate, str, _CircuitElementTemplate, str]]:
+	connections:list[tuple[_CircuitElementTemplate, str, _CircuitElementTemplate, str]] = []
+	for net in circuit.nets:
+		driver_index:int = next((index for index, (_, terminal_name) in enumerate(net) if terminal_name in DRIVING_TERMINALS), 0)
+		driver, driver_terminal = net[driver_index]
+		connections.extend((driver, driver_terminal, element, terminal_name)
+			for index, (element, terminal_name) in enumerate(net)
+			if index != driver_index and element is not driver)
+	return connections
+
+# Lays out the elements of a circuit along the signal flow of its nets, and resolves its wires to the new placement
+def layout_circuit(circuit:Circuit, **kwargs) -> np.ndarray:
+	targets:np.ndarray = layout_elements(circuit.elements, circuit_connections(circuit), **kwargs)
+	circuit.resolve()
+	return targets
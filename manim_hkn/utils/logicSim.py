@@ -0,0 +1,411 @@
+"""
+Gate-level logic simulation of networks of logic gates and D flip-flops, and a bridge coloring schematics from the simulated signals.
+The state of every net is a uint64 word: each bit is one of 64 independent simulations (lanes) of the network, such as 64 stimulus patterns,
+all computed by the same bitwise operations. Nets 0 and 1 are the constants 0 and 1, which also pad the inputs of gates narrower than the
+widest gate of their group, so that every group of gates is evaluated by a single reduction over a (gates, inputs) index matrix.
+Two simulations are offered:
+	simulate_cycles: zero-delay evaluation, once per clock cycle. The combinational gates are levelized once, and each cycle evaluates the
+	levels in order, one reduction per gate kind and level. Flip-flops all capture their D input at the end of every cycle, from one
+	implicit clock, and their clock nets are ignored.
+	simulate_events: event-driven timing simulation with an integer delay per gate, in ticks. Changes are scheduled on a time wheel, and
+	each tick only evaluates the fanout of the nets which changed. Flip-flops capture the D input they had before the tick on a rising
+	edge of their clock net.
+Both record one lane of every net at every step, bit-packed, in a LogicTrace. Only numpy is imported.
+A network is built gate by gate, or from the gates of a drawn Circuit, with its nets formed by the wires. SignalPainter then colors every
+wire and gate of the circuit by the value of its net. The stroke colors of all of them are views onto the rows of one buffer, so showing a
+step is a single vectorized write, rather than one set_color call per mobject.
+
+	network = LogicNetwork.from_circuit(circuit)
+	trace = network.simulate_events([(0, network.net((gate, 'input 1')), 1)], ticks=40)
+	painter = SignalPainter.from_network(network, trace)
+	painter.attach(circuit, tick)
+	self.play(tick.animate.set_value(40), run_time=4, rate_func=linear)
+"""
+
+from typing import Hashable, Iterable, Sequence
+import numpy as np
+
+ZERO:int = 0
+ONE:int = 1
+ALL_LANES:np.uint64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+LANES:int = 64
+# Base reduction and output inversion of every gate kind
+GATE_KINDS:dict[str, tuple[str, bool]] = {
+	'AND'		: ('AND', False),
+	'NAND'		: ('AND', True),
+	'OR'		: ('OR', False),
+	'NOR'		: ('OR', True),
+	'XOR'		: ('XOR', False),
+	'XNOR'		: ('XOR', True),
+	'NOT'		: ('AND', True),
+	'BUFFER'	: ('AND', False)
+}
+_REDUCTIONS:dict[str, np.ufunc] = {'AND': np.bitwise_and, 'OR': np.bitwise_or, 'XOR': np.bitwise_xor}
+# Net padding the unused inputs of each base reduction
+_PADDING:dict[str, int] = {'AND': ONE, 'OR': ZERO, 'XOR': ZERO}
+
+# Signals of one lane of every net at every step of a simulation
+class LogicTrace:
+	def __init__(self:"LogicTrace", network:"LogicNetwork", packed:np.ndarray, final_words:np.ndarray, lane:int) -> None:
+		self.network:"LogicNetwork" = network
+		# Shape (steps, ceil(nets / 8)), the bits of the nets in order, as by np.packbits
+		self.packed:np.ndarray = packed
+		# Every lane of every net after the last step
+		self.final_words:np.ndarray = final_words
+		self.lane:int = lane
+
+	@property
+	def steps(self:"LogicTrace") -> int:
+		return len(self.packed)
+
+	# Value of every net at the given step
+	def state(self:"LogicTrace", step:int) -> np.ndarray:
+		return np.unpackbits(self.packed[step], count=self.network.net_count).astype(bool)
+
+	# Value of a net, given as its index or key, at every step
+	def value(self:"LogicTrace", net:Hashable) -> np.ndarray:
+		index:int = self.network.net(net)
+		return ((self.packed[:, index >> 3] >> (7 - (index & 7))) & 1).astype(bool)
+
+	# Steps at which a net changes value
+	def edges(self:"LogicTrace", net:Hashable) -> np.ndarray:
+		return np.flatnonzero(np.diff(self.value(net).astype(np.int8))) + 1
+
+class LogicNetwork:
+	def __init__(self:"LogicNetwork") -> None:
+		self.net_count:int = 2
+		# Keys of nets, ex: input names, or the (element, terminal name) pairs of a drawn circuit
+		self.net_keys:dict[Hashable, int] = {}
+		# Driver of every driven net: the index of its gate or flip-flop
+		self._drivers:dict[int, tuple[str, int]] = {}
+		self._gate_kinds:list[str] = []
+		self._gate_inputs:list[tuple[int, ...]] = []
+		self._gate_outputs:list[int] = []
+		self._gate_delays:list[int] = []
+		# D, clock and Q nets of every flip-flop
+		self._flip_flops:list[tuple[int, int, int]] = []
+		self._flip_flop_delays:list[int] = []
+		self._compiled:dict | None = None
+
+	def add_net(self:"LogicNetwork", key:Hashable | None = None) -> int:
+		net:int = self.net_count
+		self.net_count += 1
+		if key is not None:
+			self.net_keys[key] = net
+		self._compiled = None
+		return net
+
+	def net(self:"LogicNetwork", net:Hashable) -> int:
+		if isinstance(net, (int, np.integer)) and 0 <= net < self.net_count:
+			return int(net)
+		if net not in self.net_keys:
+			raise ValueError(f'Invalid Net: {net}.')
+		return self.net_keys[net]
+
+	def _claim(self:"LogicNetwork", output:Hashable | None, driver:tuple[str, int]) -> int:
+		net:int = self.add_net() if output is None else self.net(output)
+		if net in (ZERO, ONE) or net in self._drivers:
+			raise ValueError(f'Invalid Output: net {net} is already driven.')
+		self._drivers[net] = driver
+		return net
+
+	# Adds a gate of the given kind (see GATE_KINDS) and returns its output net, a new net unless one is given
+	def add_gate(self:"LogicNetwork", kind:str, inputs:Sequence[Hashable], output:Hashable | None = None, delay:int = 1) -> int:
+		kind = kind.upper()
+		if kind not in GATE_KINDS:
+			raise ValueError(f'Invalid Gate Kind: {kind}.')
+		if len(inputs) == 0 or (kind in ('NOT', 'BUFFER') and len(inputs) != 1):
+			raise ValueError(f'Invalid Inputs: {inputs}, for a {kind} gate.')
+		if delay < 1:
+			raise ValueError(f'Invalid Delay: {delay}.')
+		input_nets:tuple[int, ...] = tuple(self.net(net) for net in inputs)
+		net:int = self._claim(output, ('gate', len(self._gate_kinds)))
+		self._gate_kinds.append(kind)
+		self._gate_inputs.append(input_nets)
+		self._gate_outputs.append(net)
+		self._gate_delays.append(delay)
+		return net
+
+	# Adds a D flip-flop and returns its Q net
+	def add_flip_flop(self:"LogicNetwork", d:Hashable, clock:Hashable = ZERO, output:Hashable | None = None, delay:int = 1) -> int:
+		if delay < 1:
+			raise ValueError(f'Invalid Delay: {delay}.')
+		d_net, clock_net = self.net(d), self.net(clock)
+		net:int = self._claim(output, ('flip-flop', len(self._flip_flops)))
+		self._flip_flops.append((d_net, clock_net, net))
+		self._flip_flop_delays.append(delay)
+		return net
+
+	# Nets driven by no gate or flip-flop, besides the constants
+	@property
+	def inputs(self:"LogicNetwork") -> np.ndarray:
+		driven:np.ndarray = np.zeros(self.net_count, dtype=bool)
+		driven[[ZERO, ONE, *self._drivers]] = True
+		return np.flatnonzero(~driven)
+
+	@property
+	def gate_count(self:"LogicNetwork") -> int:
+		return len(self._gate_kinds)
+
+	# Index arrays of the network, rebuilt after it changes
+	def _compile(self:"LogicNetwork") -> dict:
+		if self._compiled is not None:
+			return self._compiled
+		gate_count:int = len(self._gate_kinds)
+		width:int = max((len(inputs) for inputs in self._gate_inputs), default=1)
+		# Index of the base reduction of every gate in _REDUCTIONS
+		bases:np.ndarray = np.array([list(_REDUCTIONS).index(GATE_KINDS[kind][0]) for kind in self._gate_kinds], dtype=np.int8)
+		input_matrix:np.ndarray = np.empty((gate_count, width), dtype=np.intp)
+		for gate, (kind, inputs) in enumerate(zip(self._gate_kinds, self._gate_inputs)):
+			input_matrix[gate, :len(inputs)] = inputs
+			input_matrix[gate, len(inputs):] = _PADDING[GATE_KINDS[kind][0]]
+		inversions:np.ndarray = np.array([ALL_LANES if GATE_KINDS[kind][1] else 0 for kind in self._gate_kinds], dtype=np.uint64)
+		outputs:np.ndarray = np.array(self._gate_outputs, dtype=np.intp)
+		flip_flops:np.ndarray = np.array(self._flip_flops, dtype=np.intp).reshape(-1, 3)
+
+		# Levels of the combinational gates: constants, inputs and flip-flop outputs are at level 0, and every gate is one past its deepest input
+		net_levels:np.ndarray = np.full(self.net_count, -1)
+		net_levels[self.inputs] = 0
+		net_levels[[ZERO, ONE]] = 0
+		net_levels[flip_flops[:, 2]] = 0
+		gate_levels:np.ndarray = np.full(gate_count, -1)
+		pending:np.ndarray = np.arange(gate_count)
+		level:int = 0
+		while len(pending):
+			level += 1
+			ready:np.ndarray = (net_levels[input_matrix[pending]] >= 0).all(axis=1)
+			if not ready.any():
+				raise ValueError(f'Invalid Network: {len(pending)} gates form or depend on a combinational loop.')
+			gate_levels[pending[ready]] = level
+			net_levels[outputs[pending[ready]]] = level
+			pending = pending[~ready]
+
+		# Every level is evaluated as one group per base reduction, with the input matrix trimmed to the widest gate of the group
+		groups:list[tuple[np.ufunc, np.ndarray, np.ndarray, np.ndarray]] = []
+		if gate_count:
+			order:np.ndarray = np.lexsort((bases, gate_levels))
+			keys:np.ndarray = gate_levels[order] * len(_REDUCTIONS) + bases[order]
+			for group in np.split(order, np.flatnonzero(keys[1:] != keys[:-1]) + 1):
+				group_width:int = max(len(self._gate_inputs[gate]) for gate in group)
+				groups.append((list(_REDUCTIONS.values())[bases[group[0]]], outputs[group], input_matrix[group, :group_width], inversions[group]))
+
+		# Fanout of every net to the gates and flip-flops reading it, in compressed sparse row form. Flip-flops only read their clock.
+		readers:list[np.ndarray] = [np.repeat(np.arange(gate_count), width), flip_flops[:, 1]]
+		read_nets:np.ndarray = np.concatenate((input_matrix.ravel(), flip_flops[:, 1]))
+		reader_ids:np.ndarray = np.concatenate((readers[0], gate_count + np.arange(len(flip_flops))))
+		pairs:np.ndarray = np.unique(np.stack((read_nets, reader_ids), axis=1), axis=0) if len(read_nets) else np.zeros((0, 2), dtype=np.intp)
+		self._compiled = {
+			'bases': bases,
+			'input_matrix': input_matrix,
+			'inversions': inversions,
+			'outputs': outputs,
+			'delays': np.concatenate((np.array(self._gate_delays, dtype=np.intp), np.array(self._flip_flop_delays, dtype=np.intp))),
+			'flip_flops': flip_flops,
+			'groups': groups,
+			'depth': level,
+			'fanout_indptr': np.searchsorted(pairs[:, 0], np.arange(self.net_count + 1)),
+			'fanout_indices': pairs[:, 1]
+		}
+		return self._compiled
+
+	# Levelized zero-delay evaluation of every combinational gate, in place
+	def _settle(self:"LogicNetwork", values:np.ndarray) -> None:
+		for reduction, outputs, input_matrix, inversions in self._compile()['groups']:
+			values[outputs] = reduction.reduce(values[input_matrix], axis=1) ^ inversions
+
+	def _initial_values(self:"LogicNetwork", initial:dict[Hashable, int] | None) -> np.ndarray:
+		values:np.ndarray = np.zeros(self.net_count, dtype=np.uint64)
+		values[ONE] = ALL_LANES
+		for net, word in (initial or {}).items():
+			values[self.net(net)] = np.uint64(word)
+		return values
+
+	@staticmethod
+	def _lane_bits(values:np.ndarray, lane:int) -> np.ndarray:
+		return np.packbits(((values >> np.uint64(lane)) & np.uint64(1)).astype(np.uint8))
+
+	# Clocked simulation. stimulus holds the words of the given input nets for every cycle, shape (cycles, len(inputs)); each bit of a word
+	# is one lane. Each step of the trace is the state of a cycle after its evaluation, before the flip-flops capture.
+	# initial sets the words of flip-flop outputs (and of any input not in the stimulus) at the start.
+	def simulate_cycles(self:"LogicNetwork",
+					 inputs:Sequence[Hashable],
+					 stimulus:np.ndarray,
+					 initial:dict[Hashable, int] | None = None,
+					 lane:int = 0) -> LogicTrace:
+		compiled:dict = self._compile()
+		input_nets:np.ndarray = np.array([self.net(net) for net in inputs], dtype=np.intp)
+		stimulus = np.asarray(stimulus).astype(np.uint64).reshape(len(stimulus), len(input_nets))
+		if not 0 <= lane < LANES:
+			raise ValueError(f'Invalid Lane: {lane}.')
+		values:np.ndarray = self._initial_values(initial)
+		d_nets:np.ndarray = compiled['flip_flops'][:, 0]
+		q_nets:np.ndarray = compiled['flip_flops'][:, 2]
+		packed:np.ndarray = np.empty((len(stimulus), (self.net_count + 7) // 8), dtype=np.uint8)
+		for cycle, words in enumerate(stimulus):
+			values[input_nets] = words
+			self._settle(values)
+			packed[cycle] = self._lane_bits(values, lane)
+			values[q_nets] = values[d_nets]
+		return LogicTrace(self, packed, values, lane)
+
+	# Event-driven simulation over the given number of ticks. events are (tick, input net, word) changes of the inputs, and the network
+	# starts from its settled state with every input at 0 (or at its word in initial). Each step of the trace is the state after a tick.
+	def simulate_events(self:"LogicNetwork",
+					 events:Iterable[tuple[int, Hashable, int]],
+					 ticks:int,
+					 initial:dict[Hashable, int] | None = None,
+					 lane:int = 0) -> LogicTrace:
+		compiled:dict = self._compile()
+		if not 0 <= lane < LANES:
+			raise ValueError(f'Invalid Lane: {lane}.')
+		gate_count:int = len(self._gate_kinds)
+		flip_flops:np.ndarray = compiled['flip_flops']
+		outputs:np.ndarray = np.concatenate((compiled['outputs'], flip_flops[:, 2]))
+		delays:np.ndarray = compiled['delays']
+		indptr:np.ndarray = compiled['fanout_indptr']
+		indices:np.ndarray = compiled['fanout_indices']
+		bases:np.ndarray = compiled['bases']
+		delay_values:np.ndarray = np.unique(delays)
+		reader_marks:np.ndarray = np.zeros(gate_count + len(flip_flops), dtype=bool)
+		net_marks:np.ndarray = np.zeros(self.net_count, dtype=bool)
+
+		values:np.ndarray = self._initial_values(initial)
+		self._settle(values)
+		# Value every net will have once its scheduled changes are applied, so that unchanged outputs are not scheduled again
+		projected:np.ndarray = values.copy()
+		# Time wheel: the (nets, words) changes scheduled at each tick
+		wheel:dict[int, list[tuple[np.ndarray, np.ndarray]]] = {}
+		events = list(events)
+		if events:
+			event_ticks:np.ndarray = np.array([int(tick) for tick, _, _ in events])
+			event_nets:np.ndarray = np.array([self.net(net) for _, net, _ in events], dtype=np.intp)
+			event_words:np.ndarray = np.array([word for _, _, word in events], dtype=np.uint64)
+			order:np.ndarray = np.argsort(event_ticks, kind='stable')
+			tick_values, tick_starts = np.unique(event_ticks[order], return_index=True)
+			for tick, nets, words in zip(tick_values.tolist(), np.split(event_nets[order], tick_starts[1:]), np.split(event_words[order], tick_starts[1:])):
+				wheel[tick] = [(nets, words)]
+
+		packed:np.ndarray = np.empty((ticks, (self.net_count + 7) // 8), dtype=np.uint8)
+		for tick in range(ticks):
+			changes:list[tuple[np.ndarray, np.ndarray]] = wheel.pop(tick, [])
+			if changes:
+				nets:np.ndarray = np.concatenate([change[0] for change in changes])
+				words:np.ndarray = np.concatenate([change[1] for change in changes])
+				before:np.ndarray = values.copy()
+				values[nets] = words
+				# Nets which changed, each once, marked in a boolean array rather than sorted
+				net_marks[nets[before[nets] != values[nets]]] = True
+				changed:np.ndarray = np.flatnonzero(net_marks)
+				net_marks[changed] = False
+				# Gates and flip-flops reading a changed net
+				starts:np.ndarray = indptr[changed]
+				counts:np.ndarray = indptr[changed + 1] - starts
+				reader_marks[indices[np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]] = True
+				readers:np.ndarray = np.flatnonzero(reader_marks)
+				reader_marks[readers] = False
+				gates:np.ndarray = readers[readers < gate_count]
+				new_words:np.ndarray = np.empty(len(readers), dtype=np.uint64)
+				for base, reduction in enumerate(_REDUCTIONS.values()):
+					selected:np.ndarray = np.flatnonzero(bases[gates] == base)
+					if len(selected):
+						operands:np.ndarray = values[compiled['input_matrix'][gates[selected]]]
+						new_words[selected] = reduction.reduce(operands, axis=1) ^ compiled['inversions'][gates[selected]]
+				stored:np.ndarray = readers[len(gates):] - gate_count
+				if len(stored):
+					d_nets, clock_nets, q_nets = flip_flops[stored].T
+					rising:np.ndarray = values[clock_nets] & ~before[clock_nets]
+					new_words[len(gates):] = (projected[q_nets] & ~rising) | (before[d_nets] & rising)
+				scheduled:np.ndarray = new_words != projected[outputs[readers]]
+				targets:np.ndarray = readers[scheduled]
+				if len(targets):
+					projected[outputs[targets]] = new_words[scheduled]
+					target_delays:np.ndarray = delays[targets]
+					for delay in delay_values:
+						selected = target_delays == delay
+						wheel.setdefault(tick + int(delay), []).append((outputs[targets[selected]], new_words[scheduled][selected]))
+				packed[tick] = self._lane_bits(values, lane)
+			else:
+				packed[tick] = packed[tick - 1] if tick else self._lane_bits(values, lane)
+		return LogicTrace(self, packed, values, lane)
+
+	# Network of the logic gates and D flip-flops of a drawn Circuit. Each net of the circuit read or driven by one of them is a net of the
+	# network, keyed by the (element, terminal name) pairs of its gate, flip-flop and wire terminals. 'not Q' of a flip-flop is driven
+	# by a NOT gate from Q, one tick after it.
+	@classmethod
+	def from_circuit(cls:type["LogicNetwork"], circuit, delay:int = 1) -> "LogicNetwork":
+		# Imported here, so that this module does not import manim
+		from manim_hkn.cElements import _LogicGate, DFlipFlop, AndGate, NandGate, OrGate, NorGate, XorGate, XnorGate, NotGate, Buffer
+		gate_kinds:dict[type, str] = {AndGate: 'AND', NandGate: 'NAND', OrGate: 'OR', NorGate: 'NOR', XorGate: 'XOR', XnorGate: 'XNOR', NotGate: 'NOT', Buffer: 'BUFFER'}
+		network:LogicNetwork = cls()
+		nets:dict[int, int] = {}
+
+		def net(element, terminal_name:str) -> int:
+			circuit_net:int = circuit.net_of(element, terminal_name)
+			if circuit_net not in nets:
+				nets[circuit_net] = network.add_net()
+			network.net_keys[(element, terminal_name)] = nets[circuit_net]
+			return nets[circuit_net]
+
+		elements:list = [element for element in circuit.elements if isinstance(element, (_LogicGate, DFlipFlop))]
+		for element in elements:
+			if isinstance(element, DFlipFlop):
+				q:int = network.add_flip_flop(net(element, 'D'), net(element, 'clock'), net(element, 'Q'), delay)
+				network.add_gate('NOT', [q], net(element, 'not Q'), delay)
+			else:
+				network.add_gate(gate_kinds[type(element)], [net(element, name) for name in element.get_input_terminal_names()], net(element, 'output'), delay)
+		for wire in circuit.wires:
+			if circuit.net_of(wire, 'left') in nets:
+				net(wire, 'left')
+		return network
+
+# Colors wires and gates by the simulated value of their nets. The stroke colors of every painted mobject are views onto the rows of one
+# buffer: set_color and other in-place style updates keep writing through it, but a mobject given a stroke colors array of another length
+# must be bound again with bind().
+class SignalPainter:
+	def __init__(self:"SignalPainter",
+			  trace:LogicTrace,
+			  mobjects:Sequence,
+			  nets:Sequence[Hashable],
+			  low_color = '#3B4A6B',
+			  high_color = '#FFD23F') -> None:
+		from manim.utils.color import color_to_rgba
+		self.trace:LogicTrace = trace
+		self.mobjects:list = list(mobjects)
+		self.nets:np.ndarray = np.array([trace.network.net(net) for net in nets], dtype=np.intp)
+		self.palette:np.ndarray = np.array([color_to_rgba(low_color), color_to_rgba(high_color)])[:, :3]
+		self._colors:np.ndarray = np.zeros((len(self.mobjects), 4))
+		self._step:int | None = None
+		self.bind()
+
+	# Points the stroke colors of every mobject to its row of the buffer, keeping its opacity
+	def bind(self:"SignalPainter") -> "SignalPainter":
+		for row, mobject in enumerate(self.mobjects):
+			self._colors[row] = mobject.get_stroke_rgbas()[0]
+			mobject.stroke_rgbas = self._colors[row:row + 1]
+		self._step = None
+		return self
+
+	# Colors every mobject by the value of its net at the given step, clamped to the trace
+	def show(self:"SignalPainter", step:int) -> None:
+		step = min(max(int(step), 0), self.trace.steps - 1)
+		if step == self._step:
+			return
+		self._colors[:, :3] = self.palette[self.trace.state(step)[self.nets].astype(np.intp)]
+		self._step = step
+
+	# Shows the step given by the value of a ValueTracker, from an updater of the given mobject, ex: the circuit
+	def attach(self:"SignalPainter", mobject, tracker) -> "SignalPainter":
+		mobject.add_updater(lambda _: self.show(tracker.get_value()))
+		self.show(tracker.get_value())
+		return self
+
+	# Painter of every wire and gate of a network built by LogicNetwork.from_circuit: wires by their net, gates and flip-flops by their output
+	@classmethod
+	def from_network(cls:type["SignalPainter"], network:LogicNetwork, trace:LogicTrace, **kwargs) -> "SignalPainter":
+		mobjects:list = []
+		nets:list[int] = []
+		for (element, terminal_name), net in network.net_keys.items():
+			if terminal_name in ('left', 'output', 'Q'):
+				mobjects.append(element)
+				nets.append(net)
+		return cls(trace, mobjects, nets, **kwargs)
@@ -0,0 +1,247 @@
+"""
+Netlist graph of a circuit: the elements, their terminals, the wires between them, and the nets the wires form.
+A Circuit owns all of its wires, and resolves every wire endpoint for a frame in a single vectorized gather over one terminal coordinate
+array, in place of one updater per wire.
+"""
+
+from typing import Sequence
+import numpy as np
+from manim import VGroup
+from manim_hkn.terminal import Terminal
+from manim_hkn.cElements import Wire, _CircuitElementTemplate
+from manim_hkn.utils import circuitBuilder
+
+# Bezier parameters of the four control points of a straight wire segment, matching geometry.linear_path_points
+_T_VALUES:np.ndarray = np.linspace(0, 1, 4)[None, :, None]
+
+class Circuit(VGroup):
+	def __init__(self:"Circuit", *elements:_CircuitElementTemplate, **kwargs) -> None:
+		self._elements:list[_CircuitElementTemplate] = []
+		self._wires:list[Wire] = []
+		# ids of the elements and wires owned by the circuit, for constant time membership checks while building large circuits
+		self._member_ids:set[int] = set()
+		# Pairs of wire terminals joined without a bound element terminal, such as the two halves of a split wire
+		self._junctions:list[tuple[Terminal, Terminal]] = []
+		self._topology_dirty:bool = True
+
+		super().__init__(**kwargs)
+		self.add_elements(*elements)
+		self.add_updater(Circuit.resolve)
+
+	# Adds circuit elements (not wires) to the circuit, and returns the last one added so that construction can be chained
+	def add_elements(self:"Circuit", *elements:_CircuitElementTemplate) -> _CircuitElementTemplate | None:
+		for element in elements:
+			if isinstance(element, Wire):
+				self.add_wire(element)
+			elif id(element) not in self._member_ids:
+				self._member_ids.add(id(element))
+				self._elements.append(element)
+				self._add_member(element)
+		return elements[-1] if elements else None
+
+	# Adopts a wire, such as one returned by the circuitBuilder functions. Its endpoints are from now on resolved by the circuit instead of its own updater.
+	def add_wire(self:"Circuit", wire:Wire) -> Wire:
+		if id(wire) not in self._member_ids:
+			self._member_ids.add(id(wire))
+			wire.remove_updater(Wire._update_shape)
+			self._wires.append(wire)
+			self._add_member(wire)
+		return wire
+
+	# Members are known to be new VMobjects, so they are appended directly, skipping the linear duplicate search of VGroup.add
+	def _add_member(self:"Circuit", member:_CircuitElementTemplate) -> None:
+		self.submobjects.append(member)
+		self._topology_dirty = True
+
+	def remove(self:"Circuit", *mobjects) -> "Circuit":
+		for mobject in mobjects:
+			if id(mobject) not in self._member_ids:
+				continue
+			self._member_ids.discard(id(mobject))
+			if isinstance(mobject, Wire):
+				self._wires.remove(mobject)
+				mobject.add_updater(Wire._update_shape)
+			else:
+				self._elements.remove(mobject)
+		self._topology_dirty = True
+		return super().remove(*mobjects)
+
+	# The wires created below are bound without updating their shape, and are all resolved together by the next resolve()
+	def connect_with_straight_wire(self:"Circuit", left_cElem:_CircuitElementTemplate, left_terminal:str, right_cElem:_CircuitElementTemplate, right_terminal:str) -> Wire:
+		self.add_elements(*(cElem for cElem in (left_cElem, right_cElem) if cElem is not None))
+		return self.add_wire(circuitBuilder.connect_with_straight_wire(left_cElem, left_terminal, right_cElem, right_terminal, update_shape=False))
+
+	def connect_with_square_wire(self:"Circuit", x_cElem:_CircuitElementTemplate, x_terminal:str, y_cElem:_CircuitElementTemplate, y_terminal:str, animation_start:str = 'x') -> tuple[Wire, Wire]:
+		self.add_elements(x_cElem, y_cElem)
+		hWire, vWire = circuitBuilder.connect_with_square_wire(x_cElem, x_terminal, y_cElem, y_terminal, animation_start, update_shape=False)
+		return self.add_wire(hWire), self.add_wire(vWire)
+
+	def split_wire(self:"Circuit", wire:Wire, split_point:float | Sequence[float] = 0.5) -> tuple[Wire, ...]:
+		pieces:tuple[Wire, ...] = circuitBuilder.split_wire(wire, split_point)
+		if id(wire) in self._member_ids:
+			self.remove(wire)
+		for lWire, rWire in zip(pieces, pieces[1:]):
+			self._junctions.append((lWire._terminals['right'], rWire._terminals['left']))
+		return tuple(self.add_wire(piece) for piece in pieces)
+
+	# Rebuilds the terminal registry and the adjacency arrays after elements or wires were added or removed
+	def _build_topology(self:"Circuit") -> None:
+		owners:list[_CircuitElementTemplate | None] = [*self._elements, *self._wires]
+		self._terminal_objects:list[Terminal] = []
+		self._terminal_names:list[str] = []
+		terminal_owner:list[int] = []
+		self._terminal_ids:dict[int, int] = {}
+
+		def register(terminal:Terminal, owner_index:int, terminal_name:str) -> int:
+			if id(terminal) not in self._terminal_ids:
+				self._terminal_ids[id(terminal)] = len(self._terminal_objects)
+				self._terminal_objects.append(terminal)
+				self._terminal_names.append(terminal_name)
+				terminal_owner.append(owner_index)
+			return self._terminal_ids[id(terminal)]
+
+		for owner_index, owner in enumerate(owners):
+			for terminal_name, terminal in owner._terminals.items():
+				register(terminal, owner_index, terminal_name)
+
+		# Endpoint sources: for every wire, wire end and axis, the id of the terminal the coordinate is read from. Unbound axes read the wire's own terminal.
+		self._wire_sources:np.ndarray = np.empty((len(self._wires), 2, 3), dtype=np.intp)
+		wire_pairs:list[tuple[int, int]] = []
+		for wire_index, wire in enumerate(self._wires):
+			for end_index, (key, own_terminal) in enumerate(wire._terminals.items()):
+				for axis, bound_terminal in enumerate(wire._terminal_bindings[key]):
+					if bound_terminal is None:
+						self._wire_sources[wire_index, end_index, axis] = self._terminal_ids[id(own_terminal)]
+					else:
+						# Terminals of elements outside the circuit are registered without an owner, and re-read every frame
+						terminal_id:int = register(bound_terminal, -1, '')
+						self._wire_sources[wire_index, end_index, axis] = terminal_id
+						wire_pairs.append((wire_index, terminal_owner[terminal_id]))
+
+		self._terminal_owner:np.ndarray = np.array(terminal_owner, dtype=np.intp)
+		self._coords:np.ndarray = np.zeros((len(self._terminal_objects), 3))
+		self._owner_terminals:list[np.ndarray] = [np.flatnonzero(self._terminal_owner == owner_index) for owner_index in range(len(owners))]
+		self._orphan_terminals:np.ndarray = np.flatnonzero(self._terminal_owner == -1)
+		self._owner_versions:np.ndarray = np.full(len(owners), -1)
+
+		# Element to wire adjacency, in compressed sparse row form
+		pairs:np.ndarray = np.unique(np.array([pair for pair in wire_pairs if pair[1] >= 0], dtype=np.intp).reshape(-1, 2), axis=0)
+		pairs = pairs[np.argsort(pairs[:, 1], kind='stable')]
+		self._element_wire_indptr:np.ndarray = np.searchsorted(pairs[:, 1], np.arange(len(owners) + 1))
+		self._element_wire_indices:np.ndarray = pairs[:, 0]
+
+		# Nets, as the connected components of the graph whose edges join every terminal a wire touches
+		parent:np.ndarray = np.arange(len(self._terminal_objects))
+		def find(terminal_id:int) -> int:
+			while parent[terminal_id] != terminal_id:
+				parent[terminal_id] = parent[parent[terminal_id]]
+				terminal_id = parent[terminal_id]
+			return terminal_id
+		def union(terminal_a:int, terminal_b:int) -> None:
+			parent[find(terminal_a)] = find(terminal_b)
+		for wire_index in range(len(self._wires)):
+			wire_terminals:np.ndarray = self._wire_sources[wire_index].ravel()
+			for terminal_id in wire_terminals[1:]:
+				union(wire_terminals[0], terminal_id)
+			for terminal_id in self._owner_terminals[len(self._elements) + wire_index]:
+				union(wire_terminals[0], terminal_id)
+		for terminal_a, terminal_b in self._junctions:
+			if id(terminal_a) in self._terminal_ids and id(terminal_b) in self._terminal_ids:
+				union(self._terminal_ids[id(terminal_a)], self._terminal_ids[id(terminal_b)])
+		roots:np.ndarray = np.array([find(terminal_id) for terminal_id in range(len(parent))], dtype=np.intp)
+		_, self._terminal_net = np.unique(roots, return_inverse=True)
+
+		self._wire_targets:np.ndarray = np.full((len(self._wires), 2, 3), np.nan)
+		self._wire_versions:np.ndarray = np.full(len(self._wires), -1)
+		self._topology_dirty = False
+
+	# Refreshes the coordinate rows of every terminal whose owner was transformed since the last resolve
+	def _refresh_coords(self:"Circuit") -> None:
+		owners:list[_CircuitElementTemplate] = [*self._elements, *self._wires]
+		versions:np.ndarray = np.fromiter((owner._points_version for owner in owners), dtype=np.int64, count=len(owners))
+		for owner_index in np.flatnonzero(versions != self._owner_versions):
+			for terminal_id in self._owner_terminals[owner_index]:
+				self._coords[terminal_id] = self._terminal_objects[terminal_id].get_center()
+		self._owner_versions = versions
+		for terminal_id in self._orphan_terminals:
+			self._coords[terminal_id] = self._terminal_objects[terminal_id].get_center()
+
+	# Whether the last resolve saw the current geometry of every member, with no element or wire transformed since
+	def _is_resolved(self:"Circuit") -> bool:
+		if self._topology_dirty:
+			return False
+		element_versions:np.ndarray = np.fromiter((element._points_version for element in self._elements), dtype=np.int64, count=len(self._elements))
+		wire_versions:np.ndarray = np.fromiter((wire._points_version for wire in self._wires), dtype=np.int64, count=len(self._wires))
+		return np.array_equal(element_versions, self._owner_versions[:len(self._elements)]) and np.array_equal(wire_versions, self._wire_versions)
+
+	# Carries the resolved state through an affine map applied to the points of every member (see batchTransform), so that the next resolve
+	# only rewrites the wires bound to terminals outside the circuit, instead of regenerating every wire the map already moved.
+	# The terminals of wires are re-read, as wires regenerated by the last resolve were moved after their rows were refreshed.
+	def _transform_resolved(self:"Circuit", matrix:np.ndarray, offset:np.ndarray) -> None:
+		self._coords = self._coords @ matrix.T + offset
+		self._wire_targets = self._wire_targets @ matrix.T + offset
+		self._owner_versions = np.concatenate((
+			np.fromiter((element._points_version for element in self._elements), dtype=np.int64, count=len(self._elements)),
+			np.full(len(self._wires), -1)))
+		self._wire_versions = np.fromiter((wire._points_version for wire in self._wires), dtype=np.int64, count=len(self._wires))
+
+	# Resolves the endpoints of every wire in the circuit in one pass, and rewrites the geometry of the wires whose endpoints moved
+	def resolve(self:"Circuit") -> "Circuit":
+		if self._topology_dirty:
+			self._build_topology()
+		if not self._wires:
+			return self
+		self._refresh_coords()
+
+		targets:np.ndarray = self._coords[self._wire_sources, np.arange(3)]
+		wire_versions:np.ndarray = np.fromiter((wire._points_version for wire in self._wires), dtype=np.int64, count=len(self._wires))
+		# Wires being animated (ex: by Create) are left as drawn, and resolved once their animation has ended and resumed their updating
+		animated:np.ndarray = np.fromiter((wire.updating_suspended for wire in self._wires), dtype=bool, count=len(self._wires))
+		changed:np.ndarray = np.flatnonzero(
+			(np.any(targets != self._wire_targets, axis=(1, 2))
+			| (wire_versions != self._wire_versions))
+			& ~animated)
+		if len(changed) == 0:
+			return self
+
+		path_points:np.ndarray = (1 - _T_VALUES) * targets[changed, 0:1] + _T_VALUES * targets[changed, 1:2]
+		for block_index, wire_index in enumerate(changed):
+			wire:Wire = self._wires[wire_index]
+			# The batched points only cover straight wires, wires with waypoints generate their own path
+			wire._apply_coordinates(targets[wire_index], path_points[block_index] if wire._waypoints is None else None)
+			self._wire_versions[wire_index] = wire._points_version
+		self._wire_targets[changed] = targets[changed]
+		return self
+
+	@property
+	def elements(self:"Circuit") -> list[_CircuitElementTemplate]:
+		return list(self._elements)
+
+	@property
+	def wires(self:"Circuit") -> list[Wire]:
+		return list(self._wires)
+
+	# Returns every wire with an endpoint bound to a terminal of the given element
+	def wires_of(self:"Circuit", element:_CircuitElementTemplate) -> list[Wire]:
+		if self._topology_dirty:
+			self._build_topology()
+		element_index:int = self._elements.index(element)
+		return [self._wires[wire_index] for wire_index in self._element_wire_indices[
+			self._element_wire_indptr[element_index]:self._element_wire_indptr[element_index + 1]]]
+
+	# Returns the index of the net the given element terminal belongs to
+	def net_of(self:"Circuit", element:_CircuitElementTemplate, terminal_name:str) -> int:
+		if self._topology_dirty:
+			self._build_topology()
+		return int(self._terminal_net[self._terminal_ids[id(element._terminals[terminal_name])]])
+
+	# Returns, for every net, the (element, terminal name) pairs of the element terminals it connects. Terminals of wires are left out.
+	@property
+	def nets(self:"Circuit") -> list[list[tuple[_CircuitElementTemplate, str]]]:
+		if self._topology_dirty:
+			self._build_topology()
+		nets:list[list[tuple[_CircuitElementTemplate, str]]] = [[] for _ in range(int(self._terminal_net.max(initial=-1)) + 1)]
+		for terminal_id, owner_index in enumerate(self._terminal_owner):
+			if 0 <= owner_index < len(self._elements):
+				nets[self._terminal_net[terminal_id]].append((self._elements[owner_index], self._terminal_names[terminal_id]))
+		return [net for net in nets if net]
@@ -0,0 +1,281 @@
+"""
+Orthogonal wire router, routing wires between element terminals with horizontal and vertical segments that go around other elements.
+The bounding boxes of the elements are kept in a uniform grid spatial index, so every route only rasterizes the obstacles inside the
+local window it is searched in. Paths are searched with A* over that window, with a penalty on bends and on running along wires routed
+before, and are returned as multi-segment Wires bound to the element terminals.
+"""
+
+import heapq
+import math
+from typing import Iterable
+import numpy as np
+from manim.constants import X_AXIS, Y_AXIS, Z_AXIS
+from manim_hkn.cElements import Wire, _CircuitElementTemplate
+from manim_hkn.utils.netlist import Circuit
+
+# Lattice steps of the four routing directions: +x, -x, +y, -y
+_DIRECTIONS:tuple[tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+# Routed wire occupancy bits: horizontal and vertical runs through a lattice point
+_HORIZONTAL:int = 1
+_VERTICAL:int = 2
+
+# Uniform grid hash of axis-aligned boxes (xmin, ymin, xmax, ymax). A box is stored in every cell it overlaps, so a query only visits the cells of the queried area.
+class SpatialIndex:
+	def __init__(self:"SpatialIndex", cell_size:float = 2.) -> None:
+		if cell_size <= 0:
+			raise ValueError(f'Invalid Cell Size: {cell_size}, the cell size must be positive.')
+		self.cell_size:float = cell_size
+		self._boxes:list[tuple[float, float, float, float]] = []
+		self._cells:dict[tuple[int, int], list[int]] = {}
+
+	def __len__(self:"SpatialIndex") -> int:
+		return len(self._boxes)
+
+	def _cell_range(self:"SpatialIndex", box:tuple[float, float, float, float]) -> tuple[range, range]:
+		return (range(math.floor(box[0] / self.cell_size), math.floor(box[2] / self.cell_size) + 1),
+				range(math.floor(box[1] / self.cell_size), math.floor(box[3] / self.cell_size) + 1))
+
+	# Stores a box and returns its id
+	def insert(self:"SpatialIndex", box:tuple[float, float, float, float]) -> int:
+		box_id:int = len(self._boxes)
+		self._boxes.append(tuple(box))
+		x_cells, y_cells = self._cell_range(box)
+		for x_cell in x_cells:
+			for y_cell in y_cells:
+				self._cells.setdefault((x_cell, y_cell), []).append(box_id)
+		return box_id
+
+	def box(self:"SpatialIndex", box_id:int) -> tuple[float, float, float, float]:
+		return self._boxes[box_id]
+
+	# Returns the ids of every stored box intersecting the given box
+	def query(self:"SpatialIndex", box:tuple[float, float, float, float]) -> list[int]:
+		candidates:set[int] = set()
+		x_cells, y_cells = self._cell_range(box)
+		for x_cell in x_cells:
+			for y_cell in y_cells:
+				candidates.update(self._cells.get((x_cell, y_cell), ()))
+		return [box_id for box_id in sorted(candidates)
+			if self._boxes[box_id][0] <= box[2] and self._boxes[box_id][2] >= box[0]
+			and self._boxes[box_id][1] <= box[3] and self._boxes[box_id][3] >= box[1]]
+
+class OrthogonalRouter:
+	def __init__(self:"OrthogonalRouter",
+			  elements:Circuit | Iterable[_CircuitElementTemplate] = (),
+			  grid_step:float = 0.25,
+			  clearance:float = 0.25,
+			  bend_penalty:float = 4.,
+			  wire_penalty:float = 3.,
+			  search_margin:int = 8,
+			  index_cell_size:float | None = None) -> None:
+		if grid_step <= 0:
+			raise ValueError(f'Invalid Grid Step: {grid_step}, the grid step must be positive.')
+		if search_margin < 1:
+			raise ValueError(f'Invalid Search Margin: {search_margin}, the search window must extend at least one grid step around the terminals.')
+		self.grid_step:float = grid_step
+		self.clearance:float = clearance
+		self.bend_penalty:float = bend_penalty
+		# Cost of running along a previously routed wire, which keeps parallel wires apart. Crossing a wire is free.
+		self.wire_penalty:float = wire_penalty
+		# Number of grid steps the search window extends past the terminals, doubled each time no route is found inside it
+		self.search_margin:int = search_margin
+
+		self.index:SpatialIndex = SpatialIndex(index_cell_size if index_cell_size is not None else 16 * grid_step)
+		self._element_boxes:dict[int, int] = {}
+		# Box (xmin, ymin, xmax, ymax) around every obstacle, bounding how far a search window needs to grow
+		self._extent:list[float] = [math.inf, math.inf, -math.inf, -math.inf]
+		# Lattice points of the wires routed so far, with the _HORIZONTAL / _VERTICAL bits of the runs through them
+		self._wire_points:dict[tuple[int, int], int] = {}
+		# Number of A* nodes expanded over every route, for benchmarking
+		self.expanded_nodes:int = 0
+
+		# Routing through a Circuit adds the routed wires to it, so they are resolved with the rest of the circuit
+		self.circuit:Circuit | None = None
+		if isinstance(elements, Circuit):
+			self.circuit = elements
+			elements = elements.elements
+		self.add_obstacles(*elements)
+
+	# Registers the bounding boxes of the given elements as obstacles. The boxes are taken from the elements' current placement, so elements should be placed before routing.
+	def add_obstacles(self:"OrthogonalRouter", *elements:_CircuitElementTemplate) -> None:
+		for element in elements:
+			if isinstance(element, Wire) or id(element) in self._element_boxes or len(element.points) == 0:
+				continue
+			mins:np.ndarray = element.points[:, :2].min(axis=0)
+			maxs:np.ndarray = element.points[:, :2].max(axis=0)
+			self._element_boxes[id(element)] = self.index.insert((mins[0], mins[1], maxs[0], maxs[1]))
+			self._extent = [min(self._extent[0], mins[0]), min(self._extent[1], mins[1]), max(self._extent[2], maxs[0]), max(self._extent[3], maxs[1])]
+
+	def _bounding_box(self:"OrthogonalRouter", element:_CircuitElementTemplate) -> tuple[float, float, float, float]:
+		if id(element) not in self._element_boxes:
+			self.add_obstacles(element)
+		if id(element) not in self._element_boxes:
+			coord:np.ndarray = element.get_center()
+			return (coord[0], coord[1], coord[0], coord[1])
+		return self.index.box(self._element_boxes[id(element)])
+
+	# Leaves the element from its terminal through the nearest side of the element's box, returning the stub of vertices up to the first lattice point clear of the element, and the direction it leaves in
+	def _escape(self:"OrthogonalRouter", element:_CircuitElementTemplate, terminal_name:str) -> tuple[list[np.ndarray], tuple[int, int], int]:
+		coord:np.ndarray = np.array(element.get_terminal_coord(terminal_name), dtype=float)
+		box:tuple[float, float, float, float] = self._bounding_box(element)
+		side_distances:tuple[float, ...] = (box[2] - coord[0], coord[0] - box[0], box[3] - coord[1], coord[1] - box[1])
+		direction:int = int(np.argmin(side_distances))
+		step:float = self.grid_step
+
+		escape:np.ndarray = coord.copy()
+		if direction == 0:
+			escape[0] = (math.floor((box[2] + self.clearance) / step) + 1) * step
+		elif direction == 1:
+			escape[0] = (math.ceil((box[0] - self.clearance) / step) - 1) * step
+		elif direction == 2:
+			escape[1] = (math.floor((box[3] + self.clearance) / step) + 1) * step
+		else:
+			escape[1] = (math.ceil((box[1] - self.clearance) / step) - 1) * step
+		lattice_point:tuple[int, int] = (round(escape[0] / step), round(escape[1] / step))
+		snapped:np.ndarray = np.array([lattice_point[0] * step, lattice_point[1] * step, coord[2]])
+		return [coord, escape, snapped], lattice_point, direction
+
+	# Rasterizes the inflated boxes of the obstacles overlapping the window into a flat blocked list, indexed by i * height + j
+	def _occupancy(self:"OrthogonalRouter", origin:tuple[int, int], width:int, height:int) -> list[bool]:
+		step:float = self.grid_step
+		window:tuple[float, ...] = (
+			origin[0] * step - self.clearance, origin[1] * step - self.clearance,
+			(origin[0] + width - 1) * step + self.clearance, (origin[1] + height - 1) * step + self.clearance)
+		blocked:np.ndarray = np.zeros((width, height), dtype=bool)
+		for box_id in self.index.query(window):
+			box:tuple[float, float, float, float] = self.index.box(box_id)
+			i_start:int = max(math.ceil((box[0] - self.clearance) / step) - origin[0], 0)
+			i_stop:int = min(math.floor((box[2] + self.clearance) / step) - origin[0] + 1, width)
+			j_start:int = max(math.ceil((box[1] - self.clearance) / step) - origin[1], 0)
+			j_stop:int = min(math.floor((box[3] + self.clearance) / step) - origin[1] + 1, height)
+			if i_start < i_stop and j_start < j_stop:
+				blocked[i_start:i_stop, j_start:j_stop] = True
+		return blocked.ravel().tolist()
+
+	# A* over the lattice window, with states of (lattice point, direction of arrival). Returns the lattice points of the path, or None if the goal cannot be reached inside the window.
+	def _search(self:"OrthogonalRouter", start:tuple[int, int], start_direction:int, goal:tuple[int, int], goal_direction:int, margin:int) -> list[tuple[int, int]] | None:
+		origin:tuple[int, int] = (min(start[0], goal[0]) - margin, min(start[1], goal[1]) - margin)
+		width:int = abs(start[0] - goal[0]) + 2 * margin + 1
+		height:int = abs(start[1] - goal[1]) + 2 * margin + 1
+		blocked:list[bool] = self._occupancy(origin, width, height)
+
+		start_node:int = (start[0] - origin[0]) * height + (start[1] - origin[1])
+		goal_node:int = (goal[0] - origin[0]) * height + (goal[1] - origin[1])
+		goal_i, goal_j = goal[0] - origin[0], goal[1] - origin[1]
+		blocked[start_node] = blocked[goal_node] = False
+		# The path should arrive at the goal heading into its terminal, opposite to the goal's escape direction
+		arrival_direction:int = goal_direction ^ 1
+		node_offsets:tuple[int, ...] = (height, -height, 1, -1)
+		wire_points:dict[tuple[int, int], int] = self._wire_points
+
+		start_state:int = start_node * 4 + start_direction
+		best_costs:dict[int, float] = {start_state: 0.}
+		came_from:dict[int, int] = {}
+		queue:list[tuple[float, float, int]] = [(abs(start[0] - goal[0]) + abs(start[1] - goal[1]), 0., start_state)]
+		expanded:int = 0
+		while queue:
+			_, cost, state = heapq.heappop(queue)
+			if cost > best_costs[state]:
+				continue
+			expanded += 1
+			node, direction = divmod(state, 4)
+			if node == goal_node:
+				self.expanded_nodes += expanded
+				path:list[tuple[int, int]] = []
+				while True:
+					path.append((state // 4 // height + origin[0], state // 4 % height + origin[1]))
+					if state not in came_from:
+						break
+					state = came_from[state]
+				return path[::-1]
+
+			i, j = divmod(node, height)
+			for next_direction in range(4):
+				# Turning back is never shorter
+				if next_direction == direction ^ 1:
+					continue
+				step_i, step_j = _DIRECTIONS[next_direction]
+				next_i, next_j = i + step_i, j + step_j
+				if not (0 <= next_i < width and 0 <= next_j < height):
+					continue
+				next_node:int = node + node_offsets[next_direction]
+				if blocked[next_node]:
+					continue
+				next_cost:float = cost + 1.
+				if next_direction != direction:
+					next_cost += self.bend_penalty
+				occupancy:int = wire_points.get((next_i + origin[0], next_j + origin[1]), 0)
+				if occupancy & (_HORIZONTAL if next_direction < 2 else _VERTICAL):
+					next_cost += self.wire_penalty
+				if next_node == goal_node and next_direction != arrival_direction:
+					next_cost += self.bend_penalty
+				next_state:int = next_node * 4 + next_direction
+				if next_cost < best_costs.get(next_state, math.inf):
+					best_costs[next_state] = next_cost
+					came_from[next_state] = state
+					heapq.heappush(queue, (next_cost + abs(next_i - goal_i) + abs(next_j - goal_j), next_cost, next_state))
+		self.expanded_nodes += expanded
+		return None
+
+	# Marks the lattice points along a routed path, so later routes avoid running along it
+	def _occupy(self:"OrthogonalRouter", path:list[tuple[int, int]]) -> None:
+		for (i, j), (next_i, next_j) in zip(path[:-1], path[1:]):
+			bit:int = _HORIZONTAL if j == next_j else _VERTICAL
+			for point in ((i, j), (next_i, next_j)):
+				self._wire_points[point] = self._wire_points.get(point, 0) | bit
+
+	# Returns the corner vertices of a path between the two terminal coordinates: collinear and repeated vertices are removed
+	@staticmethod
+	def _simplify(vertices:np.ndarray) -> np.ndarray:
+		vertices = vertices[np.concatenate(([True], np.any(np.abs(np.diff(vertices, axis=0)) > 1e-9, axis=1)))]
+		if len(vertices) < 3:
+			return vertices
+		before:np.ndarray = vertices[1:-1] - vertices[:-2]
+		after:np.ndarray = vertices[2:] - vertices[1:-1]
+		collinear:np.ndarray = np.abs(before[:, 0] * after[:, 1] - before[:, 1] * after[:, 0]) < 1e-9
+		return vertices[np.concatenate(([True], ~collinear, [True]))]
+
+	# Routes a wire from a terminal of one element to a terminal of another, returning a Wire whose ends are bound to both terminals and whose corners are fixed waypoints
+	def route(self:"OrthogonalRouter", source:_CircuitElementTemplate, source_terminal:str, dest:_CircuitElementTemplate, dest_terminal:str) -> Wire:
+		source_stub, start, start_direction = self._escape(source, source_terminal)
+		dest_stub, goal, goal_direction = self._escape(dest, dest_terminal)
+
+		margin:int = self.search_margin
+		limit:int = self._search_limit(start, goal)
+		path:list[tuple[int, int]] | None = self._search(start, start_direction, goal, goal_direction, margin)
+		while path is None and margin < limit:
+			margin *= 2
+			path = self._search(start, start_direction, goal, goal_direction, margin)
+		if path is None:
+			raise ValueError(f'No Route Found: {type(source).__name__} terminal {source_terminal} cannot be routed to {type(dest).__name__} terminal {dest_terminal}.')
+		self._occupy(path)
+
+		z:float = source_stub[0][2]
+		lattice_vertices:np.ndarray = np.array([[i * self.grid_step, j * self.grid_step, z] for i, j in path]).reshape(-1, 3)
+		vertices:np.ndarray = self._simplify(np.concatenate((source_stub, lattice_vertices, dest_stub[::-1])))
+
+		wire = Wire(waypoints=vertices[1:-1])
+		update_shape:bool = self.circuit is None
+		wire.bind_terminal('left', source, source_terminal, X_AXIS+Y_AXIS+Z_AXIS, update_shape)
+		wire.bind_terminal('right', dest, dest_terminal, X_AXIS+Y_AXIS+Z_AXIS, update_shape)
+		if self.circuit is not None:
+			self.circuit.add_wire(wire)
+		return wire
+
+	# Largest margin worth searching with: enough for the window to cover every obstacle
+	def _search_limit(self:"OrthogonalRouter", start:tuple[int, int], goal:tuple[int, int]) -> int:
+		if len(self.index) == 0:
+			return self.search_margin
+		extent:float = max(self._extent[2] - self._extent[0], self._extent[3] - self._extent[1]) + 2 * self.clearance
+		return int(extent / self.grid_step) + abs(start[0] - goal[0]) + abs(start[1] - goal[1]) + 2
+
+	# Routes every (source, source terminal, dest, dest terminal) connection, shortest first so that short nets get the direct routes. Wires are returned in the order of the connections.
+	def route_all(self:"OrthogonalRouter", connections:Iterable[tuple[_CircuitElementTemplate, str, _CircuitElementTemplate, str]]) -> list[Wire]:
+		connections = list(connections)
+		lengths:list[float] = [
+			float(np.abs(np.subtract(source.get_terminal_coord(source_terminal), dest.get_terminal_coord(dest_terminal))[:2]).sum())
+			for source, source_terminal, dest, dest_terminal in connections]
+		wires:list[Wire | None] = [None] * len(connections)
+		for index in np.argsort(lengths, kind='stable'):
+			wires[index] = self.route(*connections[index])
+		return wires
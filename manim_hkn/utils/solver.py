@@ -0,0 +1,377 @@
+"""
+Linear circuit solver by modified nodal analysis: DC operating point and fixed-step transient of R, L, C, V and I elements.
+The unknowns are the voltage of every node but ground, then the current through every voltage source, inductor and capacitor. Companion
+models (trapezoidal or backward Euler) make every time step the same sparse linear system A x[k+1] = B x[k] + S u(t[k+1]), where u holds
+the source values. A only depends on the time step, so it is factorized once with scipy's sparse LU and every step is two sparse products
+and one triangular solve. A GMIN conductance to ground on every node keeps floating nodes solvable, as in SPICE.
+Solvers are built from SPICE cards, or from the element graph of a drawn Circuit: each element terminal is a node of the net its wires
+connect it to, and the net of a Ground element is ground. Only numpy and scipy are imported, circuits are only read through their methods.
+Results are numpy arrays over the time samples, for ValueTrackers, labels and current-flow speeds.
+
+	result = CircuitSolver.from_cards(parse_spice(netlist)).transient(5e-3, 1e-6)
+	time = ValueTracker(0)
+	label.add_updater(lambda label: label.set_value(result.value_at(result.current('R1'), time.get_value())))
+	self.play(time.animate.set_value(5e-3), run_time=5, rate_func=linear)
+"""
+
+import re
+from typing import Callable, Hashable, Iterable, NamedTuple, Sequence
+import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
+from manim_hkn.utils.spiceParser import GROUND_NODES, SpiceCard, parse_spice_value
+
+# Conductance from every node to ground
+GMIN:float = 1e-12
+# Node index of ground
+GROUND:int = -1
+# Element kinds which can be simulated, and those with their current as an unknown
+SIMULATED_KINDS:tuple[str, ...] = ('R', 'C', 'L', 'V', 'I')
+_BRANCH_KINDS:tuple[str, ...] = ('V', 'L', 'C')
+INTEGRATION_METHODS:tuple[str, ...] = ('trapezoidal', 'backward_euler')
+
+class SolverElement(NamedTuple):
+	# Any hashable identifying the element in results, ex: a SPICE card name or a circuit element
+	key:Hashable
+	# One of R, C, L, V, I
+	kind:str
+	# Node indices of the two terminals, GROUND for ground. Currents are taken from the first node through the element to the second.
+	nodes:tuple[int, int]
+	# Resistance, capacitance, inductance, or the DC value of a source
+	value:float
+	# Value of a source at an array of times, None for a constant source
+	waveform:Callable[[np.ndarray], np.ndarray] | None = None
+
+# Waveform of a SPICE source specification, ex: SIN(0 1 1k), PULSE(0 5 0 1n 1n 1u 2u), PWL(0 0 1m 1), EXP(0 1 0 1m). None for a DC source.
+def source_waveform(parameters:str) -> Callable[[np.ndarray], np.ndarray] | None:
+	match:re.Match | None = re.search(r'(\w+)\(([^)]*)\)', parameters)
+	if match is None:
+		return None
+	shape:str = match.group(1).lower()
+	values:list[float] = [parse_spice_value(token) for token in re.split(r'[\s,]+', match.group(2).strip()) if token]
+	if shape == 'sin':
+		offset, amplitude, frequency, delay, damping, phase = (values + [0.] * 6)[:6]
+		def sine(times:np.ndarray) -> np.ndarray:
+			elapsed:np.ndarray = np.maximum(times - delay, 0)
+			return offset + amplitude * np.exp(-damping * elapsed) * np.sin(2 * np.pi * frequency * elapsed + np.radians(phase))
+		return sine
+	if shape == 'pulse':
+		initial, pulsed, delay, rise, fall, width, period = (values + [0.] * 7)[:7]
+		def pulse(times:np.ndarray) -> np.ndarray:
+			elapsed:np.ndarray = times - delay
+			if period > 0:
+				elapsed = np.where(elapsed >= 0, np.mod(elapsed, period), elapsed)
+			return initial + (pulsed - initial) * np.interp(elapsed, [0, rise, rise + width, rise + width + fall], [0, 1, 1, 0], left=0, right=0)
+		return pulse
+	if shape == 'pwl':
+		if len(values) < 2 or len(values) % 2:
+			raise ValueError(f'Invalid PWL Source: {parameters}.')
+		return lambda times: np.interp(times, values[0::2], values[1::2])
+	if shape == 'exp':
+		initial, pulsed, rise_delay, rise_constant, fall_delay, fall_constant = (values + [0.] * 6)[:6]
+		def exponential(times:np.ndarray) -> np.ndarray:
+			rise:np.ndarray = 1 - np.exp(-np.maximum(times - rise_delay, 0) / (rise_constant or 1.))
+			fall:np.ndarray = 1 - np.exp(-np.maximum(times - fall_delay, 0) / (fall_constant or 1.)) if fall_delay > 0 else 0.
+			return initial + (pulsed - initial) * (rise - fall)
+		return exponential
+	raise ValueError(f'Invalid Source: {parameters}.')
+
+# Result of a DC or transient analysis: every unknown at every time sample
+class SimulationResult:
+	def __init__(self:"SimulationResult", solver:"CircuitSolver", times:np.ndarray, solution:np.ndarray) -> None:
+		self.solver:"CircuitSolver" = solver
+		self.times:np.ndarray = times
+		# Shape (len(times), unknowns): node voltages, then branch currents
+		self.solution:np.ndarray = solution
+
+	@property
+	def node_voltages(self:"SimulationResult") -> np.ndarray:
+		return self.solution[:, :self.solver.node_count]
+
+	# Voltage of a node, given as its index or any of its keys (a SPICE node name, or an (element, terminal name) pair of a drawn circuit)
+	def voltage(self:"SimulationResult", node:Hashable) -> np.ndarray:
+		index:int = self.solver.node_index(node)
+		return np.zeros(len(self.times)) if index == GROUND else self.solution[:, index]
+
+	def _node_voltages(self:"SimulationResult", nodes:np.ndarray) -> np.ndarray:
+		padded:np.ndarray = np.concatenate((self.node_voltages, np.zeros((len(self.times), 1))), axis=1)
+		return padded[:, nodes]
+
+	# Voltage of an element's first node relative to its second
+	def voltage_across(self:"SimulationResult", key:Hashable) -> np.ndarray:
+		first, second = self.solver.elements[self.solver.element_index(key)].nodes
+		return self.voltage(first) - self.voltage(second)
+
+	# Current through an element, from its first node to its second
+	def current(self:"SimulationResult", key:Hashable) -> np.ndarray:
+		index:int = self.solver.element_index(key)
+		element:SolverElement = self.solver.elements[index]
+		if element.kind == 'R':
+			return self.voltage_across(key) / element.value
+		if element.kind == 'I':
+			return self.solver._source_values(element, self.times)
+		return self.solution[:, self.solver.node_count + self.solver._branch_indices[index]]
+
+	# Current through every resistor, shape (len(times), resistors), in element order
+	def resistor_currents(self:"SimulationResult") -> np.ndarray:
+		resistors:list[SolverElement] = [element for element in self.solver.elements if element.kind == 'R']
+		nodes:np.ndarray = np.array([element.nodes for element in resistors], dtype=np.intp).reshape(-1, 2)
+		voltages:np.ndarray = self._node_voltages(nodes[:, 0]) - self._node_voltages(nodes[:, 1])
+		return voltages / np.array([element.value for element in resistors])
+
+	# Linear interpolation of a result array at the given times, ex: the time of a ValueTracker
+	def value_at(self:"SimulationResult", values:np.ndarray, time:float | np.ndarray) -> float | np.ndarray:
+		return np.interp(time, self.times, values)
+
+class CircuitSolver:
+	def __init__(self:"CircuitSolver", elements:Sequence[SolverElement], node_count:int, node_keys:dict[Hashable, int] | None = None) -> None:
+		self.elements:list[SolverElement] = list(elements)
+		self.node_count:int = node_count
+		self.node_keys:dict[Hashable, int] = dict(node_keys or {})
+		self._element_indices:dict[Hashable, int] = {}
+		for index, element in enumerate(self.elements):
+			if element.kind not in SIMULATED_KINDS:
+				raise ValueError(f'Invalid Element Kind: {element.kind}.')
+			if any(not GROUND <= node < node_count for node in element.nodes):
+				raise ValueError(f'Invalid Nodes: {element.nodes}.')
+			if element.kind in 'RCL' and element.value <= 0:
+				raise ValueError(f'Invalid Value: {element.value}, {element.key} must have a positive value.')
+			self._element_indices[element.key] = index
+		# Index of every V, L and C element among the branch currents
+		branch_elements:list[int] = [index for index, element in enumerate(self.elements) if element.kind in _BRANCH_KINDS]
+		self._branch_indices:dict[int, int] = {element_index: branch for branch, element_index in enumerate(branch_elements)}
+		self.unknown_count:int = node_count + len(branch_elements)
+		self._sources:list[int] = [index for index, element in enumerate(self.elements) if element.kind in 'VI']
+		self._source_matrix:scipy.sparse.csr_array = self._build_source_matrix()
+		# LU factorizations of the system matrices, by analysis and time step
+		self._factorizations:dict[tuple, tuple[scipy.sparse.linalg.SuperLU, scipy.sparse.csr_array]] = {}
+
+	def element_index(self:"CircuitSolver", key:Hashable) -> int:
+		if key not in self._element_indices:
+			raise ValueError(f'Invalid Element: {key}.')
+		return self._element_indices[key]
+
+	def node_index(self:"CircuitSolver", node:Hashable) -> int:
+		if isinstance(node, (int, np.integer)) and GROUND <= node < self.node_count:
+			return int(node)
+		if node not in self.node_keys:
+			raise ValueError(f'Invalid Node: {node}.')
+		return self.node_keys[node]
+
+	def _source_values(self:"CircuitSolver", element:SolverElement, times:np.ndarray) -> np.ndarray:
+		if element.waveform is None:
+			return np.full(len(times), element.value, dtype=float)
+		return np.broadcast_to(np.asarray(element.waveform(times), dtype=float), (len(times),)).copy()
+
+	# Values of every source at every time, shape (len(times), sources)
+	def _source_table(self:"CircuitSolver", times:np.ndarray) -> np.ndarray:
+		if not self._sources:
+			return np.zeros((len(times), 0))
+		return np.stack([self._source_values(self.elements[index], times) for index in self._sources], axis=1).reshape(len(times), len(self._sources))
+
+	# Sparse matrix from (row, column, value) entries, dropping the entries of ground rows and columns
+	def _assemble(self:"CircuitSolver", rows:list, columns:list, values:list, shape:tuple[int, int]) -> scipy.sparse.csc_array:
+		rows, columns, values = (np.concatenate([np.ravel(part) for part in parts]) if parts else np.zeros(0) for parts in (rows, columns, values))
+		kept:np.ndarray = (rows != GROUND) & (columns != GROUND)
+		return scipy.sparse.csc_array((values[kept], (rows[kept].astype(np.intp), columns[kept].astype(np.intp))), shape=shape)
+
+	# S, mapping the source values to the right-hand side: voltage sources set their branch row, current sources leave their first node
+	def _build_source_matrix(self:"CircuitSolver") -> scipy.sparse.csr_array:
+		rows:list = []
+		columns:list = []
+		values:list = []
+		for column, index in enumerate(self._sources):
+			element:SolverElement = self.elements[index]
+			if element.kind == 'V':
+				rows.append([self.node_count + self._branch_indices[index]])
+				columns.append([column])
+				values.append([1.])
+			else:
+				rows.append(list(element.nodes))
+				columns.append([column, column])
+				values.append([-1., 1.])
+		return self._assemble(rows, columns, values, (self.unknown_count, len(self._sources))).tocsr()
+
+	# A and B of the time step, or A of the DC operating point when time_step is None (B is then zero)
+	def _build_matrices(self:"CircuitSolver", time_step:float | None, method:str) -> tuple[scipy.sparse.csc_array, scipy.sparse.csr_array]:
+		a_rows:list = [np.arange(self.node_count)]
+		a_columns:list = [np.arange(self.node_count)]
+		a_values:list = [np.full(self.node_count, GMIN)]
+		b_rows:list = []
+		b_columns:list = []
+		b_values:list = []
+		# Companion model factor: 2 / h for the trapezoidal rule, 1 / h for backward Euler
+		factor:float = 0. if time_step is None else (2. if method == 'trapezoidal' else 1.) / time_step
+		trapezoidal:float = 1. if method == 'trapezoidal' else 0.
+		for index, element in enumerate(self.elements):
+			first, second = element.nodes
+			if element.kind == 'R':
+				conductance:float = 1 / element.value
+				a_rows.append([first, second, first, second])
+				a_columns.append([first, second, second, first])
+				a_values.append([conductance, conductance, -conductance, -conductance])
+				continue
+			if element.kind == 'I':
+				continue
+			branch:int = self.node_count + self._branch_indices[index]
+			# The branch current leaves the first node and enters the second
+			a_rows.append([first, second])
+			a_columns.append([branch, branch])
+			a_values.append([1., -1.])
+			if element.kind == 'V' or (element.kind == 'L' and time_step is None):
+				a_rows.append([branch, branch])
+				a_columns.append([first, second])
+				a_values.append([1., -1.])
+			elif element.kind == 'C' and time_step is None:
+				a_rows.append([branch])
+				a_columns.append([branch])
+				a_values.append([1.])
+			elif element.kind == 'L':
+				# v[k+1] - f L i[k+1] = -f L i[k] - v[k] (trapezoidal only)
+				a_rows.append([branch, branch, branch])
+				a_columns.append([first, second, branch])
+				a_values.append([1., -1., -factor * element.value])
+				b_rows.append([branch, branch, branch])
+				b_columns.append([first, second, branch])
+				b_values.append([-trapezoidal, trapezoidal, -factor * element.value])
+			else:
+				# i[k+1] - f C v[k+1] = -f C v[k] - i[k] (trapezoidal only)
+				admittance:float = factor * element.value
+				a_rows.append([branch, branch, branch])
+				a_columns.append([branch, first, second])
+				a_values.append([1., -admittance, admittance])
+				b_rows.append([branch, branch, branch])
+				b_columns.append([branch, first, second])
+				b_values.append([-trapezoidal, -admittance, admittance])
+		shape:tuple[int, int] = (self.unknown_count, self.unknown_count)
+		return self._assemble(a_rows, a_columns, a_values, shape), self._assemble(b_rows, b_columns, b_values, shape).tocsr()
+
+	# Factorization of A, computed once per analysis and time step
+	def _factorization(self:"CircuitSolver", time_step:float | None, method:str) -> tuple[scipy.sparse.linalg.SuperLU, scipy.sparse.csr_array]:
+		key:tuple = (time_step, method if time_step is not None else None)
+		if key not in self._factorizations:
+			matrix, history_matrix = self._build_matrices(time_step, method)
+			try:
+				self._factorizations[key] = (scipy.sparse.linalg.splu(matrix), history_matrix)
+			except RuntimeError as error:
+				raise ValueError(f'Invalid Circuit: the system matrix is singular ({error}), ex: a loop of voltage sources and inductors.') from None
+		return self._factorizations[key]
+
+	# DC operating point with the sources at the given time: capacitors are open, inductors are shorted
+	def dc(self:"CircuitSolver", time:float = 0.) -> SimulationResult:
+		times:np.ndarray = np.array([float(time)])
+		lu, _ = self._factorization(None, 'trapezoidal')
+		solution:np.ndarray = lu.solve(self._source_matrix @ self._source_table(times)[0])
+		return SimulationResult(self, times, solution[None, :])
+
+	# Fixed-step transient from t = 0 to stop_time. The initial state is the DC operating point at t = 0, or all zeros.
+	# Every record_every-th step is kept in the result, to bound its memory on long runs.
+	def transient(self:"CircuitSolver",
+			   stop_time:float,
+			   time_step:float,
+			   method:str = 'trapezoidal',
+			   initial:str = 'dc',
+			   record_every:int = 1) -> SimulationResult:
+		if method not in INTEGRATION_METHODS:
+			raise ValueError(f'Invalid Method: {method}.')
+		if initial not in ('dc', 'zero'):
+			raise ValueError(f'Invalid Initial State: {initial}.')
+		if time_step <= 0 or stop_time < 0:
+			raise ValueError(f'Invalid Time Step: {time_step}, for a stop time of {stop_time}.')
+		if record_every < 1:
+			raise ValueError(f'Invalid Record Interval: {record_every}.')
+		steps:int = int(round(stop_time / time_step))
+		times:np.ndarray = np.arange(steps + 1) * time_step
+		sources:np.ndarray = self._source_table(times)
+		source_terms:np.ndarray = (self._source_matrix @ sources.T).T
+		lu, history_matrix = self._factorization(time_step, method)
+
+		state:np.ndarray = self.dc(0.).solution[0] if initial == 'dc' else np.zeros(self.unknown_count)
+		recorded:np.ndarray = np.arange(0, steps + 1, record_every)
+		solution:np.ndarray = np.empty((len(recorded), self.unknown_count))
+		solution[0] = state
+		for step in range(1, steps + 1):
+			state = lu.solve(history_matrix @ state + source_terms[step])
+			if step % record_every == 0:
+				solution[step // record_every] = state
+		return SimulationResult(self, times[recorded], solution)
+
+	# Solver of SPICE cards (R, C, L, V, I), with the node names as node keys
+	@classmethod
+	def from_cards(cls:type["CircuitSolver"], cards:Iterable[SpiceCard]) -> "CircuitSolver":
+		node_keys:dict[Hashable, int] = {}
+		elements:list[SolverElement] = []
+		for card in cards:
+			if card.kind not in SIMULATED_KINDS:
+				raise ValueError(f'Line {card.line_number}: element {card.name} cannot be simulated.')
+			nodes:list[int] = []
+			for node in card.nodes:
+				if node.lower() in GROUND_NODES:
+					nodes.append(GROUND)
+				else:
+					nodes.append(node_keys.setdefault(node, len(node_keys)))
+			waveform:Callable | None = source_waveform(card.parameters) if card.kind in 'VI' else None
+			value:float = card.value if card.value is not None else float(waveform(np.zeros(1))[0])
+			elements.append(SolverElement(card.name, card.kind, tuple(nodes), value, waveform))
+		return cls(elements, len(node_keys), node_keys)
+
+	# Solver of a drawn Circuit: the nodes are the nets its wires form, and the net of any Ground element is ground.
+	# values gives, for every circuit element to simulate, its value, or for sources a function of an array of times.
+	@classmethod
+	def from_circuit(cls:type["CircuitSolver"], circuit, values:dict) -> "CircuitSolver":
+		# Imported here, so that this module does not import manim
+		from manim_hkn.cElements import Ground
+		nets:dict[int, int] = {}
+		ground_nets:set[int] = {circuit.net_of(element, 'ground') for element in circuit.elements if isinstance(element, Ground)}
+		if not ground_nets:
+			raise ValueError('Invalid Circuit: it has no Ground element.')
+		node_keys:dict[Hashable, int] = {}
+		elements:list[SolverElement] = []
+
+		def node(element, terminal_name:str) -> int:
+			net:int = circuit.net_of(element, terminal_name)
+			index:int = GROUND if net in ground_nets else nets.setdefault(net, len(nets))
+			node_keys[(element, terminal_name)] = index
+			return index
+
+		for element, value in values.items():
+			kind, terminal_names = _element_kind(element)
+			nodes:tuple[int, int] = tuple(node(element, terminal_name) for terminal_name in terminal_names)
+			if callable(value):
+				elements.append(SolverElement(element, kind, nodes, float(np.asarray(value(np.zeros(1))).ravel()[0]), value))
+			else:
+				elements.append(SolverElement(element, kind, nodes, float(value)))
+		return cls(elements, len(nets), node_keys)
+
+	# Solver of a circuit imported from a SPICE netlist, read from its drawn element graph. Element keys are the card names, and node keys
+	# are the SPICE node names as well as the (element, terminal name) pairs.
+	@classmethod
+	def from_spice_circuit(cls:type["CircuitSolver"], circuit) -> "CircuitSolver":
+		values:dict = {}
+		for name, card in circuit.cards.items():
+			if card.kind not in SIMULATED_KINDS:
+				raise ValueError(f'Line {card.line_number}: element {name} cannot be simulated.')
+			waveform:Callable | None = source_waveform(card.parameters) if card.kind in 'VI' else None
+			values[circuit.components[name]] = waveform if waveform is not None else card.value
+		solver:CircuitSolver = cls.from_circuit(circuit, values)
+		names:dict[int, str] = {id(component): name for name, component in circuit.components.items()}
+		solver.elements = [element._replace(key=names[id(element.key)]) for element in solver.elements]
+		solver._element_indices = {element.key: index for index, element in enumerate(solver.elements)}
+		for name, card in circuit.cards.items():
+			for node_name, terminal_name in zip(card.nodes, circuit.component_terminals[name]):
+				solver.node_keys[node_name] = solver.node_keys[(circuit.components[name], terminal_name)]
+		return solver
+
+# Element kind of a circuit element, and its terminal names in the order of the SPICE nodes, as drawn by the SPICE importer
+def _element_kind(element) -> tuple[str, tuple[str, str]]:
+	from manim_hkn.cElements import Resistor, Capacitor, Inductor, Battery, FunctionGenerator, CurrentSource
+	for element_class, kind, terminal_names in (
+			(Resistor, 'R', ('left', 'right')),
+			(Capacitor, 'C', ('left', 'right')),
+			(Inductor, 'L', ('left', 'right')),
+			(Battery, 'V', ('positive', 'negative')),
+			(FunctionGenerator, 'V', ('left', 'right')),
+			(CurrentSource, 'I', ('bottom', 'top'))):
+		if isinstance(element, element_class):
+			return kind, terminal_names
+	raise ValueError(f'Invalid Element: {type(element).__name__} cannot be simulated.')
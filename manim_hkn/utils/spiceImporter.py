@@ -0,0 +1,109 @@
+"""
+Importer building a laid-out Circuit of circuit elements and wires from a SPICE netlist.
+Supported element cards: R, C, L, V, I, Q (NPN) and X instances with 3 or 5 nodes, taken to be op-amps. Node 0 (or GND) is the ground net,
+drawn as a single Ground element. Netlists are parsed as a stream of cards by manim_hkn.utils.spiceParser, elements are constructed from the shared geometry cache, and
+every net is wired before all wire endpoints are resolved in a single Circuit pass.
+"""
+
+import math
+import os
+import time
+from typing import Iterable
+import numpy as np
+from manim_hkn.cElements import _CircuitElementTemplate, Resistor, Capacitor, Inductor, Battery, FunctionGenerator, CurrentSource, BJT_NPN, OpAmp, Ground
+from manim_hkn.utils.netlist import Circuit
+# Parser names re-exported for compatibility, they used to be defined here
+from manim_hkn.utils.spiceParser import GROUND_NODES, SpiceCard, parse_spice_value, parse_spice
+
+# Source specifications drawn as a FunctionGenerator rather than a Battery
+TIME_VARYING_SOURCES:tuple[str, ...] = ('sin', 'pulse', 'pwl', 'exp', 'sffm')
+
+# Circuit imported from a SPICE netlist, keeping the parsed cards and the element built for each of them
+class SpiceCircuit(Circuit):
+	def __init__(self:"SpiceCircuit", **kwargs) -> None:
+		self.cards:dict[str, SpiceCard] = {}
+		self.components:dict[str, _CircuitElementTemplate] = {}
+		# Terminal names of every component, in the order of its card's nodes
+		self.component_terminals:dict[str, tuple[str, ...]] = {}
+		self.ground:Ground | None = None
+		self.timings:dict[str, float] = {}
+		super().__init__(**kwargs)
+
+# Builds the element drawn for a card, and the element terminal names matching the card's nodes
+def _build_element(card:SpiceCard) -> tuple[_CircuitElementTemplate, tuple[str, ...]]:
+	if card.kind == 'R':
+		return Resistor(), ('left', 'right')
+	if card.kind == 'C':
+		return Capacitor(), ('left', 'right')
+	if card.kind == 'L':
+		return Inductor(), ('left', 'right')
+	if card.kind == 'V':
+		if card.parameters.lower().startswith(TIME_VARYING_SOURCES):
+			return FunctionGenerator(), ('left', 'right')
+		return Battery(), ('positive', 'negative')
+	if card.kind == 'I':
+		# SPICE current flows from n+ through the source to n-, so the arrow points at n-
+		return CurrentSource(), ('bottom', 'top')
+	if card.kind == 'Q':
+		return BJT_NPN(), ('collector', 'gate', 'emitter')
+	if len(card.nodes) == 5:
+		return OpAmp(include_bias_terminals=True), ('non-inverting input', 'inverting input', 'V+', 'V-', 'output')
+	return OpAmp(), ('non-inverting input', 'inverting input', 'output')
+
+# Builds a SpiceCircuit from parsed cards, placing the elements on a grid with the given spacing and wiring every net
+def build_spice_circuit(cards:Iterable[SpiceCard], spacing:float = 7.0) -> SpiceCircuit:
+	circuit = SpiceCircuit()
+	construct_start:float = time.perf_counter()
+	elements:list[_CircuitElementTemplate] = []
+	net_terminals:dict[str, list[tuple[_CircuitElementTemplate, str]]] = {}
+	for card in cards:
+		if card.name in circuit.cards:
+			raise ValueError(f'Line {card.line_number}: duplicate element name {card.name}.')
+		element, terminal_names = _build_element(card)
+		circuit.cards[card.name] = card
+		circuit.components[card.name] = element
+		circuit.component_terminals[card.name] = terminal_names
+		elements.append(element)
+		for node, terminal_name in zip(card.nodes, terminal_names):
+			node = '0' if node.lower() in GROUND_NODES else node
+			net_terminals.setdefault(node, []).append((element, terminal_name))
+
+	# Grid placement, row by row, with every element centered in its cell
+	columns:int = max(1, math.ceil(math.sqrt(len(elements))))
+	for index, element in enumerate(elements):
+		element.shift(np.array([(index % columns) * spacing, -(index // columns) * spacing, 0]) - element.get_center())
+	if '0' in net_terminals:
+		circuit.ground = Ground()
+		rows:int = math.ceil(len(elements) / columns)
+		circuit.ground.shift(np.array([(columns - 1) * spacing / 2, -rows * spacing, 0]) - circuit.ground.get_terminal_coord('ground'))
+		net_terminals['0'].append((circuit.ground, 'ground'))
+		elements.append(circuit.ground)
+	circuit.add_elements(*elements)
+	circuit.timings['construct'] = time.perf_counter() - construct_start
+
+	# Every net is drawn as a chain of square wires through its terminals, ordered left to right
+	connect_start:float = time.perf_counter()
+	for terminals in net_terminals.values():
+		if len(terminals) < 2:
+			continue
+		coords:np.ndarray = np.array([element.get_terminal_coord(terminal_name) for element, terminal_name in terminals])
+		order:np.ndarray = np.lexsort((coords[:, 1], coords[:, 0]))
+		for previous, current in zip(order[:-1], order[1:]):
+			circuit.connect_with_square_wire(*terminals[previous], *terminals[current])
+	circuit.timings['connect'] = time.perf_counter() - connect_start
+
+	resolve_start:float = time.perf_counter()
+	circuit.resolve()
+	circuit.timings['resolve'] = time.perf_counter() - resolve_start
+	return circuit
+
+# Parses and builds a SPICE netlist in one call. The returned circuit reports parse and build timings in its timings dictionary.
+def import_spice(source:str | os.PathLike | Iterable[str], has_title:bool = True, spacing:float = 7.0) -> SpiceCircuit:
+	parse_start:float = time.perf_counter()
+	cards:list[SpiceCard] = list(parse_spice(source, has_title))
+	parse_time:float = time.perf_counter() - parse_start
+
+	circuit:SpiceCircuit = build_spice_circuit(cards, spacing)
+	circuit.timings['parse'] = parse_time
+	circuit.timings['total'] = parse_time + sum(circuit.timings[stage] for stage in ('construct', 'connect', 'resolve'))
+	return circuit
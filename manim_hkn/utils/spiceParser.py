@@ -0,0 +1,143 @@
+"""
+Parser of SPICE netlists into a stream of cards, independent of manim.
+Kept apart from the importer, which draws the parsed cards, so that netlists can be read and checked without importing manim.
+"""
+
+import os
+import re
+from typing import Iterable, Iterator, NamedTuple
+
+GROUND_NODES:frozenset[str] = frozenset(('0', 'gnd'))
+
+# Multipliers of the SPICE value suffixes. 'meg' is matched before 'm' (milli).
+_SPICE_SUFFIXES:tuple[tuple[str, float], ...] = (
+	('meg', 1e6),
+	('mil', 25.4e-6),
+	('t', 1e12),
+	('g', 1e9),
+	('k', 1e3),
+	('m', 1e-3),
+	('u', 1e-6),
+	('n', 1e-9),
+	('p', 1e-12),
+	('f', 1e-15)
+)
+
+class SpiceCard(NamedTuple):
+	name:str
+	kind:str
+	nodes:tuple[str, ...]
+	# Numeric value of R, C, L cards and of DC sources, None for time-varying sources
+	value:float | None
+	# Remaining tokens of the card, such as a model name or a source specification like SIN(0 1 1k)
+	parameters:str
+	line_number:int
+
+# Parses a SPICE number with an optional scale suffix and trailing unit, ex: 4.7k, 10uF, 2meg, 1e-3
+def parse_spice_value(token:str) -> float:
+	token = token.strip().lower()
+	number_end:int = len(token)
+	while number_end > 0:
+		try:
+			number:float = float(token[:number_end])
+			break
+		except ValueError:
+			number_end -= 1
+	else:
+		raise ValueError(f'Invalid SPICE Value: {token}.')
+	suffix:str = token[number_end:]
+	for suffix_name, multiplier in _SPICE_SUFFIXES:
+		if suffix.startswith(suffix_name):
+			return number * multiplier
+	return number
+
+def _read_lines(source:str | os.PathLike | Iterable[str]) -> Iterator[str]:
+	if isinstance(source, os.PathLike) or (isinstance(source, str) and '\n' not in source and os.path.isfile(source)):
+		with open(source) as netlist_file:
+			yield from netlist_file
+	elif isinstance(source, str):
+		yield from source.splitlines()
+	else:
+		yield from source
+
+# Joins continuation lines (starting with +) and strips comments, yielding (line number, logical line) pairs
+def _logical_lines(source:str | os.PathLike | Iterable[str], has_title:bool) -> Iterator[tuple[int, str]]:
+	pending:str | None = None
+	pending_line_number:int = 0
+	for line_number, line in enumerate(_read_lines(source), start=1):
+		if has_title and line_number == 1:
+			continue
+		for comment_marker in (';', '$ '):
+			line = line.split(comment_marker, 1)[0]
+		line = line.strip()
+		if not line or line.startswith('*'):
+			continue
+		if line.startswith('+'):
+			if pending is None:
+				raise ValueError(f'Line {line_number}: continuation line without a preceding card.')
+			pending += ' ' + line[1:]
+			continue
+		if pending is not None:
+			yield pending_line_number, pending
+		pending, pending_line_number = line, line_number
+	if pending is not None:
+		yield pending_line_number, pending
+
+# Number of nodes taken by each supported element letter
+_NODE_COUNTS:dict[str, int] = {'R': 2, 'C': 2, 'L': 2, 'V': 2, 'I': 2, 'Q': 3}
+
+# Streams the element cards of a SPICE netlist. The source can be a path, the netlist text, or an iterable of lines.
+def parse_spice(source:str | os.PathLike | Iterable[str], has_title:bool = True) -> Iterator[SpiceCard]:
+	in_subcircuit:bool = False
+	for line_number, line in _logical_lines(source, has_title):
+		# Parenthesized source specifications are kept together as one token
+		tokens:list[str] = line.replace('(', ' ( ').replace(')', ' ) ').replace('=', ' = ').split()
+		keyword:str = tokens[0].lower()
+		if keyword.startswith('.'):
+			if keyword == '.subckt':
+				in_subcircuit = True
+			elif keyword == '.ends':
+				in_subcircuit = False
+			elif keyword == '.end':
+				return
+			continue
+		if in_subcircuit:
+			continue
+
+		name:str = tokens[0]
+		kind:str = name[0].upper()
+		if kind == 'X':
+			# X<name> <nodes...> <subcircuit name>
+			nodes:tuple[str, ...] = tuple(tokens[1:-1])
+			parameters:str = tokens[-1]
+			if len(nodes) not in (3, 5):
+				raise ValueError(f'Line {line_number}: subcircuit instance {name} must have 3 or 5 nodes to be drawn as an op-amp.')
+			yield SpiceCard(name, kind, nodes, None, parameters, line_number)
+			continue
+		if kind not in _NODE_COUNTS:
+			raise ValueError(f'Line {line_number}: unsupported SPICE element {name}.')
+
+		node_count:int = _NODE_COUNTS[kind]
+		if len(tokens) < 1 + node_count:
+			raise ValueError(f'Line {line_number}: element {name} requires {node_count} nodes.')
+		nodes = tuple(tokens[1:1 + node_count])
+		rest:list[str] = tokens[1 + node_count:]
+		value:float | None = None
+		if kind in 'RCL':
+			if not rest:
+				raise ValueError(f'Line {line_number}: element {name} has no value.')
+			value = parse_spice_value(rest[0])
+			rest = rest[1:]
+		elif kind in 'VI':
+			if rest and rest[0].lower() == 'dc':
+				rest = rest[1:]
+			if rest and rest[0] != '(' and (len(rest) == 1 or rest[1] != '('):
+				try:
+					value = parse_spice_value(rest[0])
+					rest = rest[1:]
+				except ValueError:
+					pass
+			if not rest and value is None:
+				value = 0.
+		parameters = re.sub(r'\s*\)', ')', re.sub(r'\s*\(\s*', '(', ' '.join(rest)))
+		yield SpiceCard(name, kind, nodes, value, parameters, line_number)